@@ -0,0 +1,125 @@
+"""Benchmark for chapter model memory (``mangadex_downloader/chapter.py``)
+
+Parse a synthetic chapter feed and report memory retained by :class:`Chapter` objects.
+Times include tracemalloc overhead.
+
+Usage: python benchmarks/bench_chapter.py [--chapters N] [--groups N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mangadex_downloader.chapter import Chapter  # noqa: E402
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+
+def _chapter_data(i, groups):
+    """Chapter data from MangaDex API ``/manga/{id}/feed``"""
+    group = i % groups
+    return {
+        "id": f"{i:08d}-aaaa-bbbb-cccc-dddddddddddd",
+        "type": "chapter",
+        "attributes": {
+            "volume": str(i // 10),
+            "chapter": str(i),
+            "title": f"Title {i}",
+            "translatedLanguage": "en",
+            "externalUrl": None,
+            "publishAt": "2020-01-01T00:00:00+00:00",
+            "readableAt": "2020-01-01T00:00:00+00:00",
+            "createdAt": "2020-01-01T00:00:00+00:00",
+            "updatedAt": "2020-01-01T00:00:00+00:00",
+            "pages": 20,
+            "version": 1,
+        },
+        "relationships": [
+            {
+                "id": f"group-{group}",
+                "type": "scanlation_group",
+                "attributes": {
+                    "name": f"Group {group}",
+                    "altNames": [],
+                    "locked": False,
+                    "website": None,
+                    "description": "x" * 200,
+                    "focusedLanguages": ["en"],
+                    "official": False,
+                    "verified": False,
+                    "inactive": False,
+                    "createdAt": "",
+                    "updatedAt": "",
+                    "version": 1,
+                },
+            },
+            {"id": "manga-1", "type": "manga", "attributes": {"title": {"en": "Manga"}}},
+            {
+                "id": f"user-{group}",
+                "type": "user",
+                "attributes": {
+                    "username": f"user{group}",
+                    "roles": ["ROLE_MEMBER"],
+                    "version": 1,
+                },
+            },
+        ],
+    }
+
+
+def _max_rss():
+    if resource is None:
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes in macOS, kilobytes in Linux
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chapters", type=int, default=30000)
+    parser.add_argument("--groups", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{args.chapters} chapters, {args.groups} groups")
+
+    rss_before = _max_rss()
+    tracemalloc.start()
+
+    # Data from API is freed after parsing, like the real feed (it's iterated lazily)
+    start = time.perf_counter()
+    chapters = [
+        Chapter.from_data(_chapter_data(i, args.groups)) for i in range(args.chapters)
+    ]
+    print(f"parse: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    for chap in chapters:
+        for _ in range(3):
+            chap.get_name()
+            chap.get_simplified_name()
+    print(f"get_name (3 times per chapter): {time.perf_counter() - start:.3f}s")
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"retained: {current / 1e6:.1f}MB, peak: {peak / 1e6:.1f}MB")
+
+    rss_after = _max_rss()
+    if rss_after is not None:
+        print(f"max RSS: {rss_after / 1e6:.1f}MB (+{(rss_after - rss_before) / 1e6:.1f}MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark for chapter filters (``IteratorChapter`` in ``mangadex_downloader/chapter.py``)
+
+Usage: python benchmarks/bench_iterator_chapter.py [--chapters N] [--groups N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mangadex_downloader.chapter import Chapter, IteratorChapter  # noqa: E402
+
+from bench_chapter import _chapter_data  # noqa: E402
+
+Manga = namedtuple("Manga", "id title")
+
+
+def _timeit(name, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{name}: {time.perf_counter() - start:.3f}s")
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chapters", type=int, default=50000)
+    parser.add_argument("--groups", type=int, default=20)
+    args = parser.parse_args()
+
+    manga = Manga("manga-1", "Manga")
+    chapters = [
+        Chapter.from_data(_chapter_data(i, args.groups)) for i in range(args.chapters)
+    ]
+
+    print(f"{len(chapters)} chapters")
+
+    def run(**kwargs):
+        iterator = IteratorChapter(chapters, manga, "en", **kwargs)
+        return sum(1 for _ in iterator)
+
+    total = _timeit("no filters (duplicates only)", run)
+    print(f"{total} chapters matched")
+
+    total = _timeit(
+        "--start-volume, --end-volume",
+        lambda: run(start_volume=10, end_volume=4000),
+    )
+    print(f"{total} chapters matched")
+
+    total = _timeit(
+        "--start-chapter, --end-chapter, --no-oneshot-chapter",
+        lambda: run(start_chapter=100, end_chapter=40000, no_oneshot=True),
+    )
+    print(f"{total} chapters matched")
+
+    total = _timeit("--range", lambda: run(_range="100-40000,!550"))
+    print(f"{total} chapters matched")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark for range pattern (``mangadex_downloader/range.py``)
+
+Usage: python benchmarks/bench_range.py [--intervals N] [--chapters N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import namedtuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mangadex_downloader.range import RangeChecker  # noqa: E402
+
+Chapter = namedtuple("Chapter", "chapter oneshot", defaults=(False,))
+
+
+def _timeit(name, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{name}: {time.perf_counter() - start:.3f}s")
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--intervals", type=int, default=50000)
+    parser.add_argument("--chapters", type=int, default=150000)
+    args = parser.parse_args()
+
+    # Chapters "0-1,3-4,6-7,..." with some pages and ignored chapters
+    entries = []
+    for i in range(args.intervals):
+        entries.append(f"{i * 3}-{i * 3 + 1}")
+
+        if i % 100 == 0:
+            entries.append(f"{i * 3 + 2}[1-10,!5]")
+        elif i % 100 == 50:
+            entries.append(f"!{i * 3}")
+
+    pattern = ",".join(entries)
+    chapters = [Chapter(str(i)) for i in range(args.chapters)]
+
+    print(f"{len(entries)} patterns, {len(chapters)} chapters")
+
+    checker = _timeit("compile", lambda: RangeChecker(pattern))
+    total = _timeit(
+        "check_chapter",
+        lambda: sum(checker.check_chapter(chap) for chap in chapters),
+    )
+    _timeit(
+        "check_page (20 pages)",
+        lambda: sum(
+            checker.check_page(chap, page) for chap in chapters for page in range(1, 21)
+        ),
+    )
+
+    print(f"{total} chapters matched")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import itertools
 import logging
-import queue
+import sys
 from pathvalidate import sanitize_filename
-from typing import List
+from typing import Iterable
 
+from . import range as range_mod
 from .user import User
 from .language import Language
 from .fetcher import (
@@ -49,10 +51,12 @@ class ChapterImages:
         start_page=None,
         end_page=None,
         _range=None,
+        data_saver=None,
+        force_https=None,
     ) -> None:
         self.chap = chapter
         self.id = chapter.id
-        self.data_saver = config.use_compressed_image
+        self.data_saver = config.use_compressed_image if data_saver is None else data_saver
         self._images = []
         self._low_images = []
         self._data = None
@@ -61,7 +65,7 @@ class ChapterImages:
         self.start_page = start_page
         self.end_page = end_page
         self.range = _range
-        self.force_https = config.force_https
+        self.force_https = config.force_https if force_https is None else force_https
 
         self.legacy_range = start_page or end_page
 
@@ -145,6 +149,33 @@ class AggregateChapter:
 
 
 class Chapter:
+    # Chapter feeds can have tens of thousands of chapters,
+    # keep only the data that is needed and use __slots__ to save memory
+    __slots__ = (
+        "id",
+        "volume",
+        "chapter",
+        "title",
+        "pages",
+        "user",
+        "groups",
+        "groups_id",
+        "manga_id",
+        "manga_title",
+        "oneshot",
+        "use_group_name",
+        "use_chapter_title",
+        "_lang",
+        "_name",
+        "_simpl_name",
+        "_groups_name",
+        "_full_name",
+        "_full_simpl_name",
+        "_key",
+        "_chapter_num",
+        "_volume_num",
+    )
+
     def __init__(
         self,
         _id=None,
@@ -157,7 +188,7 @@ class Chapter:
             data = get_chapter(_id)["data"]
 
         self.id = data["id"]
-        self.attr = data["attributes"]
+        attr = data["attributes"]
 
         # Get scanlation groups and manga
         rels = data["relationships"]
@@ -170,28 +201,44 @@ class Chapter:
             rel_id = rel["id"]
             rel_type = rel["type"]
             if rel_type == "scanlation_group":
-                groups.append(Group(data=rel))
+                groups.append(Group.from_data(rel))
             elif rel_type == "manga":
                 manga_id = rel_id
                 manga_title = get_local_attr(rel["attributes"]["title"])
             elif rel_type == "user":
-                user = User(data=rel)
+                user = User.from_data(rel)
 
         if manga_id is None:
             raise RuntimeError(f"chapter {_id} has no manga relationship")
 
+        self.volume = self._parse_volume(attr["volume"])
+        self.chapter = attr["chapter"].strip() if attr["chapter"] is not None else None
+        self.title = attr["title"]
+        self.pages = attr["pages"]
+
+        # Used by IteratorChapter filters for every chapter, parse them only once
+        self._key = f"{self.volume}:{self.chapter}"
+        self._chapter_num = self._parse_number(self.chapter)
+        self._volume_num = self._parse_number(self.volume)
+
         self.user = user
         self.groups = groups
         self.groups_id = [group.id for group in groups]
-        self.manga_id = manga_id
-        self.manga_title = manga_title
+
+        # Same manga for all chapters in a feed, share the strings
+        self.manga_id = sys.intern(manga_id)
+        self.manga_title = sys.intern(manga_title) if manga_title else manga_title
+
         self._name = None
         self._simpl_name = None
+        self._groups_name = None
+        self._full_name = None
+        self._full_simpl_name = None
         self.oneshot = False
         self.use_group_name = not config.no_group_name
         self.use_chapter_title = config.use_chapter_title
 
-        self._lang = Language(self.attr["translatedLanguage"])
+        self._lang = Language(attr["translatedLanguage"])
 
         self._parse_name()
 
@@ -201,9 +248,19 @@ class Chapter:
     def from_data(cls, data):
         return cls(data=data)
 
-    @property
-    def volume(self):
-        vol = self.attr["volume"]
+    @staticmethod
+    def _parse_number(value):
+        """Return ``float`` of chapter or volume number, or ``None`` if it's not a number"""
+        if value is None:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_volume(vol):
         if vol is not None:
             # As far as i know
             # Volume manga are integer numbers, not float
@@ -223,22 +280,6 @@ class Chapter:
     def __str__(self) -> str:
         return f"'{self.manga_title}' {self.name}"
 
-    @property
-    def chapter(self):
-        try:
-            return self.attr["chapter"].strip()
-        except AttributeError:
-            # null value
-            return None
-
-    @property
-    def title(self):
-        return self.attr["title"]
-
-    @property
-    def pages(self):
-        return self.attr["pages"]
-
     @property
     def language(self):
         return self._lang
@@ -298,27 +339,31 @@ class Chapter:
 
     def get_name(self):
         """This will return chapter name with group name and title"""
-        return self._make_name(self._name)
+        if self._full_name is None:
+            self._full_name = self._make_name(self._name)
+
+        return self._full_name
 
     def get_simplified_name(self):
         """Return simplified name of :meth:`Chapter.get_name()`"""
-        return self._make_name(self._simpl_name)
+        if self._full_simpl_name is None:
+            self._full_simpl_name = self._make_name(self._simpl_name)
+
+        return self._full_simpl_name
 
     @property
     def groups_name(self):
+        if self._groups_name is not None:
+            return self._groups_name
+
         if not self.groups and self.user:
-            return f"User - {self.user.name}"
+            name = f"User - {self.user.name}"
         elif not self.user:
-            return "User is not specified"
-
-        groups = self.groups.copy()
-
-        first_group = groups.pop(0)
-        name = first_group.name
-
-        for group in groups:
-            name += f" & {group.name}"
+            name = "User is not specified"
+        else:
+            name = " & ".join(group.name for group in self.groups)
 
+        self._groups_name = name
         return name
 
 
@@ -389,10 +434,9 @@ class IteratorChapter:
                 "_range and (start_* or end_* or no_oneshot) cannot be together"
             )
 
-        self.chapters: List[Chapter] = chapters
+        self.chapters: Iterable[Chapter] = chapters
         self.manga = manga
         self.language = Language(lang)
-        self.queue = queue.Queue()
         self.start_chapter = start_chapter
         self.end_chapter = end_chapter
         self.start_page = start_page
@@ -405,14 +449,24 @@ class IteratorChapter:
         self.legacy_range = legacy_range
         self.duplicates = {}
 
-        # Convert the numbers if it's negative
-        self.start_chapter, self.end_chapter = convert_start_end_from_negative(
-            self.start_chapter, self.end_chapter, [i.chapter for i in self.chapters]
+        # Negative chapter numbers and sorting by chapter
+        # are need all chapters to be fetched first
+        negative_chapter = (
+            start_chapter is not None
+            and end_chapter is not None
+            and min(start_chapter, end_chapter) < 0
         )
+        if negative_chapter or config.sort_by == "chapter":
+            self.chapters = list(self.chapters)
+
+        # Convert the numbers if it's negative
+        if negative_chapter:
+            self.start_chapter, self.end_chapter = convert_start_end_from_negative(
+                self.start_chapter, self.end_chapter, [i.chapter for i in self.chapters]
+            )
 
         if _range is not None:
-            # self.range = range_mod.compile(_range)
-            self.range = None
+            self.range = range_mod.compile(_range)
         else:
             self.range = _range
 
@@ -424,10 +478,25 @@ class IteratorChapter:
         log_cache = kwargs.get("log_cache")
         self.log_cache = True if log_cache else False
 
-        if Net.mangadex.check_login():
-            self._unread_chapters = get_unread_chapters(manga.id)["data"]
+        self._logged_in = Net.mangadex.check_login()
+        if self._logged_in:
+            self._unread_chapters = set(get_unread_chapters(manga.id)["data"])
         else:
-            self._unread_chapters = []
+            self._unread_chapters = set()
+
+        self._group_blacklist = frozenset(env.group_blacklist)
+        self._user_blacklist = frozenset(env.user_blacklist)
+
+        # Debug messages are formatted for every ignored chapter,
+        # don't format them if they're not shown
+        self._log_debug = pbm.logger.isEnabledFor(logging.DEBUG)
+
+        # Config is read once, instead of for every chapter
+        self._data_saver = config.use_compressed_image
+        self._force_https = config.force_https
+
+        # List of filters that is used for every chapter
+        self._filters = self._compile_filters()
 
         # To show error message when chapters in specified language is not found
         self._first_run = True
@@ -441,7 +510,7 @@ class IteratorChapter:
             group = None
 
             try:
-                group = Group(_id)
+                group = Group.from_id(_id)
             except GroupNotFound:
                 # It's not a group
                 pass
@@ -450,7 +519,7 @@ class IteratorChapter:
 
             # Check if it's a user
             try:
-                group = User(_id)
+                group = User.from_id(_id)
             except UserNotFound:
                 # It's not a user
                 pass
@@ -465,71 +534,49 @@ class IteratorChapter:
         return groups
 
     def _check_range_chapter_legacy(self, chap):
-        num_chap = chap.chapter
-        num_vol = chap.volume
-        if num_chap != "none":
-            try:
-                num_chap = float(num_chap)
-            except ValueError:
-                pass
-            except TypeError:
-                # null value
-                pass
-        if num_vol != "none":
-            try:
-                num_vol = float(num_vol)
-            except ValueError:
-                pass
-            except TypeError:
-                # null value
-                pass
+        num_chap = chap._chapter_num
+        num_vol = chap._volume_num
 
-        is_number = isinstance(num_chap, float)
-        is_vol_number = isinstance(num_vol, float)
-
-        if is_vol_number and num_vol > 0.0:
-            if self.start_volume is not None and not (num_vol >= self.start_volume):
-                log.debug(
-                    f"Ignoring chapter in volume {num_vol}, because volume {num_vol} is in ignored list"
-                )
-                return False
-            if self.end_volume is not None and not (num_vol <= self.end_volume):
-                log.debug(
-                    f"Ignoring chapter in volume {num_vol}, because volume {num_vol} is in ignored list"
-                )
+        if num_vol is not None and num_vol > 0.0:
+            if (
+                self.start_volume is not None and not (num_vol >= self.start_volume)
+            ) or (self.end_volume is not None and not (num_vol <= self.end_volume)):
+                if self._log_debug:
+                    pbm.logger.debug(
+                        f"Ignoring chapter in volume {num_vol}, "
+                        f"because volume {num_vol} is in ignored list"
+                    )
                 return False
 
         # There is a chance that "Chapter 0" is Oneshot or prologue
         # We need to verify that is valid oneshot chapter
         # if it's valid oneshot chapter
         # then we need to skip start_chapter and end_chapter checking
-        if is_number and num_chap > 0.0:
-            if self.start_chapter is not None and not (num_chap >= self.start_chapter):
-                pbm.logger.debug(
-                    f"Ignoring chapter {num_chap}, "
-                    f"because chapter {num_chap} is in ignored list"
-                )
-                return False
-
-            if self.end_chapter is not None and not (num_chap <= self.end_chapter):
-                pbm.logger.debug(
-                    f"Ignoring chapter {num_chap}, "
-                    f"because chapter {num_chap} is in ignored list"
-                )
+        if num_chap is not None and num_chap > 0.0:
+            if (
+                self.start_chapter is not None and not (num_chap >= self.start_chapter)
+            ) or (self.end_chapter is not None and not (num_chap <= self.end_chapter)):
+                if self._log_debug:
+                    pbm.logger.debug(
+                        f"Ignoring chapter {num_chap}, "
+                        f"because chapter {num_chap} is in ignored list"
+                    )
                 return False
 
         if chap.oneshot and self.no_oneshot and not self.all_group:
-            pbm.logger.debug("Ignoring oneshot chapter since it's in ignored list")
+            if self._log_debug:
+                pbm.logger.debug("Ignoring oneshot chapter since it's in ignored list")
             return False
 
         # If chapter 0 is prologue or whatever and not oneshot
         # Re-check start_chapter
-        elif not chap.oneshot and is_number:
+        elif not chap.oneshot and num_chap is not None:
             if self.start_chapter is not None and not (num_chap >= self.start_chapter):
-                pbm.logger.debug(
-                    f"Ignoring chapter {num_chap}, "
-                    f"because chapter {num_chap} is in ignored list"
-                )
+                if self._log_debug:
+                    pbm.logger.debug(
+                        f"Ignoring chapter {num_chap}, "
+                        f"because chapter {num_chap} is in ignored list"
+                    )
                 return False
 
         return True
@@ -539,120 +586,166 @@ class IteratorChapter:
             return self._check_range_chapter_legacy(chap)
 
         if self.range is not None and not self.range.check_chapter(chap):
-            pbm.logger.debug(
-                f"Ignoring chapter {chap.chapter}, "
-                f"because chapter {chap.chapter} is in ignored list"
-            )
+            if self._log_debug:
+                pbm.logger.debug(
+                    f"Ignoring chapter {chap.chapter}, "
+                    f"because chapter {chap.chapter} is in ignored list"
+                )
             return False
 
         return True
 
     def _check_duplicate(self, chap):
-        name = f"{chap.volume}:{chap.chapter}"
+        name = chap._key
 
-        try:
-            self.duplicates[name]
-        except KeyError:
-            self.duplicates[name] = chap
-        else:
+        # Most of chapters are not duplicate, don't raise KeyError for them
+        if name in self.duplicates:
             return True
 
+        self.duplicates[name] = chap
         return False
 
-    def _check_chapter(self, chap):
-        num_chap = chap.chapter
-
-        if (
-            Net.mangadex.check_login()
-            and config.download_mode == "unread"
-            and chap.id in self._unread_chapters
-        ):
-            pbm.logger.debug(
-                f"Ignoring chapter {chap.get_simplified_name()} because it's marked as read"
-            )
+    def _compile_filters(self):
+        """Make list of filters that is needed for current options
+
+        Options are only checked once in here,
+        so every chapter doesn't need to check all of them again
+        """
+        filters = []
+
+        if self._logged_in and config.download_mode == "unread":
+            filters.append(self._filter_read_chapter)
+
+        if not self.all_group and not self.groups:
+            filters.append(self._filter_duplicate)
+
+        filters.append(self._filter_empty_chapter)
+
+        if self.language == Language.Other:
+            filters.append(self._filter_other_language)
+
+        if self.legacy_range:
+            filters.append(self._check_range_chapter_legacy)
+        elif self.range is not None:
+            filters.append(self._check_range_chapter)
+
+        if self._group_blacklist:
+            filters.append(self._filter_blacklisted_groups)
+
+        if self._user_blacklist:
+            filters.append(self._filter_blacklisted_user)
+
+        # Check if chap.group in self.groups (`--group`)
+        if not self.all_group and self.groups:
+            self._group_ids = frozenset(g.id for g in self.groups if isinstance(g, Group))
+            self._user_ids = frozenset(g.id for g in self.groups if isinstance(g, User))
+            self._fallback_group = config.group_nomatch_behaviour == "fallback"
+
+            filters.append(self._filter_groups)
+
+        return filters
+
+    def _filter_read_chapter(self, chap):
+        if chap.id in self._unread_chapters:
+            if self._log_debug:
+                pbm.logger.debug(
+                    f"Ignoring chapter {chap.get_simplified_name()} "
+                    "because it's marked as read"
+                )
             return False
 
-        if not self.all_group and not self.groups and self._check_duplicate(chap):
-            pbm.logger.debug(
-                f"Found duplicate {chap.simple_name} "
-                f"from [{chap.groups_name}], ignoring... "
-            )
+        return True
+
+    def _filter_duplicate(self, chap):
+        if self._check_duplicate(chap):
+            if self._log_debug:
+                pbm.logger.debug(
+                    f"Found duplicate {chap.simple_name} "
+                    f"from [{chap.groups_name}], ignoring... "
+                )
             return False
 
+        return True
+
+    def _filter_empty_chapter(self, chap):
         # Some manga has chapters where it has no pages / images inside of it.
         # We need to verify it, to prevent error when downloading the manga.
         if chap.pages == 0:
-            pbm.logger.debug(
-                "Chapter {0} from group {1} has no images, ignoring...".format(
-                    chap.chapter, chap.groups_name
+            if self._log_debug:
+                pbm.logger.debug(
+                    "Chapter {0} from group {1} has no images, ignoring...".format(
+                        chap.chapter, chap.groups_name
+                    )
                 )
-            )
             return False
 
-        if self.language == Language.Other and chap.language != Language.Other:
-            return False
+        return True
 
-        if not self._check_range_chapter(chap):
-            return False
+    def _filter_other_language(self, chap):
+        return chap.language == Language.Other
 
-        # Check blacklisted groups and users
-        if chap.groups:
-            blacklisted_groups = filter(
-                lambda x: x.id in env.group_blacklist, chap.groups
-            )
-            for group in blacklisted_groups:
+    def _filter_blacklisted_groups(self, chap):
+        for group in chap.groups:
+            if group.id in self._group_blacklist:
+                if self._log_debug:
+                    pbm.logger.debug(
+                        f"Ignoring chapter {chap.chapter}, "
+                        f"because group '{group.name}' is blacklisted"
+                    )
+                return False
+
+        return True
+
+    def _filter_blacklisted_user(self, chap):
+        if chap.user and chap.user.id in self._user_blacklist:
+            if self._log_debug:
                 pbm.logger.debug(
                     f"Ignoring chapter {chap.chapter}, "
-                    f"because group '{group.name}' is blacklisted"
+                    f"because user '{chap.user.name}' is blacklisted"
                 )
-                return False
-
-        if chap.user and chap.user.id in env.user_blacklist:
-            pbm.logger.debug(
-                f"Ignoring chapter {chap.chapter}, "
-                f"because user '{chap.user.name}' is blacklisted"
-            )
             return False
 
-        # Check if chap.group in self.groups (`--group`)
-        if not self.all_group and self.groups:
-            group_check = False
-            for group in self.groups:
-                if isinstance(group, Group):
-                    group_type = "scanlator group"
-                    group_names = chap.groups_name
+        return True
 
-                    if group.id in chap.groups_id:
-                        group_check = True
+    def _filter_groups(self, chap):
+        if not self._group_ids.isdisjoint(chap.groups_id):
+            return True
 
-                elif isinstance(group, User):
-                    group_type = "user"
-                    group_names = chap.user.name
+        if chap.user and chap.user.id in self._user_ids:
+            return True
 
-                    if chap.user and group.id == chap.user.id:
-                        group_check = True
+        if self._fallback_group and self._check_duplicate(chap):
+            return False
 
-            if (
-                not group_check
-                and config.group_nomatch_behaviour == "fallback"
-                and self._check_duplicate(chap)
-            ):
-                return False
+        if not self._log_debug:
+            return False
 
-            if not group_check:
-                pbm.logger.debug(
-                    f"Ignoring chapter {num_chap}, "
-                    f'{group_type} "{group_names}" is not match with "{group.name}"'
-                )
+        # Same message as before, it's using the last group from `--group`
+        group = self.groups[-1]
+        if isinstance(group, Group):
+            group_type = "scanlator group"
+            group_names = chap.groups_name
+        else:
+            group_type = "user"
+            group_names = chap.user.name if chap.user else None
+
+        pbm.logger.debug(
+            f"Ignoring chapter {chap.chapter}, "
+            f'{group_type} "{group_names}" is not match with "{group.name}"'
+        )
+        return False
+
+    def _check_chapter(self, chap):
+        for check in self._filters:
+            if not check(chap):
                 return False
 
         return True
 
     def _get_next_chapter(self):
         # Get chapter
-        try:
-            chap = self.queue.get_nowait()
-        except queue.Empty:
+        chap = next(self._iter_chapters, None)
+        if chap is None:
             if self._first_run:
                 raise ChapterNotFound(
                     f"Manga '{self.manga.title}' has no {self.language.name} chapters"
@@ -678,6 +771,8 @@ class IteratorChapter:
                 self.start_page,
                 self.end_page,
                 self.range,
+                data_saver=self._data_saver,
+                force_https=self._force_https,
             )
 
             return chap, chap_images
@@ -692,12 +787,22 @@ class IteratorChapter:
         if config.sort_by == "chapter":
             self.chapters = sorted(self.chapters, key=sort_chapter)
 
-        for chap in self.chapters:
-            self.queue.put(chap)
+        # Chapters can be a list or chapters that is still being fetched
+        # (see MangaChapter with stream=True)
+        self._iter_chapters = iter(self.chapters)
 
 
 class MangaChapter:
-    def __init__(self, manga, lang=None, chapter=None, all_chapters=False):
+    """Chapters from a manga
+
+    If ``stream`` is ``True``, only first page of the chapters feed is fetched,
+    the rest of it is fetched while iterating :meth:`iter()`.
+    Because of that, chapters can only be iterated once.
+    """
+
+    def __init__(
+        self, manga, lang=None, chapter=None, all_chapters=False, stream=False
+    ):
         if chapter and all_chapters:
             raise ValueError("chapter and all_chapters cannot be together")
         elif chapter is None and not all_chapters:
@@ -706,18 +811,28 @@ class MangaChapter:
         self.chapters = []
         self.language = lang
         self.manga = manga
+        self._feed = None
 
         if chapter:
             self._parse_volumes_from_chapter(chapter)
         elif all_chapters:
-            self._parse_volumes()
+            self._parse_volumes(stream)
 
         if self.language is not None:
             self.language = Language(lang)
 
     def iter(self, *args, **kwargs):
+        chapters = self.chapters
+
+        if self._feed is not None:
+            # Remaining chapters from the feed are not stored,
+            # so it can only be iterated once
+            chapters = itertools.chain(self.chapters, self._feed)
+            self.chapters = []
+            self._feed = None
+
         return IteratorChapter(
-            self.chapters, self.manga, Language(self.language), *args, **kwargs
+            chapters, self.manga, Language(self.language), *args, **kwargs
         )
 
     def _parse_volumes_from_chapter(self, chapter):
@@ -728,9 +843,20 @@ class MangaChapter:
 
         self.chapters.append(chap)
 
-    def _parse_volumes(self):
-        iterator = iter_chapters_feed(self.manga.id, self.language)
-        self.chapters.extend(map(Chapter.from_data, iterator))
+    def _parse_volumes(self, stream=False):
+        iterator = map(
+            Chapter.from_data, iter_chapters_feed(self.manga.id, self.language)
+        )
+
+        if stream:
+            # Fetch first page of the feed only,
+            # to make sure the manga has chapters
+            first_chapter = next(iterator, None)
+            if first_chapter is not None:
+                self.chapters.append(first_chapter)
+                self._feed = iterator
+        else:
+            self.chapters.extend(iterator)
 
         if isinstance(self.language, Language):
             language = self.language.name
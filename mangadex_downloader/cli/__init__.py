@@ -8,31 +8,19 @@ from .utils import (
     cleanup_app,
     setup_logging,
     setup_network,
+    setup_progress_bar,
     register_keyboardinterrupt_handler,
     sys_argv,
 )
 from .config import build_config
 from .auth import login_with_err_handler, logout_with_err_handler
 from .download import download
+from .server import run_server
 
 from ..errors import MangaDexException
 from ..format import deprecated_formats
 from ..utils import queueworker_active_threads
 
-_deprecated_opts = {
-    # I know this isn't deprecated
-    # But i need the warning feature, hehe
-    "range": "--range is disabled, because it's broken and need to rework",
-}
-
-
-def check_deprecated_options(log, args):
-    for arg, msg in _deprecated_opts.items():
-        deprecated = getattr(args, arg)
-        if deprecated:
-            log.warning(msg)
-
-
 def check_deprecated_formats(log, args):
     if args.save_as in deprecated_formats:
         log.warning(
@@ -42,6 +30,12 @@ def check_deprecated_formats(log, args):
 
 
 def check_conflict_options(args, parser):
+    if args.server and args.URL:
+        parser.error("URL cannot be used together with --server")
+
+    if args.server and args.run_forever:
+        parser.error("--server cannot be used together with --run-forever")
+
     if args.ignore_missing_chapters and args.no_track:
         parser.error("--ignore-missing-chapters cannot be used when --no-track is set")
 
@@ -82,7 +76,6 @@ def _main(argv):
         )
 
         # Check deprecated
-        check_deprecated_options(log, args)
         check_deprecated_formats(log, args)
 
         # Check conflict options
@@ -94,14 +87,21 @@ def _main(argv):
         # Setup network
         setup_network(args)
 
+        # Setup progress bar
+        setup_progress_bar(args)
+
         # Login
         login_with_err_handler(args)
 
-        # Building url
-        build_url(parser, args)
+        if args.server:
+            # Download jobs from local HTTP API
+            run_server(args)
+        else:
+            # Building url
+            build_url(parser, args)
 
-        # Download the manga
-        download(args)
+            # Download the manga
+            download(args)
 
         # Logout when it's finished
         logout_with_err_handler(args)
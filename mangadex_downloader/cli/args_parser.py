@@ -36,6 +36,7 @@ from ..errors import InvalidURL
 from ..network import Net
 from .. import __description__
 from ..forums import validate_forum_thread_url
+from .server import default_server_address
 
 log = logging.getLogger(__name__)
 
@@ -117,6 +118,13 @@ def get_args(argv):
     parser.add_argument(
         "--replace", "-r", help="Replace manga if exist", action="store_true"
     )
+    parser.add_argument(
+        "--force-verify",
+        "-frv",
+        help="Ignore job journal from previous (interrupted) run "
+        "and verify all downloaded chapters again",
+        action="store_true",
+    )
     parser.add_argument(
         "--filter",
         "-ft",
@@ -332,7 +340,9 @@ def get_args(argv):
     chap_group.add_argument(
         "--range",
         "-rg",
-        help="[DISABLED] A range pattern to download specific chapters",
+        help="A range pattern to download specific chapters and pages. "
+        "read https://mangadex-dl.mansuf.link/en/stable/cli_usage/advanced/chapters_and_pages_range.html "
+        "for more info",
     )
     chap_group.add_argument(
         "--sort-by",
@@ -485,9 +495,27 @@ def get_args(argv):
         help="Select save as format, default to `raw`",
         default=config.save_as,
     )
+    save_as_group.add_argument(
+        "--incremental-update",
+        "-iu",
+        action="store_true",
+        help="Append new chapters to existing volume and single files "
+        "instead of re-creating them. "
+        "Only supported in cbz-volume, cbz-single, pdf-volume and pdf-single formats",
+        default=config.incremental_update,
+    )
 
     # Network related
     network_group = parser.add_argument_group("Network")
+    network_group.add_argument(
+        "--manga-workers",
+        "-mw",
+        type=int,
+        default=config.manga_workers,
+        metavar="NUM",
+        help="Download multiple manga at the same time from batch file, list or library. "
+        "Progress bars are disabled if this is more than 1. Default is 1",
+    )
     network_group.add_argument(
         "--proxy", "-p", metavar="SOCKS / HTTP Proxy", help="Set http/socks proxy"
     )
@@ -581,6 +609,22 @@ def get_args(argv):
         action="store_true",
         help="Allow the application to run indefinitely with 5 seconds delay for repeating the same job",
     )
+    misc_group.add_argument(
+        "--server",
+        nargs="?",
+        const=default_server_address,
+        default=None,
+        metavar="ADDRESS",
+        help="Run the application as a server that receive download jobs from local HTTP API. "
+        f"Default address is '{default_server_address}'",
+    )
+    misc_group.add_argument(
+        "--server-queue-size",
+        type=int,
+        default=100,
+        metavar="NUM",
+        help="Maximum queued jobs in server mode, default is 100",
+    )
 
     console_group = parser.add_argument_group("Console output")
     console_group.add_argument(
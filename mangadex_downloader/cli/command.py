@@ -47,11 +47,13 @@ from ..mdlist import MangaDexList
 from ..group import Group
 from ..cover import CoverArt, cover_qualities
 from ..language import get_language
-from ..format.pdf import PillowNotInstalled
 from ..config import config
 
 
 def preview_chapter(chapter: Chapter):
+    # PDF format is importing Pillow, only import it when it's needed
+    from ..format.pdf import PillowNotInstalled
+
     try:
         from PIL import Image
     except ImportError:
@@ -71,6 +73,9 @@ def preview_chapter(chapter: Chapter):
 
 
 def preview_cover_manga(manga_id, manga_cover, manga_title=None, quality="original"):
+    # PDF format is importing Pillow, only import it when it's needed
+    from ..format.pdf import PillowNotInstalled
+
     try:
         from PIL import Image
     except ImportError:
@@ -131,8 +131,8 @@ def build_config(parser, args):
 
     # Print all config to debug
     if config_enabled:
-        log.debug(f"Loaded config from path {_conf.path!r} = {_conf._data}")
+        log.debug(f"Loaded config from path {_conf.path!r} = {dict(_conf._data)}")
 
     set_config_from_cli_opts(args)
 
-    log.debug(f"Loaded config from cli args = {_conf._data}")
+    log.debug(f"Loaded config from cli args = {dict(_conf._data)}")
@@ -22,21 +22,67 @@
 
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from ..errors import MangaDexException, ChapterNotFound
+from ..tracker.journal import get_journal, close_journal
 
 log = logging.getLogger(__name__)
 
 
+def _download_url(url, args):
+    journal = get_journal()
+    source = getattr(url, "source", None)
+    if journal is None or source is None:
+        journal = None
+    else:
+        journal.start("url", source)
+
+    try:
+        url(args, args.type)
+    except ChapterNotFound as e:
+        # Do not show traceback for "chapter not found" errors
+        log.error(e)
+    except MangaDexException as e:
+        # The error already explained
+        log.error(e)
+        traceback.print_exception(type(e), e, e.__traceback__)
+
+        if journal is not None:
+            journal.fail("url", source)
+        return
+
+    if journal is not None:
+        journal.complete("url", source)
+
+
 def download(args):
-    for url in args.URL:
-        try:
-            url(args, args.type)
-        except ChapterNotFound as e:
-            # Do not show traceback for "chapter not found" errors
-            log.error(e)
-        except MangaDexException as e:
-            # The error already explained
-            log.error(e)
-            traceback.print_exception(type(e), e, e.__traceback__)
-            continue
+    try:
+        if args.manga_workers <= 1:
+            for url in args.URL:
+                _download_url(url, args)
+
+            return
+
+        # Download multiple manga at the same time.
+        # They're sharing the same network session (and rate limit)
+        urls = list(args.URL)
+        total = len(urls)
+        errors = []
+        with ThreadPoolExecutor(max_workers=args.manga_workers) as executor:
+            futures = [executor.submit(_download_url, url, args) for url in urls]
+
+            # Progress bars are disabled, report finished manga instead
+            for done, future in enumerate(as_completed(futures), start=1):
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+
+                log.info(f"Finished {done}/{total} manga")
+
+        # Raise unhandled errors (if any), after all manga are finished
+        if errors:
+            raise errors[0]
+    finally:
+        # Interrupted or failed jobs are kept for the next run
+        close_journal()
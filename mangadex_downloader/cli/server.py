@@ -0,0 +1,337 @@
+# MIT License
+
+# Copyright (c) 2022-present Rahman Yusuf
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""
+Server mode, download jobs are received from local HTTP API
+
+Network session, login session and caches are kept between jobs,
+so there is no startup cost for every job.
+
+API:
+
+- ``POST /jobs`` with JSON ``{"url": "...", "type": "manga", "priority": 0}``
+  (``type`` and ``priority`` are optional), jobs with higher priority are downloaded first
+- ``GET /jobs`` list all jobs
+- ``GET /jobs/<id>`` get a job
+"""
+
+import copy
+import heapq
+import ipaddress
+import itertools
+import logging
+import socket
+import threading
+import time
+import traceback
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from .url import build_URL_from_type, smart_select_url
+from .. import json_op
+from ..errors import MangaDexException
+from ..utils import valid_url_types
+
+log = logging.getLogger(__name__)
+
+default_server_address = "127.0.0.1:8765"
+
+# Finished jobs that are kept for `GET /jobs`
+_max_finished_jobs = 1000
+
+
+def _parse_address(address):
+    """Parse ``host:port`` or ``[ipv6]:port`` into ``(host, port)``"""
+    host, _, port = address.rpartition(":")
+    try:
+        port = int(port)
+    except ValueError:
+        raise MangaDexException(
+            f"'{address}' is not valid server address, it must be 'host:port'"
+        ) from None
+
+    # IPv6 address, "[::1]:8765"
+    if host.startswith("[") and host.endswith("]"):
+        host = host[1:-1]
+
+    return host or "127.0.0.1", port
+
+
+def _is_loopback(host):
+    if host == "localhost":
+        return True
+
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        # Hostname
+        return False
+
+
+class _IPv6HTTPServer(ThreadingHTTPServer):
+    address_family = socket.AF_INET6
+
+
+class QueueFull(MangaDexException):
+    """Raised when server queue is full"""
+
+    pass
+
+
+class Job:
+    def __init__(self, id, url, type=None, priority=0):
+        self.id = id
+        self.url = url
+        self.type = type
+        self.priority = priority
+        self.status = "queued"
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "url": self.url,
+            "type": self.type,
+            "priority": self.priority,
+            "status": self.status,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class JobQueue:
+    """Bounded priority queue for download jobs"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.jobs = {}
+
+        self._queue = []
+        self._finished = []
+        self._counter = itertools.count(1)
+        self._cond = threading.Condition()
+
+    def submit(self, url, type=None, priority=0) -> Job:
+        with self._cond:
+            if len(self._queue) >= self.maxsize:
+                raise QueueFull(f"Queue is full ({self.maxsize} jobs)")
+
+            job_id = next(self._counter)
+            job = Job(job_id, url, type, priority)
+            self.jobs[job_id] = job
+
+            # Higher priority first, and then first in first out
+            heapq.heappush(self._queue, (-priority, job_id, job))
+            self._cond.notify()
+
+        return job
+
+    def get(self) -> Job:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+
+            _, _, job = heapq.heappop(self._queue)
+            job.status = "running"
+            job.started_at = time.time()
+
+        return job
+
+    def finish(self, job, error=None):
+        with self._cond:
+            job.status = "failed" if error else "finished"
+            job.error = error
+            job.finished_at = time.time()
+
+            self._finished.append(job.id)
+            if len(self._finished) > _max_finished_jobs:
+                del self.jobs[self._finished.pop(0)]
+
+    def get_all(self):
+        with self._cond:
+            return [job.to_dict() for job in self.jobs.values()]
+
+
+class DownloadServer:
+    """Receive download jobs from HTTP API and download them in background
+
+    ``workers`` is total jobs that are downloaded at the same time (``--manga-workers``)
+    """
+
+    def __init__(
+        self, args, address=default_server_address, queue_size=100, workers=1
+    ):
+        self.args = args
+        self.address = _parse_address(address)
+        self.queue = JobQueue(queue_size)
+
+        self._httpd = None
+        self._workers = [
+            threading.Thread(target=self._run_worker, daemon=True)
+            for _ in range(workers)
+        ]
+
+    def _run_job(self, job):
+        # Options from command-line are used for every job
+        args = copy.copy(self.args)
+        _type = job.type or args.type
+
+        if _type:
+            url = build_URL_from_type(_type, job.url)
+        else:
+            url = smart_select_url(job.url)
+
+        url(args, _type)
+
+    def _run_worker(self):
+        while True:
+            job = self.queue.get()
+            log.info(f"Starting job #{job.id} ({job.url})")
+
+            try:
+                self._run_job(job)
+            except MangaDexException as e:
+                log.error(f"Job #{job.id} failed: {e}")
+                self.queue.finish(job, str(e))
+            except Exception as e:
+                log.error(f"Job #{job.id} failed with unhandled error")
+                traceback.print_exception(type(e), e, e.__traceback__)
+                self.queue.finish(job, f"{type(e).__name__}: {e}")
+            else:
+                log.info(f"Job #{job.id} is finished")
+                self.queue.finish(job)
+
+    def submit(self, data):
+        """Validate data from ``POST /jobs`` and put it in the queue"""
+        if not isinstance(data, dict) or not isinstance(data.get("url"), str):
+            raise MangaDexException("'url' is required and it must be a string")
+
+        _type = data.get("type")
+        if _type is not None and _type not in valid_url_types:
+            raise MangaDexException(
+                f"'{_type}' is not valid type, available types are {valid_url_types}"
+            )
+
+        priority = data.get("priority", 0)
+        if not isinstance(priority, int):
+            raise MangaDexException("'priority' must be an integer")
+
+        return self.queue.submit(data["url"], _type, priority)
+
+    def serve_forever(self):
+        server = self
+
+        class Handler(_RequestHandler):
+            download_server = server
+
+        host = self.address[0]
+        if not _is_loopback(host):
+            # There is no authentication in the API
+            log.warning(
+                f"Server is listening on non-loopback address '{host}', "
+                "anyone who can reach this address can submit download jobs"
+            )
+
+        server_cls = _IPv6HTTPServer if ":" in host else ThreadingHTTPServer
+        self._httpd = server_cls(self.address, Handler)
+        for worker in self._workers:
+            worker.start()
+
+        host, port = self._httpd.server_address[:2]
+        if ":" in host:
+            host = f"[{host}]"
+        log.info(f"Server is listening on http://{host}:{port}")
+
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def shutdown(self):
+        if self._httpd is not None:
+            self._httpd.shutdown()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    download_server: DownloadServer = None
+
+    def log_message(self, format, *args):
+        log.debug(f"{self.address_string()} - {format % args}")
+
+    def _send_json(self, status, data):
+        body = json_op.dumps(data, convert_str=False)
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        queue = self.download_server.queue
+        path = self.path.rstrip("/")
+
+        if path == "/jobs":
+            self._send_json(200, {"jobs": queue.get_all()})
+            return
+
+        prefix, _, job_id = path.rpartition("/")
+        if prefix == "/jobs" and job_id.isdigit():
+            job = queue.jobs.get(int(job_id))
+            if job is not None:
+                self._send_json(200, job.to_dict())
+                return
+
+        self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/jobs":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            data = json_op.loads(self.rfile.read(length))
+        except Exception:
+            self._send_json(400, {"error": "Request body must be a valid JSON"})
+            return
+
+        try:
+            job = self.download_server.submit(data)
+        except QueueFull as e:
+            self._send_json(503, {"error": str(e)})
+        except MangaDexException as e:
+            self._send_json(400, {"error": str(e)})
+        else:
+            self._send_json(202, job.to_dict())
+
+
+def run_server(args):
+    server = DownloadServer(
+        args, args.server, args.server_queue_size, args.manga_workers
+    )
+    server.serve_forever()
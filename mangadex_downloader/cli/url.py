@@ -26,8 +26,10 @@ import requests
 
 from .utils import check_group_all
 from .command import registered_commands
+from .. import range as range_mod
 from ..config import config
 from ..network import Net
+from ..tracker.journal import get_journal_key, open_journal
 from ..fetcher import get_chapter, get_list, get_manga
 from ..errors import (
     ChapterNotFound,
@@ -87,6 +89,10 @@ def download_manga(url, args, legacy=False):
         if args.range and value:
             raise MangaDexException(f"--range cannot be used together with {arg}")
 
+    # Check the range pattern before fetching the manga
+    if args.range:
+        range_mod.compile(args.range)
+
     if config.download_mode == "unread" and not Net.mangadex.check_login():
         raise MangaDexException(
             "You must logged in, in order to use --download-mode=unread"
@@ -193,6 +199,9 @@ class URL:
         self.func = func
         self.id = _id
 
+        # Line from batch input, used as job id in journal
+        self.source = None
+
     def __call__(self, args, _type=None):
         if _type is not None:
             self.func = funcs[_type]
@@ -310,6 +319,35 @@ def build_url(parser, args):
 
         result = urls.splitlines(keepends=False)
 
+    # Checkpoints for batch download,
+    # so interrupted batch can be continued without starting over
+    journal = None
+    if not exec_command and (args.file or len(result) > 1):
+        key = get_journal_key(
+            result,
+            args.type,
+            config.save_as,
+            config.language,
+            args.replace,
+            args.range,
+            args.start_chapter,
+            args.end_chapter,
+            args.start_volume,
+            args.end_volume,
+            args.start_page,
+            args.end_page,
+            args.group,
+            args.no_oneshot_chapter,
+            # Finished jobs are skipped, they must be in the same directory and filenames
+            config.path,
+            config.filename_chapter,
+            config.filename_volume,
+            config.filename_single,
+            config.no_group_name,
+            config.use_chapter_title,
+        )
+        journal = open_journal(key, args.force_verify)
+
     def yeet():
         """Function to yeet each url with error handling (:class:`InvalidURL`)"""
         if args.type:
@@ -321,12 +359,20 @@ def build_url(parser, args):
             func = smart_select_url
 
         for i in result:
+            # Finished in previous run, don't check it again
+            if journal is not None and journal.is_completed("url", i):
+                log.info(f"Skipping {i!r}, it's already completed in previous run")
+                continue
+
             try:
-                yield func(i)
+                url = func(i)
             except InvalidURL as e:
                 log.error(e)
                 continue
 
+            url.source = i
+            yield url
+
     # Finally, make :class:`URL` object
     args.URL = yeet()
 
@@ -30,6 +30,7 @@ from ..network import Net
 from ..downloader import _cleanup_jobs
 from ..errors import MangaDexException, NotLoggedIn
 from ..config import config
+from ..progress_bar import progress_bar_manager
 
 log = logging.getLogger(__name__)
 
@@ -83,6 +84,13 @@ def setup_network(args):
     Net.set_auth(args.login_method)
 
 
+def setup_progress_bar(args):
+    # Progress bars from multiple manga are messing up the output,
+    # the download progress is reported per manga instead (see cli/download.py)
+    if args.manga_workers > 1:
+        progress_bar_manager.disabled = True
+
+
 def _keyboard_interrupt_handler(*args):
     """Handle keyboard interrupt (CTRL+C)"""
 
@@ -26,7 +26,6 @@ import binascii
 import logging
 import traceback
 import sys
-import jwt
 from datetime import datetime
 
 from .env import base_path, config_enabled, init
@@ -195,6 +194,9 @@ class AuthCacheManager:
         self._write(data)
 
     def get_expiration_time(self, token):
+        # PyJWT is slow to import, only import it when there is a token
+        import jwt
+
         data = jwt.decode(token, options={"verify_signature": False})
         return datetime.fromtimestamp(data["exp"])
 
@@ -22,7 +22,8 @@
 
 import threading
 import logging
-from requests_doh import get_all_dns_provider
+import time
+from types import MappingProxyType
 
 from .env import base_path, config_enabled, init
 from .utils import (
@@ -37,6 +38,7 @@ from .utils import (
     validate_download_mode,
     validate_stacked_progress_bar_order,
     validate_group_nomatch_behaviour,
+    validate_manga_workers,
     validate_log_level,
     validate_progress_bar_layout,
     validate_int,
@@ -49,14 +51,12 @@ from ..cover import default_cover_type, valid_cover_types
 from ..language import Language
 from ..errors import MangaDexException
 
-# Fix #28
-_doh_providers = [None]
-_doh_providers.extend(get_all_dns_provider())
-
 log = logging.getLogger(__name__)
 
 __all__ = (
     "set_config_from_cli_opts",
+    "set_local_config",
+    "reset_local_config",
     "reset_config",
     "get_all_configs",
     "config",  # High-level access for normal use
@@ -117,14 +117,27 @@ class _Config:
         "page_size": (0, validate_int),
         "order": ("newest", validate_order),
         "group_nomatch_behaviour": ("ignore", validate_group_nomatch_behaviour),
+        "incremental_update": (False, validate_bool),
+        "manga_workers": (1, validate_manga_workers),
     }
     default_conf = {x: y for x, (y, _) in confs.items()}
 
+    # Minimum interval (in seconds) for checking config file changes
+    check_interval = 1.0
+
     def __init__(self):
         self._data = None
         self._lock = threading.Lock()
         self.no_read = False
 
+        # Config that is only changed for current thread (see `set_local_config()`)
+        self._local = threading.local()
+
+        # Config file is only read again if it's modified (by another process)
+        # See `_is_modified()`
+        self._file_stat = None
+        self._last_check = 0.0
+
         # Load the config
         self._load()
 
@@ -166,15 +179,41 @@ class _Config:
                 )
                 data[conf_key] = default_value
 
-        self._data = data
+        # Read-only snapshot, config must be changed through `write()`
+        self._data = MappingProxyType(data)
 
         if config_enabled and write_to_path:
             self.path.write_text(json_op.dumps(data))
+            self._file_stat = self._get_file_stat()
+
+    def _get_file_stat(self):
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _is_modified(self):
+        """Check if config file is modified since last read"""
+        if self._data is None or self._file_stat is None:
+            return True
+
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+
+        self._last_check = now
+        return self._get_file_stat() != self._file_stat
 
     def _write_default(self):
         self._write(self.default_conf)
 
     def _load(self):
+        if config_enabled and not self._is_modified():
+            # Use config snapshot
+            return
+
         # Initialize config
         if config_enabled:
             init()
@@ -231,6 +270,10 @@ class _Config:
             self._write(data)
 
     def read(self, name):
+        local_data = getattr(self._local, "data", None)
+        if local_data and name in local_data:
+            return local_data[name]
+
         if not self.no_read:
             self._load()
         return self._data[name]
@@ -266,6 +309,31 @@ def set_config_from_cli_opts(args):
     _conf.no_read = True
 
 
+def set_local_config(name, value):
+    """Change config only for current thread, it's not written to config file
+
+    Useful when multiple manga are downloaded in parallel (``--manga-workers``)
+    """
+    try:
+        _, validator = _conf.confs[name]
+    except KeyError:
+        raise AttributeError(
+            f"type object '{_Config.__name__}' has no attribute '{name}'"
+        ) from None
+
+    if getattr(_conf._local, "data", None) is None:
+        _conf._local.data = {}
+
+    _conf._local.data[name] = validator(value)
+
+
+def reset_local_config(name):
+    """Remove config that is changed by :func:`set_local_config()`"""
+    local_data = getattr(_conf._local, "data", None)
+    if local_data:
+        local_data.pop(name, None)
+
+
 def reset_config(name=None):
     """Reset config. If ``name`` is not given, reset all configs"""
     if not name:
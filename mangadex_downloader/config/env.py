@@ -28,6 +28,7 @@ from .utils import (
     validate_bool,
     validate_dummy,
     validate_zip_compression_type,
+    validate_sevenzip_compression_type,
     validate_int,
     validate_blacklist,
     validate_tag,
@@ -73,6 +74,18 @@ class EnvironmentVariables:
             validate_int,
             False,
         ],
+        [
+            "sevenzip_compression_type",
+            None,
+            validate_sevenzip_compression_type,
+            False,
+        ],
+        [
+            "sevenzip_compression_level",
+            None,
+            validate_int,
+            False,
+        ],
         [
             "user_blacklist",
             tuple(),
@@ -95,6 +108,18 @@ class EnvironmentVariables:
             # which is not respecting rate limit system from MangaDex API
             True,
         ],
+        [
+            "global_index",
+            False,
+            validate_bool,
+            False,
+        ],
+        [
+            "page_store",
+            None,
+            validate_dummy,
+            False,
+        ],
     ]
 
     def __init__(self):
@@ -26,7 +26,6 @@ import os
 import typing
 from dataclasses import dataclass
 from urllib.parse import urlparse
-from requests_doh import get_all_dns_provider, add_dns_provider
 
 from .. import format as fmt
 from ..errors import MangaDexException, InvalidURL
@@ -42,6 +41,7 @@ __all__ = (
     "validate_format",
     "validate_dummy",
     "validate_zip_compression_type",
+    "validate_sevenzip_compression_type",
     "validate_int",
     "validate_tag",
     "validate_blacklist",
@@ -53,6 +53,7 @@ __all__ = (
     "validate_progress_bar_layout",
     "validate_stacked_progress_bar_order",
     "validate_group_nomatch_behaviour",
+    "validate_manga_workers",
     "load_env",
     "LazyLoadEnv",
     "ConfigTypeError",
@@ -133,6 +134,18 @@ def validate_zip_compression_type(val):
         raise ConfigTypeError(f"zip compression type '{val}' is not valid")
 
 
+def validate_sevenzip_compression_type(val):
+    types = ["copy", "lzma2", "lzma", "deflate", "bzip2", "zstd", "brotli"]
+
+    val = val.strip().lower()
+    if val not in types:
+        raise ConfigTypeError(
+            f"7z compression type '{val}' is not valid, must be one of {types}"
+        )
+
+    return val
+
+
 def validate_int(val):
     try:
         return int(val)
@@ -219,6 +232,12 @@ def validate_download_mode(val):
 
 
 def validate_doh_provider(val):
+    if val is None:
+        return val
+
+    # requests_doh is slow to import, only import it when DoH is used
+    from requests_doh import get_all_dns_provider, add_dns_provider
+
     providers = [None]
     providers.extend(get_all_dns_provider())
     try:
@@ -309,6 +328,14 @@ def validate_progress_bar_layout(val):
     return val
 
 
+def validate_manga_workers(val):
+    val = validate_int(val)
+    if val < 1:
+        raise ConfigTypeError(f"'{val}' is not valid manga workers, it must be at least 1")
+
+    return val
+
+
 def validate_stacked_progress_bar_order(val):
     if isinstance(val, str):
         values = (i.strip() for i in val.split(","))
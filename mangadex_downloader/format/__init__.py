@@ -1,26 +1,25 @@
-from .raw import Raw, RawSingle, RawVolume
-from .pdf import PDF, PDFSingle, PDFVolume
-from .comic_book import ComicBookArchive, ComicBookArchiveSingle, ComicBookArchiveVolume
-from .sevenzip import SevenZip, SevenZipSingle, SevenZipVolume
-from .epub import Epub, EpubSingle, EpubVolume
+import importlib
+
 from ..errors import InvalidFormat
 
+# Format modules are imported when the format is used (see `get_format()`),
+# some of them need optional dependencies that are slow to import (Pillow, py7zr)
 formats = {
-    "raw": Raw,
-    "raw-volume": RawVolume,
-    "raw-single": RawSingle,
-    "pdf": PDF,
-    "pdf-volume": PDFVolume,
-    "pdf-single": PDFSingle,
-    "cbz": ComicBookArchive,
-    "cbz-volume": ComicBookArchiveVolume,
-    "cbz-single": ComicBookArchiveSingle,
-    "cb7": SevenZip,
-    "cb7-volume": SevenZipVolume,
-    "cb7-single": SevenZipSingle,
-    "epub": Epub,
-    "epub-volume": EpubVolume,
-    "epub-single": EpubSingle,
+    "raw": ("raw", "Raw"),
+    "raw-volume": ("raw", "RawVolume"),
+    "raw-single": ("raw", "RawSingle"),
+    "pdf": ("pdf", "PDF"),
+    "pdf-volume": ("pdf", "PDFVolume"),
+    "pdf-single": ("pdf", "PDFSingle"),
+    "cbz": ("comic_book", "ComicBookArchive"),
+    "cbz-volume": ("comic_book", "ComicBookArchiveVolume"),
+    "cbz-single": ("comic_book", "ComicBookArchiveSingle"),
+    "cb7": ("sevenzip", "SevenZip"),
+    "cb7-volume": ("sevenzip", "SevenZipVolume"),
+    "cb7-single": ("sevenzip", "SevenZipSingle"),
+    "epub": ("epub", "Epub"),
+    "epub-volume": ("epub", "EpubVolume"),
+    "epub-single": ("epub", "EpubSingle"),
 }
 
 deprecated_formats = []
@@ -28,10 +27,26 @@ deprecated_formats = []
 default_save_as_format = "raw"
 
 
+def _load_format(module, name):
+    module = importlib.import_module(f".{module}", __name__)
+    return getattr(module, name)
+
+
 def get_format(fmt):
     try:
-        return formats[fmt]
+        module, name = formats[fmt]
     except KeyError:
         raise InvalidFormat(
             "invalid save_as format, available are: %s" % set(formats.keys())
         )
+
+    return _load_format(module, name)
+
+
+def __getattr__(name):
+    # Backward compatibility for `from mangadex_downloader.format import Raw`
+    for module, cls_name in formats.values():
+        if cls_name == name:
+            return _load_format(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -20,6 +20,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import itertools
 import logging
 import os
 import shutil
@@ -31,6 +32,8 @@ from .utils import (
     QueueWorkerReadMarker,
 )
 from .placeholders import VolumePlaceholder, SingleChaptersPlaceholder
+from .page_store import get_page_store
+from ..tracker.journal import get_journal
 from ..downloader import ChapterPageDownloader
 from ..utils import QueueWorker, create_directory, delete_file
 from ..progress_bar import progress_bar_manager as pbm
@@ -40,6 +43,12 @@ log = logging.getLogger(__name__)
 
 
 class BaseFormat:
+    # Chapter formats (raw, cbz, epub, etc...) don't need all chapters to be fetched
+    # before downloading, they can be downloaded while chapters feed is still being fetched
+    # (see `MangaChapter` in `chapter.py`). Formats that need all chapters first
+    # (volume and single formats) must leave this to `False`
+    stream_chapters = False
+
     def __init__(
         self,
         path,
@@ -73,6 +82,12 @@ class BaseFormat:
             self.chapter_read_marker.start()
 
         self.worker = None
+        self.page_store = get_page_store()
+        self.journal = get_journal()
+
+        # Total volumes for progress bar,
+        # it's increased for every batch of chapters (see `iter_chapters_batches()`)
+        self._volumes_total = 0
 
         if config.progress_bar_layout == "stacked":
             pbm.stacked = True
@@ -132,6 +147,11 @@ class BaseFormat:
                         f"Page {page} ({img_name}) exists and is verified, "
                         "cancelling download..."
                     )
+
+                    # Pages downloaded before the page store is enabled
+                    if self.page_store is not None:
+                        self.page_store.add(img_hash, img_ext, img_path, verified=True)
+
                     count.increase()
                     imgs.append(img_path)
                     pages_pb.update(1)
@@ -143,6 +163,23 @@ class BaseFormat:
                         "failed to verify (hash is not matching), re-downloading..."
                     )
 
+                # Same image is already downloaded before (from another format or manga)
+                if (
+                    not self.replace
+                    and self.page_store is not None
+                    and self.page_store.get(
+                        img_hash, img_ext, img_path, verify=verified is False
+                    )
+                ):
+                    pbm.logger.debug(
+                        f"Page {page} ({img_name}) is found in page store, "
+                        "cancelling download..."
+                    )
+                    count.increase()
+                    imgs.append(img_path)
+                    pages_pb.update(1)
+                    continue
+
                 pbm.logger.info("Downloading %s page %s" % (chap_name, page))
 
                 downloader = ChapterPageDownloader(
@@ -168,6 +205,9 @@ class BaseFormat:
                     pages_pb.reset()
                     break
                 else:
+                    if self.page_store is not None:
+                        self.page_store.add(img_hash, img_ext, img_path)
+
                     imgs.append(img_path)
                     count.increase()
                     pages_pb.update(1)
@@ -193,6 +233,42 @@ class BaseFormat:
                 else:
                     self.chapter_read_marker.submit(chapter.id)
 
+    def check_chapter_journal(self, chapter):
+        """Check if the chapter is completed in previous run (see ``tracker/journal.py``)"""
+        return self.journal is not None and self.journal.is_completed(
+            "chapter", chapter.id
+        )
+
+    def add_chapter_journal(self, chapter):
+        """Record the chapter as completed in the journal (if any)"""
+        if self.journal is not None:
+            self.journal.complete("chapter", chapter.id)
+
+    def iter_chapters_batches(self):
+        """Iterate chapters from manga in batches of ``[(chapter, images), ...]``
+
+        If :attr:`stream_chapters` is ``True``, a batch is chapters from the same volume,
+        so the chapters can be downloaded while the rest of them are still being fetched.
+        Otherwise, all chapters are returned in one batch.
+        """
+        data = self.manga.chapters.iter(**self.kwargs_iter)
+
+        if not self.stream_chapters:
+            yield list(data)
+            return
+
+        for _, chapters in itertools.groupby(data, key=lambda x: x[0].volume):
+            yield list(chapters)
+
+    def set_volumes_total(self, volumes):
+        """Set total volumes in progress bar from a batch of chapters"""
+        if self.stream_chapters:
+            self._volumes_total += len(volumes)
+        else:
+            self._volumes_total = len(volumes)
+
+        pbm.set_volumes_total(self._volumes_total)
+
     def get_fmt_single_cache(self, manga):
         """Get cached all chapters, total pages,
         and merged name (ex: Vol. 1 Ch. 1 - Vol. 2 Ch. 2) for any single formats
@@ -372,6 +448,13 @@ class BaseConvertedFormat(BaseFormat):
     # and use that class in each format clasess
     # See `CBZFileExt` class in `format/comic_book.py` module for example
 
+    # Formats that can append new chapters to existing file (--incremental-update)
+    # must set this to `True` and implement `get_existing_total_pages(path, total)`
+    # in the file extension class (see `CBZFile` in `format/comic_book.py`).
+    # It must return total pages in existing file,
+    # or `None` if new pages cannot be appended to the file
+    support_incremental_update = False
+
     def __init__(self, *args, **kwargs):
         # Each formats must implement this
         # to check if optional packages is installed or not
@@ -380,8 +463,52 @@ class BaseConvertedFormat(BaseFormat):
         self.total_volumes = 0
         self.total_chapters_per_volume = 0
 
+        # Total pages in existing file if new chapters is being appended to it,
+        # otherwise `None`
+        self.incremental_pages = None
+
         super().__init__(*args, **kwargs)
 
+    def check_incremental_update(self, file_info, chapters, total):
+        """Check if new chapters can be appended to existing file
+
+        Return total pages in existing file,
+        or ``None`` if the file must be re-created
+        """
+        if not self.config.incremental_update or not self.support_incremental_update:
+            return None
+
+        name = file_info.name
+        exist_chapter_ids = set(i.id for i in file_info.chapters)
+
+        # New chapters must be placed after existing chapters,
+        # otherwise the pages will be in wrong order
+        first_chapter_ids = set(c.id for c, _ in chapters[: len(exist_chapter_ids)])
+        if first_chapter_ids != exist_chapter_ids:
+            pbm.logger.debug(
+                f"New chapters is not placed after existing chapters in {name!r}, "
+                "cannot append new chapters"
+            )
+            return None
+
+        path = self.path / name
+        if not self.verify_file(file_info, path):
+            pbm.logger.debug(
+                f"{name!r} is missing or unverified, cannot append new chapters"
+            )
+            return None
+
+        return self.get_existing_total_pages(path, total)
+
+    def rename_existing_file(self, old_name, new_name):
+        """Rename existing file if the filename is changed because of new chapters"""
+        if old_name == new_name:
+            return
+
+        pbm.logger.info(f"Renaming {old_name!r} to {new_name!r}")
+        os.replace(self.path / old_name, self.path / new_name)
+        self.manga.tracker.remove_file_info_from_name(old_name)
+
     def add_fi(self, name, id, path, chapters=None, volume=None):
         file_hash = create_file_hash_sha256(path)
 
@@ -401,8 +528,43 @@ class BaseConvertedFormat(BaseFormat):
             self.manga.tracker.add_chapters_info(chaps_data)
             self.mark_read_chapter(chapters)
 
+        # Record the file manifest, so the file can be verified
+        # without reading all of its data. See `verify_file()`
+        get_file_manifest = getattr(self, "get_file_manifest", None)
+        if get_file_manifest is not None:
+            self.manga.tracker.add_manifest_info(name, get_file_manifest(path))
+
         self.manga.tracker.toggle_complete(name, True)
 
+    def verify_file(self, file_info, path):
+        """Verify existing file from file info tracker
+
+        File extension classes can implement ``get_file_manifest(path)``
+        which return dict of entry names and their checksums (see ``CBZFile``).
+        If the manifest is recorded in the tracker, the file is verified
+        from the manifest instead of SHA256 hash of the whole file.
+
+        Return ``None`` if the file is not exist
+        """
+        get_file_manifest = getattr(self, "get_file_manifest", None)
+        if get_file_manifest is None:
+            return verify_sha256(file_info.hash, path)
+
+        recorded_manifest = self.manga.tracker.get_manifest_info(file_info.name)
+        if not recorded_manifest:
+            return verify_sha256(file_info.hash, path)
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            manifest = get_file_manifest(path)
+        except Exception as e:
+            log.debug(f"Failed to read manifest from '{path}', reason: {e}")
+            return False
+
+        return manifest == recorded_manifest
+
     def check_fi_completed(self, name):
         if self.manga.tracker.disabled:
             return True
@@ -425,6 +587,8 @@ class BaseConvertedFormat(BaseFormat):
 
 
 class ConvertedChaptersFormat(BaseConvertedFormat):
+    stream_chapters = True
+
     def on_prepare(self, file_path, chapter, images):
         """This function is called after creating a directory to store downloaded images"""
         pass
@@ -439,7 +603,7 @@ class ConvertedChaptersFormat(BaseConvertedFormat):
         for chap_class, images in data:
             self.append_cache_volumes(volumes, chap_class.volume, (chap_class, images))
 
-        pbm.set_volumes_total(len(volumes.keys()))
+        self.set_volumes_total(volumes)
         # Begin downloading
         for volume, chapters in volumes.items():
 
@@ -475,6 +639,7 @@ class ConvertedChaptersFormat(BaseConvertedFormat):
 
                         # Store file_info tracker for existing chapter
                         self.add_fi(filename, chap_class.id, file_path)
+                        self.add_chapter_journal(chap_class)
 
                         chapters_pb.update(1)
                         continue
@@ -503,6 +668,7 @@ class ConvertedChaptersFormat(BaseConvertedFormat):
                 shutil.rmtree(chapter_path, ignore_errors=True)
 
                 self.add_fi(filename, chap_class.id, file_path)
+                self.add_chapter_journal(chap_class)
 
             chapters_pb.reset()
             volumes_pb.update(1)
@@ -525,68 +691,92 @@ class ConvertedChaptersFormat(BaseConvertedFormat):
         # Steps for new (not downloaded) chapters:
         # - Download all of them, yes
 
+        # Check it before downloading, because chapters are downloaded in batches
+        new_download = tracker.disabled or tracker.empty
+
+        # Downloaded chapters, loaded once for all batches
+        files_info = None
+        if not new_download:
+            files_info = {fi.ch_id: fi for fi in tracker.get_all_files_info()}
+            pbm.logger.info("Checking new chapters and verifying downloaded chapters...")
+
         log.info("Preparing to download...")
-        cache = []
-        cache.extend(manga.chapters.iter(**self.kwargs_iter))
+        for cache in self.iter_chapters_batches():
+            # There is no existing (downloaded) chapters
+            # Download all of them
+            if new_download:
+                self.download_chapters(cache)
+            else:
+                self.update_chapters(cache, files_info)
 
-        # There is no existing (downloaded) chapters
-        # Download all of them
-        if tracker.disabled or tracker.empty:
-            self.download_chapters(cache)
+        pbm.logger.info("Waiting for chapter read marker to finish")
+        self.cleanup()
 
-            pbm.logger.info("Waiting for chapter read marker to finish")
-            self.cleanup()
-            return
+    def _update_files_info(self, files_info, chapters):
+        """Reload file info of downloaded chapters from the tracker"""
+        for chap_class, _ in chapters:
+            filename = get_filename(
+                self.manga, chap_class, self.file_ext, format="chapter"
+            )
+            file_info = self.manga.tracker.get(filename)
+            if file_info is not None:
+                files_info[chap_class.id] = file_info
 
-        files_info = tracker.get_all_files_info()
+    def update_chapters(self, cache, files_info):
+        """Download new chapters and verify downloaded chapters
 
-        chapters = []
-        existing_chapter_ids = [i.ch_id for i in files_info]
-        # Check for new chapters in existing (downloaded) chapters
+        ``files_info`` is dict of chapter id and file info from the tracker,
+        it's updated after the chapters are downloaded
+        """
+        new_chapters = []
+        downloaded_chapters = []
         for chap_class, images in cache:
-            if chap_class.id in existing_chapter_ids:
-                continue
-
-            # There is new chapters
-            chapters.append((chap_class, images))
+            if chap_class.id in files_info:
+                downloaded_chapters.append((chap_class, images))
+            else:
+                new_chapters.append((chap_class, images))
 
-        if chapters:
-            pbm.logger.info(f"Found {len(chapters)} new chapter(s), downloading...")
+        if new_chapters:
+            pbm.logger.info(f"Found {len(new_chapters)} new chapter(s), downloading...")
 
             # Download the new chapters first
-            self.download_chapters(chapters)
+            self.download_chapters(new_chapters)
+            self._update_files_info(files_info, new_chapters)
 
         chapters = []
-        files_info = tracker.get_all_files_info()
 
         # Verify downloaded chapters
-        pbm.logger.info("Verifying downloaded chapters...")
-        for chap_class, images in cache:
-            filename = get_filename(manga, chap_class, self.file_ext, format="chapter")
+        for chap_class, images in downloaded_chapters:
+            file_info = files_info[chap_class.id]
 
-            for file_info in files_info:
-                if filename != file_info.name:
-                    continue
+            # Verified or downloaded in previous (interrupted) run
+            if self.check_chapter_journal(chap_class):
+                pbm.logger.info(
+                    f"{file_info.name!r} is completed in previous run, skipping verification"
+                )
+                self.mark_read_chapter(chap_class)
+                continue
 
-                ignored = self.config.ignore_missing_chapters
-                passed = verify_sha256(file_info.hash, (self.path / file_info.name))
-                if not ignored and not passed:
-                    pbm.logger.warning(
-                        f"{file_info.name!r} is missing or unverified (hash is not matching)"
-                    )
-                    # Either missing file or hash is not matching
-                    chapters.append((chap_class, images))
-                    delete_file(self.path / file_info.name)
-                elif passed:
-                    pbm.logger.info(
-                        f"{file_info.name!r} is verified and no need to re-download"
-                    )
-                    self.mark_read_chapter(chap_class)
-                elif ignored and not passed:
-                    pbm.logger.info(
-                        f"{file_info.name!r} is missing but got ignored, "
-                        "since --ignore-missing-chapters is set"
-                    )
+            ignored = self.config.ignore_missing_chapters
+            passed = self.verify_file(file_info, (self.path / file_info.name))
+            if not ignored and not passed:
+                pbm.logger.warning(
+                    f"{file_info.name!r} is missing or unverified (hash is not matching)"
+                )
+                # Either missing file or hash is not matching
+                chapters.append((chap_class, images))
+                delete_file(self.path / file_info.name)
+            elif passed:
+                pbm.logger.info(
+                    f"{file_info.name!r} is verified and no need to re-download"
+                )
+                self.mark_read_chapter(chap_class)
+                self.add_chapter_journal(chap_class)
+            elif ignored and not passed:
+                pbm.logger.info(
+                    f"{file_info.name!r} is missing but got ignored, "
+                    "since --ignore-missing-chapters is set"
+                )
 
         if chapters:
             pbm.logger.warning(
@@ -596,9 +786,7 @@ class ConvertedChaptersFormat(BaseConvertedFormat):
 
             # Download missing or unverified chapters
             self.download_chapters(chapters)
-
-        pbm.logger.info("Waiting for chapter read marker to finish")
-        self.cleanup()
+            self._update_files_info(files_info, chapters)
 
 
 class ConvertedVolumesFormat(BaseConvertedFormat):
@@ -697,6 +885,62 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
         else:
             pbm.get_convert_pb().close()
 
+    def update_volume(self, file_info, volume, chapters, existing_pages):
+        """Append new chapters to existing volume file"""
+        exist_chapter_ids = [i.id for i in file_info.chapters]
+        new_chapters = [(c, i) for c, i in chapters if c.id not in exist_chapter_ids]
+
+        total = self.get_total_pages_for_volume_fmt(chapters)
+        count = NumberWithLeadingZeros(total)
+        count.increase(existing_pages)
+        images = []
+
+        placeholder_obj = self.create_placeholder_obj_for_volume_fmt(volume, chapters)
+        volume_name = self.get_volume_name(volume)
+        filename = get_filename(
+            self.manga, placeholder_obj, self.file_ext, format="volume"
+        )
+        file_path = self.path / filename
+
+        self.rename_existing_file(file_info.name, filename)
+
+        pbm.logger.info(
+            f"Appending {len(new_chapters)} new chapters to {filename!r}..."
+        )
+
+        pbm.set_chapters_total(len(new_chapters))
+        chapters_pb = pbm.get_chapters_pb()
+
+        # Create volume folder
+        volume_path = create_directory(volume_name, self.path)
+
+        self.incremental_pages = existing_pages
+        self.on_prepare(file_path, volume, count)
+
+        for chap_class, chap_images in new_chapters:
+            self.on_iter_chapter(file_path, chap_class, count)
+
+            ims = self.get_images(chap_class, chap_images, volume_path, count)
+            images.extend(ims)
+
+            self.on_received_images(file_path, chap_class, ims)
+            chapters_pb.update(1)
+            pbm.get_pages_pb().reset()
+
+        chapters_pb.reset()
+        self.on_convert(file_path, volume, images)
+        self.incremental_pages = None
+
+        # Remove original chapter folder
+        shutil.rmtree(volume_path, ignore_errors=True)
+
+        self.add_fi(filename, None, file_path, chapters, volume)
+
+        if pbm.stacked:
+            pbm.get_convert_pb().reset()
+        else:
+            pbm.get_convert_pb().close()
+
     def main(self):
         self.create_worker()
 
@@ -709,6 +953,7 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
 
         # Steps for existing (downloaded) volumes:
         # - Check for new chapters.
+        # - Append new chapters to the volume (if --incremental-update is enabled)
         # - Re-download the volume that has new chapters (if available)
         # - Verify downloaded volumes
 
@@ -727,6 +972,7 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
             return
 
         volumes = {}
+        updated_volumes = {}
         new_volumes_files_info = []
         # Check for new chapters in existing (downloaded) volumes
         for volume, chapters in cache.items():
@@ -744,8 +990,14 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
                     continue
 
                 # New chapters detected
-                volumes[volume] = chapters
-                new_volumes_files_info.append(file_info)
+                existing_pages = self.check_incremental_update(
+                    file_info, chapters, self.get_total_pages_for_volume_fmt(chapters)
+                )
+                if existing_pages is not None:
+                    updated_volumes[volume] = (file_info, chapters, existing_pages)
+                else:
+                    volumes[volume] = chapters
+                    new_volumes_files_info.append(file_info)
 
                 break
 
@@ -755,6 +1007,10 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
             path = self.path / file_info.name
             delete_file(path)
 
+        # Append new chapters to existing volumes
+        for volume, (file_info, chapters, existing_pages) in updated_volumes.items():
+            self.update_volume(file_info, volume, chapters, existing_pages)
+
         # Re-download the volumes
         if volumes:
             self.download_volumes(volumes)
@@ -776,7 +1032,7 @@ class ConvertedVolumesFormat(BaseConvertedFormat):
                     continue
 
                 path = self.path / file_info.name
-                passed = verify_sha256(file_info.hash, path)
+                passed = self.verify_file(file_info, path)
                 ignored = self.config.ignore_missing_chapters
                 if not ignored and not passed:
                     pbm.logger.warning(
@@ -892,6 +1148,55 @@ class ConvertedSingleFormat(BaseConvertedFormat):
 
         self.add_fi(filename, None, file_path, data)
 
+    def update_single(self, file_info, total, data, existing_pages):
+        """Append new chapters to existing file"""
+        images = []
+        count = NumberWithLeadingZeros(total)
+        count.increase(existing_pages)
+        self.manga.tracker.init_write_mode()
+
+        placeholder_obj = self.create_placeholder_obj_for_single_fmt(data)
+        filename = get_filename(
+            self.manga, placeholder_obj, self.file_ext, format="single"
+        )
+        file_path = self.path / filename
+
+        self.rename_existing_file(file_info.name, filename)
+
+        new_chapters = [(c, i) for c, i in data if c.id not in file_info.chapters]
+        pbm.logger.info(
+            f"Appending {len(new_chapters)} new chapters to {filename!r}..."
+        )
+
+        path = create_directory(os.path.splitext(filename)[0], self.path)
+
+        self.incremental_pages = existing_pages
+        self.on_prepare(file_path, path)
+
+        pbm.set_chapters_total(len(new_chapters))
+        chapters_pb = pbm.get_chapters_pb()
+
+        # Begin downloading
+        for chap_class, chap_images in new_chapters:
+            self.on_iter_chapter(file_path, chap_class, count)
+
+            ims = self.get_images(chap_class, chap_images, path, count)
+            self.on_received_images(file_path, chap_class, ims)
+            images.extend(ims)
+
+            chapters_pb.update(1)
+            pbm.get_pages_pb().reset()
+
+        chapters_pb.reset()
+        self.on_finish(file_path, images)
+        self.incremental_pages = None
+        pbm.get_convert_pb().close()
+
+        # Remove downloaded images
+        shutil.rmtree(path, ignore_errors=True)
+
+        self.add_fi(filename, None, file_path, data)
+
     def main(self):
         manga = self.manga
         tracker = self.manga.tracker
@@ -911,6 +1216,7 @@ class ConvertedSingleFormat(BaseConvertedFormat):
 
         # Steps for existing (downloaded) file (single format):
         # - Check for new chapters.
+        # - Append new chapters to the file (if --incremental-update is enabled)
         # - Re-download the entire file (if there is new chapters)
         # - Verify downloaded file
 
@@ -928,23 +1234,39 @@ class ConvertedSingleFormat(BaseConvertedFormat):
             self.cleanup()
             return
 
-        file_info = tracker.get_all_files_info()
+        files_info = tracker.get_all_files_info()
         placeholder_obj = self.create_placeholder_obj_for_single_fmt(cache)
         filename = get_filename(
             self.manga, placeholder_obj, self.file_ext, format="single"
         )
         file_info = tracker.get(filename)
+        if file_info is None and len(files_info) == 1:
+            # Filename is changed because of new chapters
+            # (ex: `{chapters.last}` placeholder is used in --filename-single)
+            file_info = files_info[0]
+
+        exist_chapters = file_info.chapters if file_info is not None else []
         chapters = []
         # Check for new chapters in existing (downloaded) file
         for chap_class, images in cache:
-            if chap_class.id in file_info.chapters:
+            if chap_class.id in exist_chapters:
                 continue
 
             # New chapters deteceted
             chapters.append((chap_class, images))
 
+        existing_pages = None
+        if chapters and file_info is not None:
+            existing_pages = self.check_incremental_update(file_info, cache, total)
+
         # Download the new chapters first
-        if chapters:
+        if chapters and existing_pages is not None:
+            self.update_single(file_info, total, cache, existing_pages)
+        elif chapters:
+            if file_info is not None and file_info.name != filename:
+                delete_file(self.path / file_info.name)
+                tracker.remove_file_info_from_name(file_info.name)
+
             delete_file(self.path / filename)
             self.download_single(total, cache)
 
@@ -952,7 +1274,7 @@ class ConvertedSingleFormat(BaseConvertedFormat):
         file_info = tracker.get(filename)
 
         ignored = self.config.ignore_missing_chapters
-        passed = verify_sha256(file_info.hash, (self.path / filename))
+        passed = self.verify_file(file_info, (self.path / filename))
         if not ignored and not passed:
             pbm.logger.warning(
                 f"{filename!r} is missing or unverified (hash is not matching), "
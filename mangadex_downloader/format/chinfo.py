@@ -22,6 +22,7 @@
 
 import sys
 import textwrap
+from functools import lru_cache
 from pathlib import Path
 
 from ..utils import get_cover_art_url
@@ -57,6 +58,8 @@ fonts = {
 }
 
 
+# Fonts are loaded from disk, and there is only a few of them
+@lru_cache(maxsize=32)
 def load_font(type, size):
     font = fonts[type]
     loc = str(font.resolve())
@@ -88,11 +91,15 @@ def draw_multiline_text(font, image, text, width_pos, height_pos, split_size):
     )
 
 
-def get_chapter_info(manga, cover, chapter):
-    cover_url = get_cover_art_url(manga.id, cover, "original")
+# Chapters in the same volume are using the same cover,
+# keep a few of them so the cover is downloaded and rendered once.
+# Each image is around 6 MB in memory
+@lru_cache(maxsize=8)
+def _get_background(cover_url):
     r = Net.mangadex.get(cover_url, stream=True)
     image = Image.open(r.raw)
     image = image.convert("RGBA")
+    r.close()
 
     # resize image to fixed 1000px width (keeping aspect ratio)
     # so font sizes and text heights match for all covers
@@ -106,6 +113,22 @@ def get_chapter_info(manga, cover, chapter):
     image = image.filter(ImageFilter.GaussianBlur(6))
     image = ImageEnhance.Brightness(image).enhance(0.3)
 
+    return image
+
+
+@lru_cache(maxsize=1)
+def _get_logo():
+    logo = base_path / "images/mangadex-logo.png"
+    logo_image = Image.open(logo)
+    return logo_image.convert("RGBA").resize((120, 120))
+
+
+def get_chapter_info(manga, cover, chapter):
+    cover_url = get_cover_art_url(manga.id, cover, "original")
+
+    # Cached image must not be modified
+    image = _get_background(cover_url).copy()
+
     title_text = chapter.manga_title
     if len(title_text) > 85:
         title_font = load_font("bold", size=80)
@@ -162,9 +185,7 @@ def get_chapter_info(manga, cover, chapter):
             split_size=30,
         )
 
-    logo = base_path / "images/mangadex-logo.png"
-    logo_image = Image.open(logo)
-    logo_image = logo_image.convert("RGBA").resize((120, 120))
+    logo_image = _get_logo()
     image.alpha_composite(
         im=logo_image, dest=(40, (image.height - (logo_image.height + 30)))
     )
@@ -27,6 +27,7 @@ import xml.etree.ElementTree as ET
 
 from .base import ConvertedChaptersFormat, ConvertedVolumesFormat, ConvertedSingleFormat
 from .utils import get_chapter_info, get_volume_cover
+from .zip_writer import ImageZipFile
 from ..utils import create_directory
 from ..progress_bar import progress_bar_manager as pbm
 
@@ -131,19 +132,57 @@ class CBZFile:
         pbm.set_convert_total(len(images))
         progress_bar = pbm.get_convert_pb(recreate=not pbm.stacked)
 
-        for im_path in images:
-            zip_obj.write(im_path, im_path.name)
-            progress_bar.update(1)
+        zip_obj.write_files(
+            ((im_path, im_path.name) for im_path in images),
+            callback=lambda: progress_bar.update(1),
+        )
 
         zip_obj.close()
 
     def check_dependecies(self):
         pass
 
+    def get_existing_total_pages(self, path, total):
+        with zipfile.ZipFile(path) as zip_obj:
+            pages = sorted(i for i in zip_obj.namelist() if i != "ComicInfo.xml")
+
+        if not pages:
+            return None
+
+        # Page names are using leading zeros based on total pages
+        # and it must be consistent across the file
+        digits = len(os.path.splitext(pages[0])[0])
+        if digits != len(str(total)):
+            pbm.logger.debug(
+                f"Number of page digits in {path.name!r} is changed, "
+                "cannot append new chapters"
+            )
+            return None
+
+        return len(pages)
+
+    def get_file_manifest(self, path):
+        """Get CRC32 and size of every entry in the archive
+
+        Only central directory is read, the data is not
+        """
+        with zipfile.ZipFile(path) as zip_obj:
+            return {
+                info.filename: f"{info.CRC:08x}:{info.file_size}"
+                for info in zip_obj.infolist()
+            }
+
+    def remove_zip_entry(self, zip_obj, name):
+        # zipfile cannot delete a file from archive,
+        # so we remove it from central directory instead.
+        # The old data is still in the archive but it's not referenced anymore
+        info = zip_obj.NameToInfo.pop(name)
+        zip_obj.filelist.remove(info)
+
     def make_zip(self, path):
         from ..config import env
 
-        return zipfile.ZipFile(
+        return ImageZipFile(
             path,
             "a" if os.path.exists(path) else "w",
             compression=env.zip_compression_type,
@@ -155,11 +194,7 @@ class CBZFile:
         img_path = path / img_name
 
         # Make sure we never duplicated it
-        write_ch_info_image = False
-        try:
-            zip_obj.getinfo(img_name)
-        except KeyError:
-            write_ch_info_image = self.config.use_chapter_cover
+        write_ch_info_image = self.config.use_chapter_cover and img_name not in zip_obj
 
         # Insert chapter info (cover) image
         if write_ch_info_image:
@@ -173,11 +208,7 @@ class CBZFile:
         img_name = count.get() + ".png"
         img_path = path / img_name
 
-        write_vol_cover = False
-        try:
-            zip_obj.getinfo(img_name)
-        except KeyError:
-            write_vol_cover = self.config.use_volume_cover
+        write_vol_cover = self.config.use_volume_cover and img_name not in zip_obj
 
         if write_vol_cover:
             get_volume_cover(self.manga, volume, img_path, self.replace)
@@ -196,9 +227,18 @@ class CBZFile:
 
         # Write 'ComicInfo.xml' to .cbz file
         # And make sure that we don't write it twice or more
-        if "ComicInfo.xml" not in zip_obj.namelist():
+        exist = "ComicInfo.xml" in zip_obj
+
+        # New chapters is appended to existing file,
+        # 'ComicInfo.xml' must be updated (total pages)
+        rewrite = exist and self.incremental_pages is not None
+
+        if not exist or rewrite:
 
             def wrap():
+                if rewrite:
+                    self.remove_zip_entry(zip_obj, "ComicInfo.xml")
+
                 return zip_obj.writestr("ComicInfo.xml", ET.tostring(xml_data))
 
             # KeyboardInterrupt safe
@@ -221,12 +261,19 @@ class ComicBookArchive(ConvertedChaptersFormat, CBZFile):
 
 
 class ComicBookArchiveVolume(ConvertedVolumesFormat, CBZFile):
+    support_incremental_update = True
+
     def on_prepare(self, file_path, volume, count):
         volume_name = self.get_volume_name(volume)
         self.volume_zip = self.make_zip(file_path)
         self.volume_path = create_directory(volume_name, self.path)
         self.total_pages = 0
 
+        if self.incremental_pages is not None:
+            # Existing volume file, volume cover is already written
+            self.total_pages = self.incremental_pages
+            return
+
         if self.config.use_volume_cover:
             self.total_pages += 1
 
@@ -249,10 +296,12 @@ class ComicBookArchiveVolume(ConvertedVolumesFormat, CBZFile):
 
 
 class ComicBookArchiveSingle(ConvertedSingleFormat, CBZFile):
+    support_incremental_update = True
+
     def on_prepare(self, file_path, base_path):
         self.images_directory = base_path
         self.zip = self.make_zip(file_path)
-        self.total_pages = 0
+        self.total_pages = self.incremental_pages or 0
 
     def on_iter_chapter(self, file_path, chapter, count):
         if self.config.use_chapter_cover:
@@ -23,273 +23,308 @@
 import os
 import zipfile
 import logging
-from importlib.util import find_spec
 from .utils import get_volume_cover
+from .zip_writer import ImageZipFile
 from .base import ConvertedChaptersFormat, ConvertedVolumesFormat, ConvertedSingleFormat
 
 from ..utils import create_directory
 from ..progress_bar import progress_bar_manager as pbm
 
 
-class EpubMissingDependencies(Exception):
-    """Raised when `lxml` and `bs4` is not installed"""
+log = logging.getLogger(__name__)
+
+# Magic bytes for images that MangaDex is serving
+_image_signatures = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+]
+
+_xhtml_template = (
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.1//EN" '
+    '"http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd">\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml">\n'
+    " <head>\n"
+    "  <title>\n"
+    "{title}"
+    "  </title>\n"
+    " </head>\n"
+    " <body>\n"
+    "  <div>\n"
+    "   <img{img_attrs}/>\n"
+    "  </div>\n"
+    " </body>\n"
+    "</html>\n"
+)
+
+_container_xml = (
+    '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">\n'
+    " <rootfiles>\n"
+    '  <rootfile full-path="OEBPS/content.opf" '
+    'media-type="application/oebps-package+xml">\n'
+    "  </rootfile>\n"
+    " </rootfiles>\n"
+    "</container>\n"
+)
+
+
+def _escape(text):
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _make_attrs(attrs):
+    """Make XML attributes string, attributes are sorted by name"""
+    result = ""
+    for name, value in sorted(attrs.items()):
+        value = _escape(value)
+
+        if '"' not in value:
+            value = f'"{value}"'
+        elif "'" not in value:
+            value = f"'{value}'"
+        else:
+            value = '"' + value.replace('"', "&quot;") + '"'
+
+        result += f" {name}={value}"
+
+    return result
+
+
+def _make_text(text, depth):
+    """Make indented text line, empty text is omitted"""
+    text = text.strip()
+    if not text:
+        return ""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__("`lxml`, `bs4` and `Pillow` is not installed")
+    return " " * depth + _escape(text) + "\n"
 
 
-try:
-    lxml_exist = find_spec("lxml")
-    if not lxml_exist:
-        raise ImportError("lxml package is not found")
+def _make_element(name, attrs=None, text="", depth=0):
+    """Make indented XML element that has no child elements"""
+    indent = " " * depth
+    return (
+        f"{indent}<{name}{_make_attrs(attrs or {})}>\n"
+        f"{_make_text(text, depth + 1)}"
+        f"{indent}</{name}>\n"
+    )
+
+
+def get_image_mime_type(path):
+    """Get MIME type of an image from the magic bytes
+
+    Only first few bytes of the image is read,
+    Pillow is used for unknown image formats.
+    """
+    with open(path, "rb") as reader:
+        header = reader.read(12)
+
+    for signature, mime_type in _image_signatures:
+        if header.startswith(signature):
+            return mime_type
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
 
-    from bs4 import BeautifulSoup, Doctype
     from PIL import Image
-except ImportError:
-    epub_ready = False
-else:
-    epub_ready = True
 
-log = logging.getLogger(__name__)
+    with Image.open(path) as im:
+        return Image.MIME.get(im.format)
 
 
 # Inspired from https://github.com/manga-download/hakuneko/blob/master/src/web/mjs/engine/EbookGenerator.mjs
-# TODO: Add doc for this class
 class EpubPlugin:
-    def __init__(self, manga, lang, file_id = ""):
+    """Write EPUB file chapter by chapter
+
+    Call :meth:`open()` first, then :meth:`create_page()` for every chapter.
+    XHTML pages and images are written to the file right away,
+    :meth:`close()` will write table of contents and .opf document.
+    """
+
+    def __init__(self, manga, lang, file_id=""):
         self.manga = manga
         self.id = manga.id
         self.title = f"{manga.title}, {file_id}" if file_id else manga.title
         self.lang = lang
 
         self._chapter_pos = 0
-        self._chapters = {}
+        self._zip = None
+        self._progress_bar = None
+        self._total_images = 0
 
-        # Container.xml
-        self._container = None
-        self._make_container()
+        # Documents are written as plain strings,
+        # building DOM for every pages is too slow for big volumes
 
         # for .opf document
-        self._opf_root = None
-        self._manifest = None
-        self._spine = None
+        self._metadata = ""
+        self._manifest = []
+        self._spine = []
         self._make_opf()
 
         # toc.ncx
-        self._toc_root = None
-        self._navigation = None
-        self._make_toc()
-
-    def _make_toc(self):
-        root = self._get_root()
-        self._toc_root = root
-
-        # <ncx>
-        ncx = root.new_tag(
-            "ncx",
-            attrs={
-                "xmlns": "http://www.daisy.org/z3986/2005/ncx/",
-                "version": "2005-1",
-                "xmlns:ncx": "http://www.daisy.org/z3986/2005/ncx/",
-            },
-        )
-        root.append(ncx)
-
-        # <head>
-        head = root.new_tag("head")
-        meta_tag = root.new_tag("meta", attrs={"name": "dtb:uid", "content": self.id})
-        head.append(meta_tag)
-        ncx.append(head)
-
-        # <docTitle>
-        doc_title = root.new_tag("docTitle")
-        text_tag = root.new_tag("text")
-        text_tag.string = self.title
-        doc_title.append(text_tag)
-        ncx.append(doc_title)
-
-        # <navMap>
-        nav = root.new_tag("navMap")
-        ncx.append(nav)
-        self._navigation = nav
+        self._navigation = []
 
     def _make_opf(self):
-        root = self._get_root()
-        self._opf_root = root
-
-        package = root.new_tag(
-            "package",
-            attrs={
-                "xmlns": "http://www.idpf.org/2007/opf",
-                "unique-identifier": self.id,
-                "version": "2.0",
-            },
-        )
-        root.append(package)
-
-        # <metadata>
-        metadata = root.new_tag(
-            "metadata",
-            attrs={
-                "xmlns:dc": "http://purl.org/dc/elements/1.1/",
-                "xmlns:opf": "http://www.idpf.org/2007/opf",
-            },
-        )
-        dc_title = root.new_tag("dc:title")
-        dc_title.string = self.title
-        dc_language = root.new_tag("dc:language")
-        dc_language.string = self.lang
-        dc_id = root.new_tag(
-            "dc:identifier", attrs={"id": self.id, "opf:scheme": "UUID"}
-        )
-        dc_id.string = self.id
+        metadata = ""
 
         # Tags
         for tag in self.manga.tags:
-            dc_tag = root.new_tag("dc:subject")
-            dc_tag.string = tag.name
-            metadata.append(dc_tag)
+            metadata += _make_element("dc:subject", text=tag.name, depth=2)
 
         # Authors
-        authors = ""
-        for index, author in enumerate(self.manga.authors):
-            if index < (len(self.manga.authors) - 1):
-                authors += author + ","
-            else:
-                # If this is last index, append author without comma
-                authors += author
-        dc_authors = root.new_tag("dc:creator")
-        dc_authors.string = authors
-        metadata.append(dc_authors)
-
-        metadata.append(dc_title)
-        metadata.append(dc_language)
-        metadata.append(dc_id)
-        package.append(metadata)
-
-        # <manifest>
-        manifest = root.new_tag("manifest")
-        ncx_tag = root.new_tag(
-            "item",
-            attrs={
-                "id": "ncx",
-                "href": "toc.ncx",
-                "media-type": "application/x-dtbncx+xml",
-            },
+        authors = ",".join(self.manga.authors)
+        metadata += _make_element("dc:creator", text=authors, depth=2)
+
+        metadata += _make_element("dc:title", text=self.title, depth=2)
+        metadata += _make_element("dc:language", text=self.lang, depth=2)
+        metadata += _make_element(
+            "dc:identifier",
+            attrs={"id": self.id, "opf:scheme": "UUID"},
+            text=self.id,
+            depth=2,
         )
-        manifest.append(ncx_tag)
-        package.append(manifest)
-        self._manifest = manifest
-
-        # <spine>
-        spine = root.new_tag("spine", attrs={"toc": "ncx"})
-        package.append(spine)
-        self._spine = spine
+        self._metadata = metadata
 
-    def _get_root(self):
-        return BeautifulSoup("", "lxml")
+        self._manifest.append(
+            _make_element(
+                "item",
+                attrs={
+                    "id": "ncx",
+                    "href": "toc.ncx",
+                    "media-type": "application/x-dtbncx+xml",
+                },
+                depth=2,
+            )
+        )
 
-    def _create_nav_point(self, _id, text, src=None, parent=None):
-        navpoint_kwargs = {
-            "id": _id,
+    def _get_opf(self):
+        package_attrs = {
+            "xmlns": "http://www.idpf.org/2007/opf",
+            "unique-identifier": self.id,
+            "version": "2.0",
         }
+        metadata_attrs = {
+            "xmlns:dc": "http://purl.org/dc/elements/1.1/",
+            "xmlns:opf": "http://www.idpf.org/2007/opf",
+        }
+
+        return (
+            f"<package{_make_attrs(package_attrs)}>\n"
+            f" <metadata{_make_attrs(metadata_attrs)}>\n"
+            f"{self._metadata}"
+            " </metadata>\n"
+            " <manifest>\n"
+            f"{''.join(self._manifest)}"
+            " </manifest>\n"
+            f" <spine{_make_attrs({'toc': 'ncx'})}>\n"
+            f"{''.join(self._spine)}"
+            " </spine>\n"
+            "</package>\n"
+        )
 
-        toc = self._toc_root.new_tag("navPoint", attrs=navpoint_kwargs)
-        toc_label = self._toc_root.new_tag("navLabel")
-        toc_text = self._toc_root.new_tag("text")
-        toc_text.string = text
-        toc_label.append(toc_text)
-        toc.append(toc_label)
+    def _get_toc(self):
+        ncx_attrs = {
+            "xmlns": "http://www.daisy.org/z3986/2005/ncx/",
+            "version": "2005-1",
+            "xmlns:ncx": "http://www.daisy.org/z3986/2005/ncx/",
+        }
+        meta_attrs = {"name": "dtb:uid", "content": self.id}
+
+        return (
+            f"<ncx{_make_attrs(ncx_attrs)}>"
+            f"<head><meta{_make_attrs(meta_attrs)}/></head>"
+            f"<docTitle><text>{_escape(self.title)}</text></docTitle>"
+            f"<navMap>{''.join(self._navigation)}</navMap>"
+            "</ncx>"
+        )
 
+    def _create_nav_point(self, _id, text, src=None, children=""):
+        content = ""
         if src:
-            toc_content = self._toc_root.new_tag("content", attrs={"src": src})
-            toc.append(toc_content)
+            content = f"<content{_make_attrs({'src': src})}></content>"
 
-        if parent:
-            # If "parent" parameter is given
-            # append created element to parent element
-            parent.append(toc)
-        else:
-            return toc
+        return (
+            f"<navPoint{_make_attrs({'id': _id})}>"
+            f"<navLabel><text>{_escape(text)}</text></navLabel>"
+            f"{content}{children}"
+            "</navPoint>"
+        )
 
     def _create_manifest_item(self, chapter_pos, page, image):
         im_name = os.path.basename(image)
-        im = Image.open(image)
-
-        xhtml_item = self._opf_root.new_tag(
-            "item",
-            attrs={
-                "id": f"XHTML_{chapter_pos}_{page}",
-                "href": f"xhtml/{chapter_pos}_{page}.xhtml",
-                "media-type": "application/xhtml+xml",
-            },
+
+        self._manifest.append(
+            _make_element(
+                "item",
+                attrs={
+                    "id": f"XHTML_{chapter_pos}_{page}",
+                    "href": f"xhtml/{chapter_pos}_{page}.xhtml",
+                    "media-type": "application/xhtml+xml",
+                },
+                depth=2,
+            )
         )
-        img_item = self._opf_root.new_tag(
-            "item",
-            attrs={
-                "id": f"IMAGES_{chapter_pos}_{page}",
-                "href": f"images/{chapter_pos}_{im_name}",
-                "media-type": Image.MIME.get(im.format),
-            },
+        self._manifest.append(
+            _make_element(
+                "item",
+                attrs={
+                    "id": f"IMAGES_{chapter_pos}_{page}",
+                    "href": f"images/{chapter_pos}_{im_name}",
+                    "media-type": get_image_mime_type(image),
+                },
+                depth=2,
+            )
         )
-        im.close()
-
-        self._manifest.append(xhtml_item)
-        self._manifest.append(img_item)
 
     def _create_spine_item(self, chapter_pos, page):
-        item = self._opf_root.new_tag(
-            "itemref", attrs={"idref": f"XHTML_{chapter_pos}_{page}"}
+        self._spine.append(
+            _make_element(
+                "itemref", attrs={"idref": f"XHTML_{chapter_pos}_{page}"}, depth=2
+            )
         )
-        self._spine.append(item)
 
-    def create_page(self, title, images):
-        # This was supposed to be navigation for first page
-        # the first page was hardcoded
-        nav = self._create_nav_point(
-            f"TOC_{self._chapter_pos}_INIT", title, f"xhtml/{self._chapter_pos}_1.xhtml"
+    def open(self, path):
+        from ..config import env
+
+        pbm.set_convert_total(0)
+        self._progress_bar = pbm.get_convert_pb(recreate=not pbm.stacked)
+
+        self._zip = ImageZipFile(
+            path,
+            "w",
+            compression=env.zip_compression_type,
+            compresslevel=env.zip_compression_level,
         )
-        xhtml = []
 
-        for page, im_path in enumerate(images, start=1):
-            image = os.path.basename(im_path)
-            root = self._get_root()
+        # EPUB readers are expecting uncompressed "mimetype" as first file
+        self._zip.writestr(
+            "mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED
+        )
 
-            # Make doctype
-            doctype = Doctype.for_name_and_ids(
-                "html",
-                "-//W3C//DTD XHTML 1.1//EN",
-                "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd",
-            )
-            root.append(doctype)
+        # Write container
+        self._zip.writestr("META-INF/container.xml", _container_xml)
 
-            html_root = root.new_tag(
-                "html", attrs={"xmlns": "http://www.w3.org/1999/xhtml"}
-            )
+    def create_page(self, title, images):
+        """Write chapter pages and images to EPUB file"""
+        self._total_images += len(images)
+        pbm.set_convert_total(self._total_images)
 
-            # Head document
-            head_root = root.new_tag("head")
-            title_tag = root.new_tag("title")
-            title_tag.string = title
-            head_root.append(title_tag)
-
-            # Body document
-            body_root = root.new_tag("body")
-            div_tag = root.new_tag("div")
-            img_tag = root.new_tag(
-                "img",
-                attrs={
-                    "alt": image,
-                    "src": f"../images/{self._chapter_pos}_{image}",
-                },
-            )
-            div_tag.append(img_tag)
-            body_root.append(div_tag)
+        page_navs = ""
 
-            # HTML root
-            html_root.append(head_root)
-            html_root.append(body_root)
-            root.append(html_root)
+        for page, im_path in enumerate(images, start=1):
+            image = os.path.basename(im_path)
+            img_attrs = {
+                "alt": image,
+                "src": f"../images/{self._chapter_pos}_{image}",
+            }
+
+            self._zip.writestr(
+                f"OEBPS/xhtml/{self._chapter_pos}_{page}.xhtml",
+                _xhtml_template.format(
+                    title=_make_text(title, 3), img_attrs=_make_attrs(img_attrs)
+                ),
+            )
 
             self._create_manifest_item(self._chapter_pos, page, im_path)
             self._create_spine_item(self._chapter_pos, page)
@@ -297,103 +332,83 @@ class EpubPlugin:
             # Create nested "navPoint" in parent "navPoint" element
             # For images navigation
             xhtml_path = f"xhtml/{self._chapter_pos}_{page}"
-            self._create_nav_point(
+            page_navs += self._create_nav_point(
                 _id=f"TOC_{self._chapter_pos}_{page}",
                 text=f"Page {page}",
                 src=xhtml_path,
-                parent=nav,
             )
 
-            xhtml.append(root)
-
-        self._navigation.append(nav)
-
-        self._chapters[self._chapter_pos] = [xhtml, images]
-
-        self._chapter_pos += 1
-
-    def _make_container(self):
-        root = self._get_root()
-        container_tag = root.new_tag(
-            "container",
-            attrs={
-                "version": "1.0",
-                "xmlns": "urn:oasis:names:tc:opendocument:xmlns:container",
-            },
-        )
-        rootfiles_tag = root.new_tag("rootfiles")
-        rootfile_tag = root.new_tag(
-            "rootfile",
-            attrs={
-                "full-path": "OEBPS/content.opf",
-                "media-type": "application/oebps-package+xml",
-            },
+        self._zip.write_files(
+            (
+                (im_path, f"OEBPS/images/{self._chapter_pos}_{os.path.basename(im_path)}")
+                for im_path in images
+            ),
+            callback=lambda: self._progress_bar.update(1),
         )
 
-        rootfiles_tag.append(rootfile_tag)
-        container_tag.append(rootfiles_tag)
-        root.append(container_tag)
-
-        self._container = root
-
-    def write(self, path):
-        from ..config import env
-
-        # Calculate all images and set it to progress bar convert total
-        total_images = 0
-        for _, (_, images) in self._chapters.items():
-            total_images += len(images)
-
-        pbm.set_convert_total(total_images)
-        progress_bar = pbm.get_convert_pb(recreate=not pbm.stacked)
-
-        with zipfile.ZipFile(
-            path,
-            "a" if os.path.exists(path) else "w",
-            compression=env.zip_compression_type,
-            compresslevel=env.zip_compression_level,
-        ) as zip_obj:
-            # Write MIMETYPE
-            zip_obj.writestr("mimetype", "application/epub+zip")
-
-            # Write container
-            zip_obj.writestr("META-INF/container.xml", self._container.prettify())
-
-            # Write table of contents
-            zip_obj.writestr("OEBPS/toc.ncx", str(self._toc_root))
+        # This was supposed to be navigation for first page
+        # the first page was hardcoded
+        self._navigation.append(
+            self._create_nav_point(
+                f"TOC_{self._chapter_pos}_INIT",
+                title,
+                f"xhtml/{self._chapter_pos}_1.xhtml",
+                children=page_navs,
+            )
+        )
 
-            # Write .opf document
-            zip_obj.writestr("OEBPS/content.opf", self._opf_root.prettify())
+        self._chapter_pos += 1
 
-            # Write XHTML and images
-            for chapter, (xhtml, images) in self._chapters.items():
-                for page, content in enumerate(xhtml, start=1):
-                    zip_obj.writestr(
-                        f"OEBPS/xhtml/{chapter}_{page}.xhtml", content.prettify()
-                    )
+    def close(self):
+        """Write table of contents and .opf document and close the EPUB file"""
+        # Write table of contents
+        self._zip.writestr("OEBPS/toc.ncx", self._get_toc())
 
-                for page, image in enumerate(images, start=1):
-                    zip_obj.write(
-                        image, f"OEBPS/images/{chapter}_{os.path.basename(image)}"
-                    )
+        # Write .opf document
+        self._zip.writestr("OEBPS/content.opf", self._get_opf())
 
-                    progress_bar.update(1)
+        self._zip.close()
 
 
 class EPUBFile:
     file_ext = ".epub"
 
     def check_dependecies(self):
-        if not epub_ready:
-            raise EpubMissingDependencies()
+        pass
 
-    def convert(self, manga, lang, chapters, path, file_id = ""):
+    def convert(self, manga, lang, chapters, path, file_id=""):
         epub = EpubPlugin(manga, lang, file_id)
+        epub.open(path)
 
         for chapter, images in chapters:
             epub.create_page(chapter.get_name(), images)
 
-        epub.write(path)
+        epub.close()
+
+    def open_epub(self, path, file_id=""):
+        """Create EPUB file, chapters are written as soon as they are downloaded.
+        See :meth:`write_epub_chapter()` and :meth:`close_epub()`
+        """
+        self.epub = EpubPlugin(self.manga, self.manga.chapters.language.value, file_id)
+        self.epub_jobs = []
+
+        # KeyboardInterrupt safe
+        self.worker.submit(lambda: self.epub.open(path))
+
+    def write_epub_chapter(self, chapter, images):
+        # Do not wait for it, next chapter can be downloaded while this one is written
+        fut = self.worker.submit(
+            lambda: self.epub.create_page(chapter.get_name(), images), blocking=False
+        )
+        self.epub_jobs.append(fut)
+
+    def close_epub(self):
+        # Make sure all chapters are written and raise errors from them (if any)
+        for fut in self.epub_jobs:
+            fut.result()
+
+        self.worker.submit(self.epub.close)
+        self.epub_jobs.clear()
 
     def get_vol_cover_img(self, volume, path, count):
         """Insert volume cover"""
@@ -424,45 +439,28 @@ class Epub(ConvertedChaptersFormat, EPUBFile):
 
 class EpubVolume(ConvertedVolumesFormat, EPUBFile):
     def on_prepare(self, file_path, volume, count):
-        self.epub_chapters = []
-
         self.volume_name = self.get_volume_name(volume)
         dir_path = create_directory(self.volume_name, self.path)
         self.epub_vol_cover = self.get_vol_cover_img(volume, dir_path, count)
 
-    def on_convert(self, file_path, volume, images):
-        def job():
-            return self.convert(
-                self.manga,
-                self.manga.chapters.language.value,
-                self.epub_chapters,
-                file_path,
-                self.volume_name,
-            )
+        self.open_epub(file_path, self.volume_name)
 
-        self.worker.submit(job)
+    def on_convert(self, file_path, volume, images):
+        self.close_epub()
 
     def on_received_images(self, file_path, chapter, images):
         if self.config.use_volume_cover:
             images.insert(0, self.epub_vol_cover)
 
-        self.epub_chapters.append((chapter, images))
+        self.write_epub_chapter(chapter, images)
 
 
 class EpubSingle(ConvertedSingleFormat, EPUBFile):
     def on_prepare(self, file_path, base_path):
-        self.epub_chapters = []
+        self.open_epub(file_path)
 
     def on_finish(self, file_path, images):
-        def job():
-            return self.convert(
-                self.manga,
-                self.manga.chapters.language.value,
-                self.epub_chapters,
-                file_path,
-            )
-
-        self.worker.submit(job)
+        self.close_epub()
 
     def on_received_images(self, file_path, chapter, images):
-        self.epub_chapters.append((chapter, images))
+        self.write_epub_chapter(chapter, images)
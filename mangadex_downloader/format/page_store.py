@@ -0,0 +1,192 @@
+# MIT License
+
+# Copyright (c) 2022-present Rahman Yusuf
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+import os
+import shutil
+import sys
+import threading
+from pathlib import Path
+
+from .utils import verify_sha256
+from ..utils import delete_file
+from ..errors import MangaDexException
+
+log = logging.getLogger(__name__)
+
+# See linux/fs.h
+_FICLONE = 0x40049409
+
+
+def _reflink(src, dst):
+    """Copy-on-write clone a file (Linux only, btrfs and xfs)"""
+    if not sys.platform.startswith("linux"):
+        raise OSError("reflink is not supported in this platform")
+
+    import fcntl
+
+    # "xb" mode, never truncate existing file (it may be hardlinked to another page)
+    with open(src, "rb") as reader, open(dst, "xb") as writer:
+        try:
+            fcntl.ioctl(writer.fileno(), _FICLONE, reader.fileno())
+        except OSError:
+            writer.close()
+            delete_file(dst)
+            raise
+
+
+def _copy(src, dst):
+    with open(src, "rb") as reader, open(dst, "xb") as writer:
+        shutil.copyfileobj(reader, writer)
+
+
+def link_file(src, dst):
+    """Make ``dst`` has the same content as ``src`` without downloading it again
+
+    Try hardlink first, then reflink, and copy the file if both of them are failed.
+    ``dst`` must not exist.
+    """
+    for func in (os.link, _reflink):
+        try:
+            func(src, dst)
+        except FileExistsError:
+            raise
+        except OSError as e:
+            log.debug(f"Failed to {func.__name__} '{src}' to '{dst}', reason: {e}")
+            continue
+        else:
+            return
+
+    _copy(src, dst)
+
+
+class PageStore:
+    """Content-addressed storage for MangaDex images
+
+    Every image is stored by sha256 hash from MangaDex image filename
+    (see :func:`get_md_file_hash`), so the same image is only downloaded once
+    for all formats and all manga directories.
+
+    Images are verified before they're added to the store and written atomically,
+    so stored images are trusted by their file name and never re-hashed.
+
+    Layout: ``<path>/<hash[:2]>/<hash><ext>``
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise MangaDexException(
+                f"Failed to create page store folder in '{self.path}', reason: {e}"
+            ) from None
+
+    def get_path(self, file_hash, ext) -> Path:
+        return self.path / file_hash[:2] / f"{file_hash}{ext}"
+
+    def get(self, file_hash, ext, target, verify=False) -> bool:
+        """Put stored image to ``target`` path
+
+        Set ``verify`` to ``True`` to check the stored image hash first,
+        for example when ``target`` is modified (it may be hardlinked to the store).
+
+        Return ``True`` if the image is exist in the store, ``False`` otherwise
+        """
+        store_path = self.get_path(file_hash, ext)
+
+        try:
+            size = store_path.stat().st_size
+        except FileNotFoundError:
+            return False
+
+        if not size:
+            log.warning(f"Page '{store_path}' in page store is empty, removing it...")
+            delete_file(store_path)
+            return False
+
+        if verify and not verify_sha256(file_hash, store_path):
+            log.warning(
+                f"Page '{store_path}' in page store is modified "
+                "(hash is not matching), removing it..."
+            )
+            delete_file(store_path)
+            return False
+
+        delete_file(target)
+        link_file(store_path, target)
+
+        return True
+
+    def add(self, file_hash, ext, source, verified=False):
+        """Add downloaded image to the store
+
+        Set ``verified`` to ``True`` if ``source`` hash is already verified
+        """
+        store_path = self.get_path(file_hash, ext)
+        if store_path.exists():
+            return
+
+        # Do not poison the store with broken images
+        if not verified and not verify_sha256(file_hash, source):
+            log.debug(f"Not adding '{source}' to page store, hash is not matching")
+            return
+
+        store_path.parent.mkdir(exist_ok=True)
+
+        # Write to temporary file first and then rename it,
+        # so the store never contain incomplete images.
+        # The name is unique per thread, the same image can be added
+        # from multiple workers at the same time
+        tmp_path = store_path.with_name(
+            f"{store_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        delete_file(tmp_path)
+        try:
+            link_file(source, tmp_path)
+            os.replace(tmp_path, store_path)
+        except OSError as e:
+            log.debug(f"Failed to add '{source}' to page store, reason: {e}")
+            delete_file(tmp_path)
+
+
+_page_store = None
+
+
+def get_page_store():
+    """Get page store from env ``MANGADEXDL_PAGE_STORE``
+
+    Return ``None`` if it's not set
+    """
+    # "Circular imports" problem
+    from ..config import env
+
+    global _page_store
+
+    if env.page_store is None:
+        return None
+
+    if _page_store is None:
+        _page_store = PageStore(env.page_store)
+
+    return _page_store
@@ -23,8 +23,13 @@
 import logging
 import io
 import os
+import struct
 import time
 import math
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from .base import ConvertedChaptersFormat, ConvertedVolumesFormat, ConvertedSingleFormat
 from .utils import get_chapter_info, get_volume_cover
@@ -41,28 +46,19 @@ else:
     pillow_ready = True
 
 
+# `ImageFile.LOAD_TRUNCATED_IMAGES` is process-wide flag,
+# only one truncated image can be loaded at a time. See `PDFPlugin.check_truncated()`
+_truncated_images_lock = threading.Lock()
+
+
 class PillowNotInstalled(Exception):
     """Raised when trying to download in PDF format but Pillow is not installed"""
 
     pass
 
 
-class _PageRef:
-    def __init__(self, func, *args, **kwargs):
-        self._func = func
-        self._args = args
-        self._kwargs = kwargs
-
-    def __call__(self):
-        return self._func(*self._args, **self._kwargs)
-
-
 # Utility function for Pillow library
-def _write_image(im, filename, existing_pdf, image_refs):
-    # FIXME: Should replace ASCIIHexDecode with RunLengthDecode
-    # (packbits) or LZWDecode (tiff/lzw compression).  Note that
-    # PDF 1.2 also supports Flatedecode (zip compression).
-
+def _write_image(im, filename, existing_pdf):
     params = None
     decode = None
 
@@ -103,7 +99,7 @@ def _write_image(im, filename, existing_pdf, image_refs):
         procset = "ImageB"  # grayscale
         dict_obj["SMaskInData"] = 1
     elif im.mode == "P":
-        filter = "ASCIIHexDecode"
+        filter = "FlateDecode"
         palette = im.getpalette()
         dict_obj["ColorSpace"] = [
             PdfParser.PdfName("Indexed"),
@@ -117,7 +113,7 @@ def _write_image(im, filename, existing_pdf, image_refs):
             smask = im.convert("LA").getchannel("A")
             smask.encoderinfo = {}
 
-            image_ref = _write_image(smask, filename, existing_pdf, image_refs)[0]
+            image_ref = _write_image(smask, filename, existing_pdf)[0]
             dict_obj["SMask"] = image_ref
     elif im.mode == "RGB":
         filter = "DCTDecode"
@@ -141,8 +137,8 @@ def _write_image(im, filename, existing_pdf, image_refs):
 
     op = io.BytesIO()
 
-    if filter == "ASCIIHexDecode":
-        ImageFile._save(im, op, [("hex", (0, 0) + im.size, 0, im.mode)])
+    if filter == "FlateDecode":
+        op.write(zlib.compress(im.tobytes()))
     elif filter == "CCITTFaxDecode":
         im.save(
             op,
@@ -167,9 +163,8 @@ def _write_image(im, filename, existing_pdf, image_refs):
     else:
         filter = PdfParser.PdfName(filter)
 
-    image_ref = image_refs.pop(0)
-    existing_pdf.write_obj(
-        image_ref,
+    image_ref = existing_pdf.write_obj(
+        None,
         stream=stream,
         Type=PdfParser.PdfName("XObject"),
         Subtype=PdfParser.PdfName("Image"),
@@ -184,207 +179,449 @@ def _write_image(im, filename, existing_pdf, image_refs):
     return image_ref, procset
 
 
+def _can_passthrough_jpeg(im):
+    """Check if JPEG image can be embedded to PDF without re-encoding it"""
+    # CMYK JPEG images are mostly created by Adobe Photoshop
+    # which has inverted colors, let Pillow handle it
+    return (
+        im.format == "JPEG"
+        and im.mode in ("RGB", "L")
+        and getattr(im, "filename", None)
+    )
+
+
+def _write_jpeg_image(im, existing_pdf):
+    """Embed original JPEG data as DCTDecode image
+
+    Only image header is read (size and mode), the image is never decoded
+    """
+    with open(im.filename, "rb") as reader:
+        stream = reader.read()
+
+    if im.mode == "L":
+        colorspace = "DeviceGray"
+        procset = "ImageB"  # grayscale
+    else:
+        colorspace = "DeviceRGB"
+        procset = "ImageC"  # color images
+
+    width, height = im.size
+
+    image_ref = existing_pdf.write_obj(
+        None,
+        stream=stream,
+        Type=PdfParser.PdfName("XObject"),
+        Subtype=PdfParser.PdfName("Image"),
+        Width=width,
+        Height=height,
+        Filter=PdfParser.PdfName("DCTDecode"),
+        BitsPerComponent=8,
+        ColorSpace=PdfParser.PdfName(colorspace),
+    )
+
+    return image_ref, procset
+
+
+# Source image formats that use lossless compression,
+# these images will not be converted to JPEG
+_lossless_formats = ["PNG", "GIF", "BMP", "TIFF"]
+
+
+def _read_png(data):
+    """Read PNG header, palette and compressed image data (IDAT) from PNG data
+
+    Return ``None`` if the data is not valid PNG
+    """
+    if data[:8] != b"\x89PNG\r\n\x1a\n":
+        return None
+
+    info = {"palette": None, "transparency": False}
+    idat = []
+    pos = 8
+    while pos + 8 <= len(data):
+        length, chunk_type = struct.unpack(">I4s", data[pos : pos + 8])
+        chunk = data[pos + 8 : pos + 8 + length]
+        pos += 12 + length
+
+        if chunk_type == b"IHDR":
+            (
+                info["width"],
+                info["height"],
+                info["bit_depth"],
+                info["color_type"],
+                _,
+                _,
+                info["interlace"],
+            ) = struct.unpack(">IIBBBBB", chunk)
+        elif chunk_type == b"PLTE":
+            info["palette"] = chunk
+        elif chunk_type == b"tRNS":
+            info["transparency"] = True
+        elif chunk_type == b"IDAT":
+            idat.append(chunk)
+        elif chunk_type == b"IEND":
+            break
+
+    if "width" not in info or not idat:
+        return None
+
+    info["data"] = b"".join(idat)
+    return info
+
+
+def _can_passthrough_png(info):
+    """Check if compressed PNG data can be embedded to PDF without decoding it"""
+    if info is None:
+        return False
+
+    # Only grayscale, RGB and palette images without transparency.
+    # PDF does not support interlaced and 16-bit PNG predictors
+    return (
+        info["color_type"] in (0, 2, 3)
+        and info["bit_depth"] <= 8
+        and not info["interlace"]
+        and not info["transparency"]
+    )
+
+
+def _write_png_image(info, existing_pdf, smask=None):
+    """Embed compressed PNG data (IDAT) as FlateDecode image"""
+    color_type = info["color_type"]
+    bit_depth = info["bit_depth"]
+
+    if color_type == 0:
+        colors = 1
+        colorspace = PdfParser.PdfName("DeviceGray")
+        procset = "ImageB"  # grayscale
+    elif color_type == 2:
+        colors = 3
+        colorspace = PdfParser.PdfName("DeviceRGB")
+        procset = "ImageC"  # color images
+    else:
+        palette = info["palette"]
+        colors = 1
+        colorspace = [
+            PdfParser.PdfName("Indexed"),
+            PdfParser.PdfName("DeviceRGB"),
+            len(palette) // 3 - 1,
+            PdfParser.PdfBinary(palette),
+        ]
+        procset = "ImageI"  # indexed color
+
+    dict_obj = {}
+    if smask is not None:
+        dict_obj["SMask"] = smask
+
+    image_ref = existing_pdf.write_obj(
+        None,
+        stream=info["data"],
+        Type=PdfParser.PdfName("XObject"),
+        Subtype=PdfParser.PdfName("Image"),
+        Width=info["width"],
+        Height=info["height"],
+        Filter=PdfParser.PdfName("FlateDecode"),
+        DecodeParms=PdfParser.PdfDict(
+            Predictor=15,
+            Colors=colors,
+            BitsPerComponent=bit_depth,
+            Columns=info["width"],
+        ),
+        BitsPerComponent=bit_depth,
+        ColorSpace=colorspace,
+        **dict_obj,
+    )
+
+    return image_ref, procset
+
+
+def _encode_png(im):
+    op = io.BytesIO()
+    im.save(op, "PNG")
+    return _read_png(op.getvalue())
+
+
+def _write_flate_image(im, existing_pdf):
+    """Write decoded image with lossless compression (FlateDecode)
+
+    Transparent images are written with soft mask (SMask)
+    """
+    smask = None
+
+    if im.mode in ("RGBA", "LA", "PA") or "transparency" in im.info:
+        im_alpha = im.convert("RGBA")
+        alpha = im_alpha.getchannel("A")
+
+        # Fully opaque image doesn't need soft mask
+        if alpha.getextrema() != (255, 255):
+            smask = _write_png_image(_encode_png(alpha), existing_pdf)[0]
+
+        im = im_alpha.convert("L" if im.mode in ("L", "LA") else "RGB")
+    elif im.mode not in ("1", "L", "P", "RGB"):
+        im = im.convert("RGB")
+
+    return _write_png_image(_encode_png(im), existing_pdf, smask)
+
+
+class _PendingRef:
+    def __init__(self, index):
+        self.index = index
+
+
+class _PendingObjects:
+    """Store PDF objects from image encoders to be written later
+
+    This has the same `write_obj()` interface as `PdfParser.PdfParser`,
+    so images can be encoded in another thread
+    and written to the PDF file in order
+    """
+
+    def __init__(self):
+        self.objects = []
+
+    def write_obj(self, ref, **dict_obj):
+        self.objects.append(dict_obj)
+        return _PendingRef(len(self.objects) - 1)
+
+    def write(self, existing_pdf):
+        """Write all stored objects to PDF file, return list of the references"""
+        refs = []
+        for dict_obj in self.objects:
+            for key, value in dict_obj.items():
+                if isinstance(value, _PendingRef):
+                    dict_obj[key] = refs[value.index]
+
+            refs.append(existing_pdf.write_obj(None, **dict_obj))
+
+        return refs
+
+
 class PDFPlugin:
-    def __init__(self, ims):
-        # "Circular Imports" problem
+    """Write images to PDF file page by page
+
+    Images are decoded and encoded in thread pool,
+    the results are written to the PDF file in order.
+    Every image is opened once and closed right away.
+    The page tree and catalog are written after all pages are written,
+    so memory usage is not growing with number of pages.
+    """
 
+    resolution = 72.0
+
+    def __init__(self, ims):
         pbm.set_convert_total(len(ims))
         self.tqdm = pbm.get_convert_pb(recreate=not pbm.stacked)
 
-        self.register_pdf_handler()
+        # Pillow is releasing GIL while decoding and encoding images
+        self.workers = os.cpu_count() or 1
 
     def check_truncated(self, img):
         # Pillow won't load truncated images
         # See https://github.com/python-pillow/Pillow/issues/1510
         # Image reference: https://mangadex.org/chapter/1615adcb-5167-4459-8b12-ee7cfbdb10d9/16
-        err = None
         try:
             img.load()
-        except OSError as e:
-            err = e
+        except OSError:
+            pass
         else:
             return False
 
-        if err:
+        # Load it again, the flag is enabled only while loading this image
+        # because other PDF files may be converted at the same time (--manga-workers)
+        with _truncated_images_lock:
             ImageFile.LOAD_TRUNCATED_IMAGES = True
-
-        # Load it again
-        img.load()
+            try:
+                img.load()
+            finally:
+                # For security sake
+                ImageFile.LOAD_TRUNCATED_IMAGES = False
 
         return True
 
-    def _save_all(self, im, fp, filename):
-        self._save(im, fp, filename, save_all=True)
+    def _write_page(self, existing_pdf, size, image_ref, procset):
+        width = size[0] * 72.0 / self.resolution
+        height = size[1] * 72.0 / self.resolution
 
-    # This was modified version of Pillow/PdfImagePlugin.py version 9.5.0
-    # The images will be automatically converted to RGB and closed when done converting to PDF  # noqa: E501
-    def _save(self, im, fp, filename, save_all=False):
-        is_appending = im.encoderinfo.get("append", False)
-        if is_appending:
-            existing_pdf = PdfParser.PdfParser(f=fp, filename=filename, mode="r+b")
-        else:
-            existing_pdf = PdfParser.PdfParser(f=fp, filename=filename, mode="w+b")
+        #
+        # page contents
 
-        dpi = im.encoderinfo.get("dpi")
-        if dpi:
-            x_resolution = dpi[0]
-            y_resolution = dpi[1]
-        else:
-            x_resolution = y_resolution = im.encoderinfo.get("resolution", 72.0)
+        page_contents = b"q %f 0 0 %f 0 0 cm /image Do Q\n" % (width, height)
+        contents_ref = existing_pdf.write_obj(None, stream=page_contents)
+
+        #
+        # page
 
-        info = {
-            "title": (
-                None
-                if is_appending
-                else os.path.splitext(os.path.basename(filename))[0]
+        page_ref = existing_pdf.write_page(
+            None,
+            Resources=PdfParser.PdfDict(
+                ProcSet=[PdfParser.PdfName("PDF"), PdfParser.PdfName(procset)],
+                XObject=PdfParser.PdfDict(image=image_ref),
             ),
-            "author": None,
-            "subject": None,
-            "keywords": None,
-            "creator": None,
-            "producer": None,
-            "creationDate": None if is_appending else time.gmtime(),
-            "modDate": None if is_appending else time.gmtime(),
-        }
-        for k, default in info.items():
-            v = im.encoderinfo.get(k) if k in im.encoderinfo else default
-            if v:
-                existing_pdf.info[k[0].upper() + k[1:]] = v
+            MediaBox=[0, 0, width, height],
+            Contents=contents_ref,
+        )
+        existing_pdf.pages.append(page_ref)
 
-        #
-        # make sure image data is available
-        im.load()
+    def encode_image(self, path):
+        """Encode all frames from an image to PDF image objects
 
-        existing_pdf.start_writing()
-        existing_pdf.write_header()
-        existing_pdf.write_comment(f"created by Pillow {__version__} PDF driver")
+        Nothing is written to PDF file, this is called from thread pool.
+        Return stored PDF objects and list of ``(image_ref, procset, size)`` for each frame
+        """
+        pending_pdf = _PendingObjects()
+        frames = []
+        im = Image.open(path)
 
-        #
-        # pages
-        encoderinfo = im.encoderinfo.copy()
-        ims = [im]
-        if save_all:
-            append_images = im.encoderinfo.get("append_images", [])
-            ims.extend(append_images)
-
-        number_of_pages = 0
-        image_refs = []
-        page_refs = []
-        contents_refs = []
-        for im_ref in ims:
-            img = im_ref() if isinstance(im_ref, _PageRef) else im_ref
-            im_number_of_pages = 1
-            if save_all:
-                try:
-                    im_number_of_pages = img.n_frames
-                except AttributeError:
-                    # Image format does not have n_frames.
-                    # It is a single frame image
-                    pass
-            number_of_pages += im_number_of_pages
-            for i in range(im_number_of_pages):
-                image_refs.append(existing_pdf.next_object_id(0))
-                if im.mode == "P" and "transparency" in im.info:
-                    image_refs.append(existing_pdf.next_object_id(0))
-
-                page_refs.append(existing_pdf.next_object_id(0))
-                contents_refs.append(existing_pdf.next_object_id(0))
-                existing_pdf.pages.append(page_refs[-1])
-
-            # Reduce Opened files
-            if isinstance(im_ref, _PageRef):
-                img.close()
+        if _can_passthrough_jpeg(im):
+            # No need to decode and re-encode JPEG images
+            image_ref, procset = _write_jpeg_image(im, pending_pdf)
+            frames.append((image_ref, procset, im.size))
 
-        #
-        # catalog and list of pages
-        existing_pdf.write_catalog()
+            im.close()
+            return pending_pdf, frames
+
+        if im.format == "PNG" and not getattr(im, "is_animated", False):
+            with open(path, "rb") as reader:
+                png_info = _read_png(reader.read())
+
+            if _can_passthrough_png(png_info):
+                # Compressed PNG data can be used directly in PDF
+                image_ref, procset = _write_png_image(png_info, pending_pdf)
+                frames.append((image_ref, procset, im.size))
 
-        if ImageFile.LOAD_TRUNCATED_IMAGES:
-            ImageFile.LOAD_TRUNCATED_IMAGES = False
+                im.close()
+                return pending_pdf, frames
 
-        page_number = 0
-        for im_ref in ims:
-            # The reason i did this is to prevent error in Unix-based OS
-            # If the application is opening too much files,
-            # the OS will throw an error "OSError: Too many open files"
-            im = im_ref() if isinstance(im_ref, _PageRef) else im_ref
+        self.check_truncated(im)
+        lossless = im.format in _lossless_formats
 
-            truncated = self.check_truncated(im)
+        for frame in ImageSequence.Iterator(im):
+            if lossless:
+                image_ref, procset = _write_flate_image(frame, pending_pdf)
+                frames.append((image_ref, procset, frame.size))
+                continue
 
-            if im.mode != "RGB":
+            if frame.mode != "RGB":
                 # Convert to RGB mode
-                im_sequence = im.convert("RGB")
+                frame = frame.convert("RGB")
 
-                # Close image to save memory
-                im.close()
-            else:
-                # Already in RGB mode
-                im_sequence = im
+            frame.encoderinfo = {}
+            image_ref, procset = _write_image(frame, path, pending_pdf)
+            frames.append((image_ref, procset, frame.size))
+
+        # Close image to save memory
+        im.close()
+
+        return pending_pdf, frames
+
+    def write_image(self, existing_pdf, pending_pdf, frames):
+        """Write encoded image to PDF file, each frame is written as a page"""
+        refs = pending_pdf.write(existing_pdf)
+
+        for image_ref, procset, size in frames:
+            self._write_page(existing_pdf, size, refs[image_ref.index], procset)
+
+        self.tqdm.update(1)
+
+    def _stringify_dict(self, pdf_dict):
+        # make dict keys into strings for passing to `PdfParser.write_obj()`
+        return {key.name_as_str(): value for key, value in pdf_dict.items()}
 
-            # Copy necessary encoderinfo to new image
-            im_sequence.encoderinfo = encoderinfo.copy()
+    def write_catalog(self, existing_pdf, orig_page_tree=None):
+        # We cannot use `PdfParser.write_catalog()`,
+        # because it allocate new reference for page tree
+        # while the pages are already written with `existing_pdf.pages_ref` as parent
+        kids = existing_pdf.pages
+        count = len(kids)
 
-            im_pages = (
-                ImageSequence.Iterator(im_sequence) if save_all else [im_sequence]
+        if orig_page_tree is None:
+            existing_pdf.root_ref = existing_pdf.write_obj(
+                None,
+                Type=PdfParser.PdfName("Catalog"),
+                Pages=existing_pdf.pages_ref,
             )
-            for im in im_pages:
-                image_ref, procset = _write_image(
-                    im, filename, existing_pdf, image_refs
-                )
-
-                #
-                # page
-
-                existing_pdf.write_page(
-                    page_refs[page_number],
-                    Resources=PdfParser.PdfDict(
-                        ProcSet=[PdfParser.PdfName("PDF"), PdfParser.PdfName(procset)],
-                        XObject=PdfParser.PdfDict(image=image_ref),
-                    ),
-                    MediaBox=[
-                        0,
-                        0,
-                        im.width * 72.0 / x_resolution,
-                        im.height * 72.0 / y_resolution,
-                    ],
-                    Contents=contents_refs[page_number],
-                )
-
-                #
-                # page contents
-
-                page_contents = b"q %f 0 0 %f 0 0 cm /image Do Q\n" % (
-                    im.width * 72.0 / x_resolution,
-                    im.height * 72.0 / y_resolution,
-                )
-
-                existing_pdf.write_obj(contents_refs[page_number], stream=page_contents)
-
-                self.tqdm.update(1)
-                page_number += 1
-
-            # Close image to save memory
-            im_sequence.close()
-
-            # For security sake
-            if truncated:
-                ImageFile.LOAD_TRUNCATED_IMAGES = False
+        else:
+            # Incremental update, existing page tree become a child of new page tree.
+            # So the existing pages are not re-written
+            orig_pages_ref, orig_pages_node = orig_page_tree
+            node = self._stringify_dict(orig_pages_node)
+            node["Parent"] = existing_pdf.pages_ref
+            existing_pdf.write_obj(orig_pages_ref, **node)
+
+            kids = [orig_pages_ref] + kids
+            count += orig_pages_node[b"Count"]
+
+            root = self._stringify_dict(existing_pdf.root)
+            root["Pages"] = existing_pdf.pages_ref
+            existing_pdf.write_obj(existing_pdf.root_ref, **root)
+
+        existing_pdf.write_obj(
+            existing_pdf.pages_ref,
+            Type=PdfParser.PdfName("Pages"),
+            Count=count,
+            Kids=kids,
+        )
+
+    # This was modified version of Pillow/PdfImagePlugin.py version 9.5.0
+    # The images will be automatically converted to RGB and closed when done converting to PDF  # noqa: E501
+    def save(self, ims, filename, append=False):
+        orig_page_tree = None
+
+        if append:
+            # Incremental update, new objects and xref section are appended
+            # to the end of existing PDF file
+            existing_pdf = PdfParser.PdfParser(filename=filename, mode="r+b")
+            existing_pdf.info["ModDate"] = time.gmtime()
+
+            orig_pages_ref = existing_pdf.root[b"Pages"]
+            orig_page_tree = (
+                orig_pages_ref,
+                existing_pdf.read_indirect(orig_pages_ref),
+            )
+            existing_pdf.pages = []
+
+            existing_pdf.start_writing()
+        else:
+            existing_pdf = PdfParser.PdfParser(filename=filename, mode="w+b")
+
+            info = {
+                "title": os.path.splitext(os.path.basename(filename))[0],
+                "creationDate": time.gmtime(),
+                "modDate": time.gmtime(),
+            }
+            for k, v in info.items():
+                existing_pdf.info[k[0].upper() + k[1:]] = v
+
+            existing_pdf.start_writing()
+            existing_pdf.write_header()
+            existing_pdf.write_comment(f"created by Pillow {__version__} PDF driver")
+
+        # Allocate page tree reference first,
+        # so the pages can be written right away
+        existing_pdf.pages_ref = existing_pdf.next_object_id(0)
 
         #
-        # trailer
-        existing_pdf.write_xref_and_trailer()
-        if hasattr(fp, "flush"):
-            fp.flush()
-        existing_pdf.close()
+        # pages
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            # Limit encoded images that waiting to be written,
+            # to keep memory usage low
+            pending = deque()
+            for path in ims:
+                pending.append(executor.submit(self.encode_image, path))
 
-    def register_pdf_handler(self):
-        Image.init()
+                if len(pending) >= self.workers * 2:
+                    self.write_image(existing_pdf, *pending.popleft().result())
 
-        Image.register_save("PDF", self._save)
-        Image.register_save_all("PDF", self._save_all)
-        Image.register_extension("PDF", ".pdf")
+            while pending:
+                self.write_image(existing_pdf, *pending.popleft().result())
 
-        Image.register_mime("PDF", "application/pdf")
+        #
+        # catalog and list of pages
+        self.write_catalog(existing_pdf, orig_page_tree)
+
+        #
+        # trailer
+        existing_pdf.write_xref_and_trailer()
+        existing_pdf.close()
 
 
 class PDFFile:
@@ -394,21 +631,13 @@ class PDFFile:
         if not pillow_ready:
             raise PillowNotInstalled("pillow is not installed")
 
-    def convert(self, imgs, target):
-        pdf_plugin = PDFPlugin(imgs)
-
-        # Because images from BaseFormat.get_images() was just bunch of pathlib.Path
-        # objects, we need convert it to _PageRef for be able Modified Pillow can convert it
-        images = []
-        for im in imgs:
-            images.append(_PageRef(Image.open, im))
-
-        im_ref = images.pop(0)
-        im = im_ref()
+    def get_existing_total_pages(self, path, total):
+        with PdfParser.PdfParser(filename=path, mode="rb") as pdf:
+            return len(pdf.pages)
 
-        pdf_plugin.check_truncated(im)
-
-        im.save(target, save_all=True, append_images=images)
+    def convert(self, imgs, target, append=False):
+        pdf_plugin = PDFPlugin(imgs)
+        pdf_plugin.save(imgs, target, append=append)
 
     def insert_ch_info_img(self, images, chapter, path, count):
         """Insert chapter info (cover) image"""
@@ -437,6 +666,8 @@ class PDF(ConvertedChaptersFormat, PDFFile):
 
 
 class PDFVolume(ConvertedVolumesFormat, PDFFile):
+    support_incremental_update = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -457,19 +688,26 @@ class PDFVolume(ConvertedVolumesFormat, PDFFile):
         volume_name = self.get_volume_name(volume)
         self.volume_path = create_directory(volume_name, self.path)
 
+        # Existing volume file, volume cover is already written
+        if self.incremental_pages is not None:
+            return
+
         self.insert_vol_cover_img(self.images, volume, self.volume_path, count)
 
     def on_iter_chapter(self, file_path, chapter, count):
         self.insert_ch_info_img(self.images, chapter, self.volume_path, count)
 
     def on_convert(self, file_path, volume, images):
-        self.worker.submit(lambda: self.convert(self.images, file_path))
+        append = self.incremental_pages is not None
+        self.worker.submit(lambda: self.convert(self.images, file_path, append))
 
     def on_received_images(self, file_path, chapter, images):
         self.images.extend(images)
 
 
 class PDFSingle(ConvertedSingleFormat, PDFFile):
+    support_incremental_update = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -477,13 +715,15 @@ class PDFSingle(ConvertedSingleFormat, PDFFile):
         self.images = []
 
     def on_prepare(self, file_path, base_path):
+        self.images.clear()
         self.images_directory = base_path
 
     def on_iter_chapter(self, file_path, chapter, count):
         self.insert_ch_info_img(self.images, chapter, self.images_directory, count)
 
     def on_finish(self, file_path, images):
-        self.worker.submit(lambda: self.convert(self.images, file_path))
+        append = self.incremental_pages is not None
+        self.worker.submit(lambda: self.convert(self.images, file_path, append))
 
     def on_received_images(self, file_path, chapter, images):
         self.images.extend(images)
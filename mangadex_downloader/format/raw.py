@@ -41,20 +41,33 @@ log = logging.getLogger(__name__)
 
 # TODO: PLEASE REFACTOR THIS CODE (Raw, RawVolume, RawSingle)
 class Raw(BaseFormat):
+    stream_chapters = True
+
     def main(self):
-        base_path = self.path
         manga = self.manga
 
         # Recreate DownloadTracker JSON file if --replace is present
         if self.replace:
             manga.tracker.recreate()
 
-        data = manga.chapters.iter(**self.kwargs_iter)
+        for data in self.iter_chapters_batches():
+            self.download_chapters(data)
+
+        if not pbm.stacked:
+            pbm.get_convert_pb().close()
+
+        pbm.logger.info("Waiting for chapter read marker to finish")
+        self.cleanup()
+
+    def download_chapters(self, data):
+        base_path = self.path
+        manga = self.manga
+
         volumes = {}
         for chap_class, images in data:
             self.append_cache_volumes(volumes, chap_class.volume, (chap_class, images))
 
-        pbm.set_volumes_total(len(volumes.keys()))
+        self.set_volumes_total(volumes)
         # Begin downloading
         for volume, chapters in volumes.items():
 
@@ -86,6 +99,15 @@ class Raw(BaseFormat):
                     fi_images = file_info.images
                     fi_completed = file_info.completed
 
+                # Verified or downloaded in previous (interrupted) run
+                if fi_completed and self.check_chapter_journal(chap_class):
+                    pbm.logger.info(
+                        f"{dir_name!r} is completed in previous run, skipping verification"
+                    )
+                    self.mark_read_chapter(chap_class)
+                    chapters_pb.update(1)
+                    continue
+
                 for im_info in fi_images:
                     verified = verify_sha256(im_info.hash, chapter_path / im_info.name)
                     if not verified:
@@ -108,6 +130,7 @@ class Raw(BaseFormat):
                 elif not failed_images and fi_completed and (not ignored or ignored):
                     pbm.logger.info(f"'{dir_name}' is verified. no need to re-download")
                     self.mark_read_chapter(chap_class)
+                    self.add_chapter_journal(chap_class)
                     chapters_pb.update(1)
                     continue
                 elif failed_images and fi_completed and ignored:
@@ -132,17 +155,12 @@ class Raw(BaseFormat):
                 manga.tracker.toggle_complete(dir_name, True)
 
                 self.mark_read_chapter(chap_class)
+                self.add_chapter_journal(chap_class)
                 chapters_pb.update(1)
 
             chapters_pb.reset()
             volumes_pb.update(1)
 
-        if not pbm.stacked:
-            pbm.get_convert_pb().close()
-
-        pbm.logger.info("Waiting for chapter read marker to finish")
-        self.cleanup()
-
 
 class RawVolume(BaseFormat):
     def main(self):
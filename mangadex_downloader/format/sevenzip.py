@@ -52,14 +52,46 @@ class SevenZipFile:
         if not PY7ZR_OK:
             raise py7zrNotInstalled("py7zr is not installed")
 
+    def get_compression_filters(self):
+        from ..config import env
+
+        compression_type = env.sevenzip_compression_type
+        level = env.sevenzip_compression_level
+
+        if compression_type is None:
+            # Use py7zr default filters
+            return None
+
+        filters = {
+            "copy": py7zr.FILTER_COPY,
+            "lzma2": py7zr.FILTER_LZMA2,
+            "lzma": py7zr.FILTER_LZMA,
+            "deflate": py7zr.FILTER_DEFLATE,
+            "bzip2": py7zr.FILTER_BZIP2,
+            "zstd": py7zr.FILTER_ZSTD,
+            "brotli": py7zr.FILTER_BROTLI,
+        }
+        compression_filter = {"id": filters[compression_type]}
+
+        if level is not None:
+            if compression_type in ["lzma2", "lzma"]:
+                compression_filter["preset"] = level
+            elif compression_type in ["zstd", "brotli"]:
+                compression_filter["level"] = level
+
+        return [compression_filter]
+
     def convert(self, images, path):
         pbm.set_convert_total(len(images))
         progress_bar = pbm.get_convert_pb(recreate=not pbm.stacked)
 
-        for im_path in images:
-            with py7zr.SevenZipFile(
-                path, "a" if os.path.exists(path) else "w"
-            ) as zip_obj:
+        # Open the archive once and write all images.
+        # Opening it in append mode for every image will re-write 7z headers
+        # everytime the image is written
+        with py7zr.SevenZipFile(
+            path, "w", filters=self.get_compression_filters()
+        ) as zip_obj:
+            for im_path in images:
                 zip_obj.write(im_path, im_path.name)
                 progress_bar.update(1)
 
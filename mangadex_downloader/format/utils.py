@@ -28,7 +28,6 @@ import threading
 import time
 
 from enum import Enum
-from .chinfo import get_chapter_info as get_chinfo
 from ..language import Language
 from ..downloader import FileDownloader
 from ..utils import get_cover_art_url
@@ -39,6 +38,9 @@ log = logging.getLogger(__name__)
 
 
 def get_chapter_info(manga, chapter, path):
+    # Pillow is slow to import, only import it when it's needed
+    from .chinfo import get_chapter_info as get_chinfo
+
     pbm.logger.info(f"Creating chapter info for '{chapter.get_name()}'")
 
     vol_cover = get_volume_cover(
@@ -58,44 +60,136 @@ def get_chapter_info(manga, chapter, path):
     return path
 
 
+class VolumeCoverIndex:
+    """All cover arts of a manga, keyed by ``(volume, locale)``
+
+    Every volume of the same manga shares the same cover list,
+    so the cover list is only fetched once for all volumes.
+    """
+
+    def __init__(self, manga_id):
+        # "Circular Imports" problem
+        from ..iterator import CoverArtIterator
+
+        self.manga_id = manga_id
+        self.covers = {}
+
+        # Cover for each volume in any language
+        self.any_covers = {}
+
+        for cover in CoverArtIterator(manga_id, language_override="all"):
+            locale = cover.data["attributes"]["locale"]
+
+            # First cover is used, same as iterating covers with "locales[]" filter
+            self.covers.setdefault((cover.volume, locale), cover)
+            self.any_covers.setdefault(cover.volume, cover)
+
+    def get(self, volume, locale):
+        if locale == "all" or locale is None:
+            return self.any_covers.get(volume)
+
+        return self.covers.get((volume, locale))
+
+
+# Cover indexes of manga that are being downloaded,
+# the index is dropped when the manga is downloaded again (see `purge_volume_cover_index()`)
+# so new uploaded covers are fetched
+_cover_indexes = {}
+_cover_indexes_max_size = 16
+_cover_indexes_lock = threading.Lock()
+
+# Downloaded cover images, keyed by url.
+# Volumes without their own cover are using the same manga cover
+_cover_data = {}
+_cover_data_max_size = 16
+_cover_data_lock = threading.Lock()
+
+
+def _put_bounded(cache, key, value, max_size):
+    if len(cache) >= max_size:
+        # Remove the oldest one
+        cache.pop(next(iter(cache)))
+
+    cache[key] = value
+
+
+def get_volume_cover_index(manga_id):
+    with _cover_indexes_lock:
+        index = _cover_indexes.get(manga_id)
+
+    if index is not None:
+        return index
+
+    # Fetch covers without holding the lock,
+    # so other manga (--manga-workers) don't have to wait
+    index = VolumeCoverIndex(manga_id)
+
+    with _cover_indexes_lock:
+        _put_bounded(_cover_indexes, manga_id, index, _cover_indexes_max_size)
+
+    return index
+
+
+def purge_volume_cover_index(manga_id):
+    """Remove cached cover index of a manga"""
+    with _cover_indexes_lock:
+        _cover_indexes.pop(manga_id, None)
+
+
+def _download_cover(url, path, replace):
+    with _cover_data_lock:
+        data = _cover_data.get(url)
+
+    if data is not None:
+        # Cover is already downloaded for other volume
+        if replace or not os.path.exists(path):
+            with open(path, "wb") as writer:
+                writer.write(data)
+
+        return
+
+    fd = FileDownloader(url, path, replace=replace)
+    fd.download()
+    fd.cleanup()
+
+    try:
+        with open(path, "rb") as reader:
+            data = reader.read()
+    except FileNotFoundError:
+        return
+
+    with _cover_data_lock:
+        _put_bounded(_cover_data, url, data, _cover_data_max_size)
+
+
 def get_volume_cover(manga, volume, path, replace, download=True):
     # "Circular Imports" problem
-    from ..iterator import CoverArtIterator
+    from ..config import config
 
     if download:
         pbm.logger.info(f'Getting volume cover for "Volume {volume}"')
 
-    # Find volume
-    def find_volume_cover(cover):
-        if volume is None:
-            # There is higher change
-            # that "null" volume is "volume 0"
-            return cover.volume == 0
-
-        return volume == cover.volume
+    # There is higher change
+    # that "null" volume is "volume 0"
+    cover_volume = 0 if volume is None else volume
 
-    cover_art_iter_kwargs = [
+    locales = [
         # Fix default volume covers behaviour
         # See https://github.com/mansuf/mangadex-downloader/issues/105
-        {"language_override": None},  # --volume-cover-language or --language
-        {
-            "language_override": manga.original_language.value,
-        },  # volume cover from manga original language
-        {
-            "language_override": "all",
-        },  # Volume cover from any languages that exists
+        # --volume-cover-language or --language
+        config.volume_cover_language or config.language,
+        manga.original_language.value,  # volume cover from manga original language
+        "all",  # Volume cover from any languages that exists
     ]
 
+    index = get_volume_cover_index(manga.id)
+
     cover = None
-    for kwargs in cover_art_iter_kwargs:
-        kwargs["manga_id"] = manga.id
-        iterator = CoverArtIterator(**kwargs)
-        f = filter(find_volume_cover, iterator)
+    for locale in locales:
+        cover = index.get(cover_volume, locale)
 
-        try:
-            cover = next(f)
-        except StopIteration:
-            lang = Language(iterator.language)
+        if cover is None:
+            lang = Language(locale)
             log.debug(f"Failed to find volume cover in {lang.name} language")
             continue
         else:
@@ -111,9 +205,7 @@ def get_volume_cover(manga, volume, path, replace, download=True):
     url = get_cover_art_url(manga.id, cover, "original")
 
     if download:
-        fd = FileDownloader(url, path, replace=replace)
-        fd.download()
-        fd.cleanup()
+        _download_cover(url, path, replace)
 
     return cover
 
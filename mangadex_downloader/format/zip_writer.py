@@ -0,0 +1,63 @@
+# MIT License
+
+# Copyright (c) 2022-present Rahman Yusuf
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import zipfile
+
+# Images from MangaDex are already compressed,
+# compressing them again is only wasting CPU time
+_stored_extensions = [".jpg", ".jpeg", ".png", ".webp", ".gif"]
+
+
+class ImageZipFile(zipfile.ZipFile):
+    """:class:`zipfile.ZipFile` that store images without compression
+
+    Other files (ComicInfo.xml, xhtml, etc) are compressed
+    with compression type from the archive.
+    """
+
+    def __contains__(self, name):
+        # `ZipFile.namelist()` is creating new list in every call
+        return name in self.NameToInfo
+
+    def get_compress_type(self, arcname):
+        if os.path.splitext(arcname)[1].lower() in _stored_extensions:
+            return zipfile.ZIP_STORED
+
+        return self.compression
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        if compress_type is None:
+            compress_type = self.get_compress_type(arcname or os.fspath(filename))
+
+        return super().write(filename, arcname, compress_type, compresslevel)
+
+    def write_files(self, files, callback=None):
+        """Write list of ``(filename, arcname)`` to the archive
+
+        ``callback`` is called without arguments after each file is written
+        """
+        for filename, arcname in files:
+            self.write(filename, arcname)
+
+            if callback is not None:
+                callback()
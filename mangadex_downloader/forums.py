@@ -22,7 +22,6 @@
 
 import re
 import logging
-from bs4 import BeautifulSoup
 from dataclasses import dataclass
 from typing import Union
 
@@ -33,6 +32,13 @@ from .utils import find_md_urls
 log = logging.getLogger(__name__)
 
 
+def _parse_html(text):
+    # bs4 is slow to import, only import it when forums thread is used
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(text, "html.parser")
+
+
 @dataclass
 class _ResultValidationForumThreadURL:
     url: str
@@ -126,7 +132,7 @@ def get_thread_title_owner_and_post_owner(parser=None, thread_url=None, post_id=
 
     if parser is None and thread_url:
         r = Net.mangadex.get(thread_url)
-        parser = BeautifulSoup(r.text, "html.parser")
+        parser = _parse_html(r.text)
 
     # Finding thread owner
     thread_owner = parser.find(
@@ -185,7 +191,7 @@ def iter_md_urls_from_forum_thread(url):
 
     # Let's begin the scrapping !
     r = Net.mangadex.get(result.url)
-    parser = BeautifulSoup(r.text, "html.parser")
+    parser = _parse_html(r.text)
 
     thread_title, _, _ = get_thread_title_owner_and_post_owner(parser)
 
@@ -261,6 +267,6 @@ def iter_md_urls_from_forum_thread(url):
 
         next_url = f"{forums_url}/threads/{result.thread_id}/page-{page}"
         r = Net.mangadex.get(next_url)
-        next_parser = BeautifulSoup(r.text, "html.parser")
+        next_parser = _parse_html(r.text)
 
         yield from yield_urls_from_parser(next_parser)
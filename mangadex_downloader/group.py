@@ -20,9 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import threading
+import weakref
+
 from .fetcher import get_group
 from .utils import get_local_attr
 
+# Chapters from the same group are sharing one Group object,
+# see `Group.from_data()` and `Group.from_id()`
+# Objects are dropped when no chapters are using them anymore,
+# so this doesn't grow forever in long running process (--server)
+_groups = weakref.WeakValueDictionary()
+_groups_lock = threading.Lock()
+
 
 class Group:
     def __init__(self, group_id=None, data=None):
@@ -48,3 +58,28 @@ class Group:
 
         # description
         self.description = attr["description"]
+
+    @classmethod
+    def from_data(cls, data):
+        """Get interned :class:`Group` from API data"""
+        with _groups_lock:
+            group = _groups.get(data["id"])
+            if group is None:
+                group = cls(data=data)
+                _groups[group.id] = group
+
+        return group
+
+    @classmethod
+    def from_id(cls, group_id):
+        """Get interned :class:`Group`, the group is fetched if it's not exist yet"""
+        with _groups_lock:
+            group = _groups.get(group_id)
+
+        if group is None:
+            group = cls(group_id)
+
+            with _groups_lock:
+                group = _groups.setdefault(group.id, group)
+
+        return group
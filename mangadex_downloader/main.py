@@ -22,6 +22,8 @@
 
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .errors import UnhandledException, MangaDexException, ChapterNotFound
 from .utils import (
     comma_separated_text,
@@ -37,13 +39,29 @@ from .mdlist import MangaDexList
 from .manga import Manga
 from .chapter import Chapter
 from .format import get_format
+from .format.utils import purge_volume_cover_index
 from .downloader import FileDownloader
-from .config import config
+from .config import config, set_local_config, reset_local_config
 from .tracker import get_tracker
+from .tracker.journal import get_journal
 from .path.op import get_path
 
 log = logging.getLogger(__name__)
 
+# Same manga cannot be downloaded at the same time (--manga-workers),
+# because they're using the same tracker
+_manga_locks = {}
+_manga_locks_lock = threading.Lock()
+
+
+def _get_manga_lock(manga_id):
+    with _manga_locks_lock:
+        try:
+            return _manga_locks[manga_id]
+        except KeyError:
+            lock = _manga_locks[manga_id] = threading.Lock()
+            return lock
+
 
 def download(
     manga_id,
@@ -62,6 +80,9 @@ def download(
     """Download a manga"""
     cover = config.cover
 
+    # In case previous download in this thread is failed
+    reset_local_config("save_as")
+
     backup_fmt = config.save_as
     lang = get_language(config.language)
 
@@ -69,148 +90,168 @@ def download(
 
     manga = Manga(_id=manga_id, use_alt_details=use_alt_details)
 
-    # Check blacklisted tags in manga
-    blacklisted, tags = check_blacklisted_tags_manga(manga)
-
-    if blacklisted:
-        log.warning(
-            f"Not downloading manga '{manga.title}', "
-            f"since it contain one or more blacklisted tags {tags}"
-        )
-        return manga
-
-    all_languages = lang == Language.All
-
-    if not all_languages:
-        log.info("Fetching all chapters...")
-        manga.fetch_chapters(lang.value, all_chapters=True)
-
-    # Reuse is good
-    def download_manga(m, path, splitted_format=False):
-        kwargs_iter_chapter_images = {
-            "start_chapter": start_chapter,
-            "end_chapter": end_chapter,
-            "start_page": start_page,
-            "end_page": end_page,
-            "no_oneshot": no_oneshot_chapter,
-            "start_volume": start_volume,
-            "end_volume": end_volume,
-            "groups": groups,
-            "_range": _range,
-        }
-
-        if splitted_format:
-            config.save_as = config.save_as.replace("-volume", "")
-        else:
-            config.save_as = backup_fmt
-
-        save_as = config.save_as
+    # Cover art, manga info and tracker are shared with other workers
+    # downloading the same manga
+    with _get_manga_lock(manga.id):
+        # Covers may be uploaded since the last time this manga is downloaded
+        purge_volume_cover_index(manga.id)
 
-        log.info("Using %s format" % save_as)
+        # Check blacklisted tags in manga
+        blacklisted, tags = check_blacklisted_tags_manga(manga)
 
-        # Cover path
-        cover_path = path / "cover.jpg"
-        log.info("Downloading cover manga %s" % manga.title)
-
-        # Determine cover art quality
-        cover_url = get_cover_art_url(manga.id, manga.cover, cover)
+        if blacklisted:
+            log.warning(
+                f"Not downloading manga '{manga.title}', "
+                f"since it contain one or more blacklisted tags {tags}"
+            )
+            return manga
 
-        # Download the cover art
-        if cover == "none":
-            log.info('Not downloading cover manga, since "cover" is none')
-        elif cover_url is None:
-            # The manga doesn't have cover
+        all_languages = lang == Language.All
+
+        # Chapter formats can start downloading while chapters are being fetched,
+        # volume and single formats need all of them first.
+        stream = get_format(backup_fmt).stream_chapters
+        stream_splitted = get_format(backup_fmt.replace("-volume", "")).stream_chapters
+
+        if not all_languages:
+            log.info("Fetching all chapters...")
+            manga.fetch_chapters(lang.value, all_chapters=True, stream=stream)
+
+        # Reuse is good
+        def download_manga(m, path, splitted_format=False):
+            kwargs_iter_chapter_images = {
+                "start_chapter": start_chapter,
+                "end_chapter": end_chapter,
+                "start_page": start_page,
+                "end_page": end_page,
+                "no_oneshot": no_oneshot_chapter,
+                "start_volume": start_volume,
+                "end_volume": end_volume,
+                "groups": groups,
+                "_range": _range,
+            }
+
+            if splitted_format:
+                save_as = backup_fmt.replace("-volume", "")
+            else:
+                save_as = backup_fmt
+
+            # Only change the format for current thread,
+            # other manga may be downloaded at the same time (--manga-workers)
+            set_local_config("save_as", save_as)
+
+            log.info("Using %s format" % save_as)
+
+            # Cover path
+            cover_path = path / "cover.jpg"
+            log.info("Downloading cover manga %s" % manga.title)
+
+            # Determine cover art quality
+            cover_url = get_cover_art_url(manga.id, manga.cover, cover)
+
+            # Download the cover art
+            if cover == "none":
+                log.info('Not downloading cover manga, since "cover" is none')
+            elif cover_url is None:
+                # The manga doesn't have cover
+                log.info(
+                    "Not downloading cover manga, "
+                    f"since manga '{manga.title}' doesn't have cover"
+                )
+            else:
+                fd = FileDownloader(
+                    cover_url,
+                    cover_path,
+                    replace=replace,
+                )
+                fd.download()
+                fd.cleanup()
+
+            if config.create_manga_info:
+                create_manga_info(path, m, replace)
+
+                if config.manga_info_only:
+                    reset_local_config("save_as")
+                    return manga
+
+            m.tracker = get_tracker(save_as, path)
+
+            fmt_class = get_format(save_as)
+
+            fmt_cls_kwargs = {
+                "path": path,
+                "manga": manga,
+                "replace": replace,
+                "kwargs_iter_chapter_img": kwargs_iter_chapter_images,
+            }
+
+            if not splitted_format:
+                # Main format and execute it
+                fmt = fmt_class(**fmt_cls_kwargs)
+                fmt.main()
+            else:
+                # Using chapters format as split format
+                # This is happening because --create-no-volume is not present
+                fmt_cls_kwargs["splitted_format"] = True
+                fmt_cls_kwargs["_internal_create_no_volume"] = False
+                fmt = fmt_class(**fmt_cls_kwargs)
+
+                # Execute split format and execute it
+                fmt.main()
+
+            reset_local_config("save_as")
+
+        if all_languages:
+            # Print info to users
+            # Let the users know how many translated languages available
+            # in given manga
+            translated_langs = [i.name for i in manga.translated_languages]
             log.info(
-                "Not downloading cover manga, "
-                f"since manga '{manga.title}' doesn't have cover"
-            )
-        else:
-            fd = FileDownloader(
-                cover_url,
-                cover_path,
-                replace=replace,
+                f"Available translated languages = {comma_separated_text(translated_langs)}"
             )
-            fd.download()
-            fd.cleanup()
 
-        if config.create_manga_info:
-            create_manga_info(path, m, replace)
+            for translated_lang in manga.translated_languages:
+                log.info(f"Downloading {manga.title} in {translated_lang.name} language")
+
+                # Copy title and description manga
+                new_manga = Manga(data=manga._data)
+                new_manga._title = manga.title
+                new_manga._description = manga.description
 
-            if config.manga_info_only:
-                return manga
+                # Fetch all chapters
+                new_manga.fetch_chapters(
+                    translated_lang.value, all_chapters=True, stream=stream
+                )
 
-        m.tracker = get_tracker(save_as, path)
+                formatted_path = create_directory("", get_path(new_manga))
+                log.info(f'Download directory is set to "{formatted_path.resolve()}"')
+                download_manga(new_manga, formatted_path)
 
-        fmt_class = get_format(save_as)
+                if not config.create_no_volume and "-volume" in backup_fmt:
+                    # Fetch chapters again before downloading split format
+                    new_manga.fetch_chapters(
+                        translated_lang.value, all_chapters=True, stream=stream_splitted
+                    )
+                    download_manga(new_manga, formatted_path, splitted_format=True)
 
-        fmt_cls_kwargs = {
-            "path": path,
-            "manga": manga,
-            "replace": replace,
-            "kwargs_iter_chapter_img": kwargs_iter_chapter_images,
-        }
+                log.info(
+                    f"Download finished for manga {manga.title} "
+                    f"in {translated_lang.name} language"
+                )
 
-        if not splitted_format:
-            # Main format and execute it
-            fmt = fmt_class(**fmt_cls_kwargs)
-            fmt.main()
         else:
-            # Using chapters format as split format
-            # This is happening because --create-no-volume is not present
-            fmt_cls_kwargs["splitted_format"] = True
-            fmt_cls_kwargs["_internal_create_no_volume"] = False
-            fmt = fmt_class(**fmt_cls_kwargs)
-
-            # Execute split format and execute it
-            fmt.main()
-
-        config.save_as = backup_fmt
-
-    if all_languages:
-        # Print info to users
-        # Let the users know how many translated languages available
-        # in given manga
-        translated_langs = [i.name for i in manga.translated_languages]
-        log.info(
-            f"Available translated languages = {comma_separated_text(translated_langs)}"
-        )
-
-        for translated_lang in manga.translated_languages:
-            log.info(f"Downloading {manga.title} in {translated_lang.name} language")
-
-            # Copy title and description manga
-            new_manga = Manga(data=manga._data)
-            new_manga._title = manga.title
-            new_manga._description = manga.description
-
-            # Fetch all chapters
-            new_manga.fetch_chapters(translated_lang.value, all_chapters=True)
-
-            formatted_path = create_directory("", get_path(new_manga))
+            formatted_path = create_directory("", get_path(manga))
             log.info(f'Download directory is set to "{formatted_path.resolve()}"')
-            download_manga(new_manga, formatted_path)
+            download_manga(manga, formatted_path)
 
             if not config.create_no_volume and "-volume" in backup_fmt:
-                # Fetch chapters again before downloading split format
-                new_manga.fetch_chapters(translated_lang.value, all_chapters=True)
-                download_manga(new_manga, formatted_path, splitted_format=True)
+                manga.fetch_chapters(
+                    lang.value, all_chapters=True, stream=stream_splitted
+                )
+                download_manga(manga, formatted_path, splitted_format=True)
 
-            log.info(
-                f"Download finished for manga {manga.title} "
-                f"in {translated_lang.name} language"
-            )
-
-    else:
-        formatted_path = create_directory("", get_path(manga))
-        log.info(f'Download directory is set to "{formatted_path.resolve()}"')
-        download_manga(manga, formatted_path)
-
-        if not config.create_no_volume and "-volume" in backup_fmt:
-            manga.fetch_chapters(lang.value, all_chapters=True)
-            download_manga(manga, formatted_path, splitted_format=True)
-
-    log.info('Download finished for manga "%s"' % manga.title)
-    return manga
+        log.info('Download finished for manga "%s"' % manga.title)
+        return manga
 
 
 def download_chapter(
@@ -268,16 +309,45 @@ def download_list(
     """Download a list"""
     _list = MangaDexList(_id=list_id)
 
-    for manga in _list.iter_manga():
+    journal = get_journal()
+
+    def download_manga(manga_id):
+        if journal is not None:
+            if journal.is_completed("manga", manga_id):
+                log.info(
+                    f"Skipping manga {manga_id!r}, it's already completed in previous run"
+                )
+                return
+
+            journal.start("manga", manga_id)
+
         try:
             download(
-                manga.id,
+                manga_id,
                 replace,
                 groups=groups,
             )
         except ChapterNotFound as e:
             log.error(e)
 
+        if journal is not None:
+            journal.complete("manga", manga_id)
+
+    if config.manga_workers <= 1:
+        for manga in _list.iter_manga():
+            download_manga(manga.id)
+
+        return
+
+    with ThreadPoolExecutor(max_workers=config.manga_workers) as executor:
+        futures = [
+            executor.submit(download_manga, manga.id) for manga in _list.iter_manga()
+        ]
+
+    # Raise the first error (if any), after all manga are finished
+    for future in futures:
+        future.result()
+
 
 def download_legacy_manga(legacy_id, *args, **kwargs):
     """Download manga from old MangaDex url
@@ -295,14 +295,16 @@ class Manga:
             else:
                 return desc
 
-    def fetch_chapters(self, lang=None, chapter=None, all_chapters=False):
+    def fetch_chapters(self, lang=None, chapter=None, all_chapters=False, stream=False):
         """Fetch chapters of this manga.
 
         When initializing :class:`Manga`, :attr:`Manga.chapter` is filled with ``None``.
         Calling this function will fetch the chapters and fill :attr:`Manga.chapter` with
         :class:`MangaChapter`.
+
+        If ``stream`` is ``True``, chapters are fetched while they're being iterated.
         """
-        self._chapters = MangaChapter(self, lang, chapter, all_chapters)
+        self._chapters = MangaChapter(self, lang, chapter, all_chapters, stream)
 
 
 class MangaInfo:
@@ -41,7 +41,6 @@ from .errors import (
 from .auth import OAuth2, LegacyAuth
 from .utils import QueueWorker
 from .progress_bar import progress_bar_manager as pbm
-from requests_doh import DNSOverHTTPSAdapter, set_dns_provider
 from concurrent.futures import Future, TimeoutError
 
 
@@ -115,6 +114,11 @@ class requestsMangaDexSession(ModifiedSession):
         self.user = None
         self.delay = None
         self.config = config
+
+        # Rate limiter shared by all threads (--manga-workers),
+        # see `_wait_rate_limit()` and `_pause_requests()`
+        self._rate_limit_lock = threading.Lock()
+        self._next_request_time = 0.0
         user_agent = (
             f"mangadex-downloader {__version__} "
             "(https://github.com/mansuf/mangadex-downloader) "
@@ -253,7 +257,7 @@ class requestsMangaDexSession(ModifiedSession):
                 "We being rate limited, sleeping for %0.2f (attempt: %s)"
                 % (delay, attempt)
             )
-            time.sleep(delay)
+            self._pause_requests(delay)
             return None
 
         # Server error
@@ -274,6 +278,32 @@ class requestsMangaDexSession(ModifiedSession):
 
         return resp
 
+    def _wait_rate_limit(self):
+        """Wait until the next request is allowed to be sent
+
+        Requests from all threads are spaced by :attr:`delay` (--delay-requests),
+        so MangaDex receive the same requests rate no matter how many threads are used
+        """
+        while True:
+            with self._rate_limit_lock:
+                now = time.monotonic()
+                wait = self._next_request_time - now
+
+                if wait <= 0:
+                    self._next_request_time = now + (self.delay or 0)
+                    return
+
+            # Check it again after sleeping,
+            # other threads may be rate limited in the meantime
+            time.sleep(wait)
+
+    def _pause_requests(self, delay):
+        """Pause requests from all threads for ``delay`` seconds (rate limited)"""
+        with self._rate_limit_lock:
+            self._next_request_time = max(
+                self._next_request_time, time.monotonic() + delay
+            )
+
     # Ratelimit handler
     def request(self, method, url, *args, **kwargs):
         attempt = 1
@@ -287,24 +317,20 @@ class requestsMangaDexSession(ModifiedSession):
             iterator = itertools.count()
 
         for _ in iterator:
+            self._wait_rate_limit()
             resp = self._request(attempt, method, url, *args, **kwargs)
 
-            if self.delay:
-                delay = self.delay
-            elif resp is not None:
-                delay = None
-            elif attempt >= 5:
+            if resp is not None:
+                self.last_request_id = resp.headers.get("X-Request-ID", None)
+                return resp
+
+            if attempt >= 5:
                 # We don't wanna go further
                 delay = 2.5
             else:
                 delay = attempt * 0.5
 
-            if delay:
-                time.sleep(delay)
-
-            if resp is not None:
-                self.last_request_id = resp.headers.get("X-Request-ID", None)
-                return resp
+            time.sleep(delay)
 
             attempt += 1
             continue
@@ -570,6 +596,9 @@ class NetworkManager:
 
         See https://requests-doh.mansuf.link/en/stable/doh_providers.html for all available DoH providers
         """  # noqa: E501
+        # requests_doh is slow to import, only import it when DoH is used
+        from requests_doh import DNSOverHTTPSAdapter, set_dns_provider
+
         try:
             if self._doh is not None:
                 set_dns_provider(provider)
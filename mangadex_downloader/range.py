@@ -20,466 +20,363 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-# The rest of this codes is undocumented.
-# Because there is too much to write
-# especially with _parse_ptrn() and RangeChecker
-# FIXME: give this codes a documentation
+"""Range pattern for chapters and pages
 
-import re
-
-from .errors import MangaDexException
+Syntax: ``chapters[pages],chapters[pages],...``
 
-__all__ = (
-    'compile', 'purge_cache'
-)
-
-class InvalidPattern(MangaDexException):
-    pass
+Every chapter and page can be one of:
 
-def _err_invalid_ptrn(text, err_ptrn, msg):
-    copy_text = str(text)
-    # Append remaining pattern
-    ptrn = ""
-    for c in copy_text:
-        if c == ",":
-            break
-        ptrn += c
-    err_msg = f"Invalid pattern \"{err_ptrn + ptrn}\", "
-    err_msg += msg
-    raise InvalidPattern(err_msg)
-
-def _parse_ptrn(_text):
-    open_square_bracket = False
-    close_square_bracket = False
-    ptrn = ""
-    text = ""
-    base_char = None
-    list_ptrn = []
-    pages = []
+- ``N``     : exact number (or name, like "oneshot" or "extra")
+- ``A-B``   : from ``A`` to ``B``
+- ``A-``    : from ``A`` to the last
+- ``-B``    : from the first to ``B``
+- ``!N``    : ignore ``N``
 
-    def reset_state():
-        nonlocal open_square_bracket
-        nonlocal close_square_bracket
-        nonlocal ptrn
-        nonlocal base_char
-        nonlocal pages
+Patterns are compiled into sorted intervals, so checking chapters and pages
+is using binary search instead of checking every pattern one by one.
+"""
 
-        open_square_bracket = False
-        close_square_bracket = False
-        ptrn = ""
-        base_char = None
-        pages = []
+import re
+from bisect import bisect_left
 
-    def reset_ptrn():
-        nonlocal ptrn
+from .errors import MangaDexException
 
-        ptrn = ""
+__all__ = ("compile", "purge_cache")
 
-    def modify_text(char):
-        nonlocal text
+_inf = float("inf")
 
-        text = text[len(char):]
+_re_entry = re.compile(r"^(?P<base>[^\[\]]+)(?:\[(?P<pages>[^\[\]]*)\])?$")
 
-    def append_ptrn(chap, pages, char=None):
-        nonlocal list_ptrn
 
-        list_ptrn.append((chap, pages))
-        if char is not None:
-            modify_text(char)
-        reset_state()
+class InvalidPattern(MangaDexException):
+    pass
 
-    def check_next(text, char):
-        return char == ","
 
-    # Removing spaces in pattern
-    for char in _text:
-        if char == " ":
+def _split_ptrn(text):
+    """Split pattern by comma, except the ones inside square brackets"""
+    entries = []
+    entry = ""
+    in_bracket = False
+
+    for char in text:
+        if char == "[":
+            if in_bracket:
+                raise InvalidPattern(
+                    f'Invalid pattern "{entry + char}", '
+                    "Found duplicate opening square bracket"
+                )
+            elif not entry:
+                raise InvalidPattern(
+                    f'Invalid pattern "{char}", '
+                    "There is no characters before square bracket"
+                )
+
+            in_bracket = True
+        elif char == "]":
+            if not in_bracket:
+                raise InvalidPattern(
+                    f'Invalid pattern "{entry + char}", '
+                    "Found closing square bracket without opening square bracket"
+                )
+
+            in_bracket = False
+        elif char == "," and not in_bracket:
+            if entry:
+                entries.append(entry)
+            entry = ""
             continue
-        
-        text += char
-
-    while True:
-        if not text:
-
-            if pages:
-
-                if ptrn:
-                    pages.append(ptrn)
-                    reset_ptrn()
 
-                append_ptrn(base_char, pages, None)
-            elif (ptrn or base_char):
-                append_ptrn(base_char + ptrn, [])
+        entry += char
 
-            break
+    if in_bracket:
+        raise InvalidPattern(
+            f'Invalid pattern "{entry}", Square bracket is not closed'
+        )
 
-        # Text is reached end of characters
-        elif len(text) == 1 and text == ",":
-            break
+    if entry:
+        entries.append(entry)
 
-        for char in text:
-            if not open_square_bracket and not close_square_bracket:
+    return entries
 
-                if base_char is None:
 
-                    if char == '[':
-                        _err_invalid_ptrn(
-                            text,
-                            ptrn,
-                            "There is no characters before square bracket"
-                        )
+def _parse_ptrn(text):
+    """Parse pattern into list of ``(chapter, [pages])``"""
+    # Removing spaces in pattern
+    text = "".join(text.split())
 
-                    if check_next(text, char):
-                        continue
+    list_ptrn = []
+    for entry in _split_ptrn(text):
+        match = _re_entry.match(entry)
+        if match is None:
+            raise InvalidPattern(
+                f'Invalid pattern "{entry}", '
+                "Characters after closing square bracket are not allowed"
+            )
+
+        pages = match.group("pages")
+        if pages is None:
+            pages = []
+        else:
+            pages = [i for i in pages.split(",") if i]
 
-                    base_char = char
-                    modify_text(char)
-                    continue
+        list_ptrn.append((match.group("base"), pages))
 
-                elif base_char:
-                    if check_next(text, char):
+    return list_ptrn
 
-                        ptrn = base_char + ptrn
 
-                        if char != ',':
-                            ptrn += char
+def _parse_number(ptrn, num, msg="Non-numbers are not allowed to use range pattern"):
+    try:
+        return float(num)
+    except ValueError:
+        raise InvalidPattern(f'Invalid pattern "{ptrn}", {msg}') from None
 
-                        append_ptrn(ptrn, [], char)
 
-                    elif char == "[":
-                        open_square_bracket = True
-                        modify_text(char)
-                        continue
+def _parse_item(ptrn):
+    """Parse single chapter or page pattern
 
-                    else:
-                        ptrn += char
-                        modify_text(char)
-                        continue
+    Return tuple of ``(ignored, value)``, value is ``(start, end)``
+    for range pattern or lowered string for exact pattern
+    """
+    ignored = ptrn.startswith("!")
+    if ignored:
+        ptrn = ptrn[1:]  # Remove "!"
+
+    if not ptrn:
+        raise InvalidPattern('Invalid pattern "!", There is no characters after "!"')
+
+    # Negative numbers are not supported, so "-" is always a range
+    if "-" not in ptrn:
+        return ignored, ptrn.lower()
+
+    if ignored:
+        raise InvalidPattern(
+            f'Invalid pattern "!{ptrn}", '
+            "ignore (!) symbol are not supported when used with range pattern"
+        )
+
+    try:
+        start, end = ptrn.split("-")
+    except ValueError:
+        raise InvalidPattern(
+            f'Invalid pattern "{ptrn}", Found more than one "-" symbol'
+        ) from None
+
+    start = _parse_number(ptrn, start) if start else -_inf
+    end = _parse_number(ptrn, end) if end else _inf
+
+    if start > end:
+        raise InvalidPattern(
+            f'Invalid pattern "{ptrn}", start number is bigger than end number'
+        )
+
+    return False, (start, end)
+
+
+def _to_number(num):
+    if num is None:
+        return None
+
+    try:
+        return float(num)
+    except ValueError:
+        # Usually the chapter is non-floating numbers like "EXTRA"
+        return None
+
+
+def _merge_intervals(intervals):
+    """Merge overlapping ``(start, end)`` intervals"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
 
-            if open_square_bracket and not close_square_bracket:
-                
-                # Duplicate opening square bracket
-                if char == '[':
-                    _err_invalid_ptrn(
-                        text,
-                        ptrn,
-                        "Found duplicate opening square bracket"
-                    )
+    return merged
 
-                elif char == ']':
-                    close_square_bracket = True
-                    modify_text(char)
-                    continue
-
-                else:
-                    if check_next(text, char):
-                        pages.append(ptrn)
-                        reset_ptrn()
-                        modify_text(char)
-                        continue
-
-                    else:
-                        ptrn += char
-                        modify_text(char)
-                        continue
-            
-            if open_square_bracket and close_square_bracket:
-
-                if ptrn:
-                    pages.append(ptrn)
-                    reset_ptrn()
-
-                append_ptrn(base_char, pages, char)
-                continue
 
-    return list_ptrn
+class _IntervalIndex:
+    """Sorted closed intervals ``[start, end]`` with values
 
-class _Checker:
-    ignored_chapters = []
-    ignored_pages = {}
+    :meth:`get()` return values from all intervals that contain a number
+    with binary search
+    """
 
-    def __init__(self, ptrn):
-        self.ptrn = ptrn.lower()
-
-    @classmethod
-    def ignore_chapter(cls, num):
-        if num.startswith('!'):
-            num = num[1:] # Remove "!"
-
-        cls.ignored_chapters.append(num)
-    
-    @classmethod
-    def ignore_page(cls, chap, num):
-        if num.startswith('!'):
-            num = num[1:] # Remove "!"
-
-        try:
-            pages = cls.ignored_pages[chap]
-        except KeyError:
-            cls.ignored_pages[chap] = [num]
-        else:
-            pages.append(num)
+    def __init__(self, intervals):
+        points = set()
+        for start, end, _ in intervals:
+            points.add(start)
+            points.add(end)
 
-    def _get_keyword(self, chap):
-        keyword = ""
-        if chap.oneshot:
-            keyword = "oneshot"
-        else:
-            keyword = chap.chapter.lower() if chap.chapter is not None else ""
-        
-        return keyword
+        self.points = sorted(points)
 
-    def check(self, num):
-        raise NotImplementedError
+        # Values for the boundary points (self.points[i])
+        # and values between boundary points (self.points[i] < num < self.points[i + 1])
+        self.on_points = [[] for _ in self.points]
+        self.between_points = [[] for _ in self.points]
 
-    def check_page(self, chap, num):
-        num = str(num)
-        try:
-            ignored = num in self.ignored_pages[chap]
-        except KeyError:
-            ignored = False
+        for start, end, value in intervals:
+            first = bisect_left(self.points, start)
+            last = bisect_left(self.points, end)
 
-        if ignored:
-            return False
+            for i in range(first, last + 1):
+                self.on_points[i].append(value)
 
-        return self.check(num)
+            for i in range(first, last):
+                self.between_points[i].append(value)
 
-    def check_chapter(self, chap):
-        ignored = self._get_keyword(chap) in self.ignored_chapters
-        if ignored:
-            return False
+    def __bool__(self):
+        return bool(self.points)
 
-        # oneshot checking
-        if chap.oneshot and self.ptrn == 'oneshot':
-            return True
+    def get(self, num):
+        i = bisect_left(self.points, num)
+        if i < len(self.points) and self.points[i] == num:
+            return self.on_points[i]
+        elif i == 0:
+            return []
 
-        return self.check(chap.chapter)
+        return self.between_points[i - 1]
 
-class _RangeStartFrom(_Checker):
-    def __init__(self, ptrn):
-        super().__init__(ptrn)
 
-        start, end = ptrn.split('-')
-        self.start = float(start)
+class _PageChecker:
+    """Compiled pages pattern from single chapter"""
 
-    def check(self, num):
-        if num is None:
-            # We can't do anything if num is "null"
-            return True
+    def __init__(self, pages):
+        self.ignored = set()
+        self.exact = set()
+        intervals = []
 
-        try:
-            return float(num) >= self.start
-        except ValueError:
-            # Usually the chapter is non-floating numbers like "EXTRA"
-            # Just return True
-            return True
+        for ptrn in pages:
+            ignored, value = _parse_item(ptrn)
 
-class _RangeEndFrom(_Checker):
-    def __init__(self, ptrn):
-        super().__init__(ptrn)
-        
-        start, end = ptrn.split('-')
-        self.end = float(end)
-    
-    def check(self, num):
-        if num is None:
-            # We can't do anything if num is "null"
-            return True
+            if isinstance(value, tuple):
+                intervals.append(value)
+                continue
 
-        try:
-            return float(num) <= self.end
-        except ValueError:
-            # Usually the chapter is non-floating numbers like "EXTRA"
-            # Just return True
-            return True
+            page = _parse_number(ptrn, value, "Pages must be numbers")
+            if ignored:
+                self.ignored.add(page)
+            else:
+                self.exact.add(page)
 
-class _RangeStarttoEnd(_Checker):
-    def __init__(self, ptrn):
-        super().__init__(ptrn)
+        self.index = _IntervalIndex(
+            [(start, end, True) for start, end in _merge_intervals(intervals)]
+        )
 
-        start, end = ptrn.split('-')
-        self.start = float(start)
-        self.end = float(end)
+        # Pattern like "1[!5]", download all pages except page 5
+        self.all_pages = not self.exact and not self.index
 
     def check(self, num):
-        if num is None:
-            # We can't do anything if num is "null"
-            return True
-        
-        try:
-            num = float(num)
-        except ValueError:
-            # Usually the chapter is non-floating numbers like "EXTRA"
-            # Just return True
-            return True
+        num = float(num)
 
-        if not (num >= self.start):
-            return False
-        
-        if not (num <= self.end):
+        if num in self.ignored:
             return False
-        
-        return True
 
-class _Check(_Checker):
-    def __init__(self, ptrn):
-        super().__init__(ptrn)
-    
-    def check(self, num):
-        return num.lower() == self.ptrn
+        if self.all_pages or num in self.exact:
+            return True
 
-re_numbers = r''
+        return bool(self.index.get(num))
 
-# Start to end
-re_numbers += r'(?P<starttoend>.{1,}-.{1,})|'
 
-# End from
-re_numbers += r'(?P<endfrom>.{0,}-.{1,})|'
+class RangeChecker:
+    """A class to compile range pattern and check if chapters and pages are downloadable
 
-# Start from
-re_numbers += r'(?P<startfrom>.{1,}-.{0,})|'
+    client should not create this, instead use :meth:`compile()`
+    """
 
-# Ignored number
-re_numbers += r'(?P<ignorednum>!.{1,})|'
+    def __init__(self, ptrn):
+        self.patterns = _parse_ptrn(ptrn)
 
-# Check specified number
-re_numbers += r'(?P<checknum>.{1,})'
+        self.ignored_chapters = set()
 
-checkers = {
-    'starttoend': _RangeStarttoEnd,
-    'startfrom': _RangeStartFrom,
-    'endfrom': _RangeEndFrom,
-    'checknum': _Check,
-}
+        # Chapter name -> list of page checkers
+        # Page checker can be None, which mean all pages are downloaded
+        self.chapters = {}
 
-class _Pattern:
-    range_checkers = [i for i in checkers.values() if i != _Check]
+        intervals = []
+        intervals_all_pages = []
 
-    def __init__(self, string):
-        self.ignored = string.startswith('!')
+        for chapter, pages in self.patterns:
+            ignored, value = _parse_item(chapter)
 
-        if self.ignored:
-            string = string[1:] # Remove "!"
+            if ignored:
+                if pages:
+                    raise InvalidPattern(
+                        f'Invalid pattern "{chapter}", '
+                        "pages are not allowed for ignored chapter"
+                    )
 
-        self.string = string
+                self.ignored_chapters.add(value)
+                continue
 
-    def get_type(self):
-        match = re.match(re_numbers, self.string)
-        for _type, val in match.groupdict().items():
-            if val is not None:
-                break
+            page_checker = _PageChecker(pages) if pages else None
 
-        return _type
-    
-    def get_cls(self):
-        chk = checkers[self.get_type()]
+            if isinstance(value, tuple) and page_checker is None:
+                intervals_all_pages.append(value)
+            elif isinstance(value, tuple):
+                intervals.append((*value, page_checker))
+            else:
+                self.chapters.setdefault(value, []).append(page_checker)
 
-        for cls in self.range_checkers:
-            if chk == cls:
-                # Non-numbers are not allowed to use range pattern
-                start, end = self.string.split('-')
+        # Ranges without pages can be merged,
+        # so they don't overlap each other in the index
+        for start, end in _merge_intervals(intervals_all_pages):
+            intervals.append((start, end, None))
 
-                is_number = True
+        self.index = _IntervalIndex(intervals)
 
-                if start:
-                    try:
-                        float(start)
-                    except ValueError:
-                        is_number = False
+        # Pattern like "!5,!7", download all chapters except chapter 5 and 7
+        self.all_chapters = not self.chapters and not self.index
 
-                if end:
-                    try:
-                        float(end)
-                    except ValueError:
-                        is_number = False
+    @staticmethod
+    def _get_keyword(chap):
+        if chap.oneshot:
+            return "oneshot"
 
-                if not is_number:
-                    raise InvalidPattern(
-                        f"Invalid pattern \"{self.string}\", " \
-                         "Non-numbers are not allowed to use range pattern"
-                    )
-                elif self.ignored:
-                    raise InvalidPattern(
-                        f"Invalid pattern \"{self.string}\", " \
-                        "ignore (!) symbol are not supported when used with range pattern"
-                    )
+        return chap.chapter.lower() if chap.chapter is not None else ""
 
-        return chk
+    def _get_page_checkers(self, chap):
+        """Return list of page checkers from all matching patterns
 
-class RangeChecker:
-    """A class to compile range pattern and check if chapters is downloadable from range pattern
-    
-    client should not create this, instead use :meth:`compile()`
-    """
-    def __init__(self, ptrn):
-        self.patterns = _parse_ptrn(ptrn)
-        self.checkers = []
-        self._parse()
-
-    def _create_checker(self, num):
-        ptrn = _Pattern(num)
-        cls = ptrn.get_cls()
-        return ptrn, cls(num)
-    
-    def _create_checker_chapter(self, num):
-        ptrn, checker = self._create_checker(num)
-        if ptrn.ignored:
-            _Checker.ignore_chapter(num)
-        
-        return checker
-
-    def _create_checker_page(self, chap, num):
-        ptrn, checker = self._create_checker(num)
-        if ptrn.ignored:
-            _Checker.ignore_page(chap, num)
-        
-        return checker
-
-    def _parse(self):
-        for chapter, pages in self.patterns:
-            page_checkers = []
-            chapter_checker = self._create_checker_chapter(chapter)
+        Return ``None`` if the chapter is not matching any patterns
+        """
+        keyword = self._get_keyword(chap)
+        if keyword in self.ignored_chapters:
+            return None
+
+        if self.all_chapters:
+            return [None]
 
-            for page in pages:
-                page_checker = self._create_checker_page(chapter, page)
-                page_checkers.append(page_checker)
-            
-            self.checkers.append((chapter_checker, page_checkers))
-        
-    def check_page(self, chapter, num):
-        found = False
-        for chap, pages in self.checkers:
+        page_checkers = list(self.chapters.get(keyword, []))
 
-            if chap.ptrn == chapter.chapter:
+        # "oneshot" can have chapter number too
+        if chap.oneshot and chap.chapter is not None:
+            page_checkers.extend(self.chapters.get(chap.chapter.lower(), []))
 
-                if not pages:
-                    # If inside chapter pattern there is no pages
-                    # We must mark it as found = True
-                    # to avoid all pages getting ignored
+        num = _to_number(chap.chapter)
+        if num is not None:
+            page_checkers.extend(self.index.get(num))
 
-                    found = True
-                    break
+        return page_checkers or None
 
-                for page in pages:
+    def check_chapter(self, chap):
+        return self._get_page_checkers(chap) is not None
 
-                    found = page.check_page(chapter.chapter, num)
-                    if found:
-                        break
+    def check_page(self, chap, num):
+        page_checkers = self._get_page_checkers(chap)
+        if page_checkers is None:
+            return False
 
-        return found
+        for page_checker in page_checkers:
+            if page_checker is None or page_checker.check(num):
+                return True
 
-    def check_chapter(self, chapter):
-        found = False
+        return False
 
-        for chap, _ in self.checkers:
-            found = chap.check_chapter(chapter)
-            if found:
-                break
-        
-        return found
 
 _caches = {}
 
+
 def compile(pattern: str) -> RangeChecker:
     """Compile a range pattern into :class:`RangeChecker`"""
     # Check if cached
@@ -488,13 +385,13 @@ def compile(pattern: str) -> RangeChecker:
         return cls
 
     cls = RangeChecker(pattern)
-    
+
     # Store it to cache
     _caches[pattern] = cls
 
     return cls
 
+
 def purge_cache():
     """Purge :class:`RangeChecker` cache"""
     _caches.clear()
-
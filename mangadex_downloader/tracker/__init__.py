@@ -26,6 +26,7 @@ from pathlib import Path
 
 from .legacy import DownloadTrackerJSON, FileInfo, ChapterInfo, ImageInfo
 from .sqlite import DownloadTrackerSQLite
+from .global_index import get_download_index
 
 from ..utils import delete_file
 
@@ -140,8 +141,14 @@ def _migrate_legacy_tracker(fmt, path):
         # (raw, pdf, epub, etc)
         chapter_id = fi.id
 
-    chapter = Chapter(_id=chapter_id)
-    manga_id = chapter.manga_id
+    # Try global download index first before asking the API
+    index = get_download_index()
+    if index is not None:
+        manga_id = index.get_manga_id_from_chapter(chapter_id)
+
+    if manga_id is None:
+        chapter = Chapter(_id=chapter_id)
+        manga_id = chapter.manga_id
 
     args_migrate = (legacy_tracker, new_tracker, manga_id, path, progress_bar)
 
@@ -157,6 +164,14 @@ def _migrate_legacy_tracker(fmt, path):
 def get_tracker(fmt, path):
     legacy_path = DownloadTrackerJSON.get_tracker_path(fmt, path)
     if legacy_path.exists():
-        return _migrate_legacy_tracker(fmt, path)
+        tracker = _migrate_legacy_tracker(fmt, path)
+    else:
+        tracker = DownloadTrackerSQLite(fmt, path)
+
+    # Tracker was created before global download index is enabled
+    index = get_download_index()
+    if index is not None and not index.has_tracker(fmt, path) and not tracker.empty:
+        log.debug(f"Importing download tracker '{tracker.file}' to global index")
+        index.sync_tracker(tracker)
 
-    return DownloadTrackerSQLite(fmt, path)
+    return tracker
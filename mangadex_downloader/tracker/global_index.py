@@ -0,0 +1,412 @@
+# MIT License
+
+# Copyright (c) 2022-present Rahman Yusuf
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from datetime import datetime
+
+from ..config import config, env, base_path, init as init_config_dir
+
+log = logging.getLogger(__name__)
+
+_create_tables = """
+CREATE TABLE IF NOT EXISTS "files" (
+    "format"	TEXT NOT NULL,
+    "directory"	TEXT NOT NULL,
+    "name"	TEXT NOT NULL,
+    "manga_id"	TEXT,
+    "ch_id"	TEXT,
+    "volume"	INTEGER,
+    "hash"	TEXT,
+    "size"	INTEGER,
+    "last_download_time"	TEXT,
+    "completed"	INTEGER NOT NULL,
+    PRIMARY KEY("format", "directory", "name")
+);
+CREATE TABLE IF NOT EXISTS "chapters" (
+    "format"	TEXT NOT NULL,
+    "directory"	TEXT NOT NULL,
+    "fi_name"	TEXT NOT NULL,
+    "name"	TEXT NOT NULL,
+    "id"	TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS "images" (
+    "format"	TEXT NOT NULL,
+    "directory"	TEXT NOT NULL,
+    "fi_name"	TEXT NOT NULL,
+    "name"	TEXT NOT NULL,
+    "hash"	TEXT NOT NULL,
+    "chapter_id"	TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS "idx_files_manga_id" ON "files" ("manga_id");
+CREATE INDEX IF NOT EXISTS "idx_files_ch_id" ON "files" ("ch_id");
+CREATE INDEX IF NOT EXISTS "idx_files_hash" ON "files" ("hash");
+CREATE INDEX IF NOT EXISTS "idx_chapters_id" ON "chapters" ("id");
+CREATE INDEX IF NOT EXISTS "idx_chapters_file" ON "chapters" ("format", "directory", "fi_name");
+CREATE INDEX IF NOT EXISTS "idx_images_hash" ON "images" ("hash");
+CREATE INDEX IF NOT EXISTS "idx_images_file" ON "images" ("format", "directory", "fi_name");
+"""
+
+
+class DownloadIndexSQLite:
+    """A library-wide index of downloaded files, data is written to SQLite format
+
+    Every write to per-manga download tracker (`download.db`) is mirrored here,
+    so questions like "which manga is this downloaded chapter from?"
+    (see legacy tracker migration in `tracker/__init__.py`)
+    can be answered with single query instead of opening every `download.db`.
+
+    The index is put in config directory, named `download_index.db`.
+    Inside the database contain these tables:
+
+    - files
+    - chapters
+    - images
+
+    Every row is identified by format, manga directory and file name.
+    """
+
+    def __init__(self, path):
+        self.file = Path(path)
+        self._lock = threading.Lock()
+
+        self.db = sqlite3.connect(self.file, check_same_thread=False)
+        self._load()
+
+    def _load(self):
+        with self._lock:
+            self.db.executescript(_create_tables)
+            self.db.commit()
+
+    @staticmethod
+    def _get_key(fmt, directory):
+        return fmt, str(Path(directory).resolve())
+
+    def _delete_file_rows(self, cur, fmt, directory, name):
+        for table in ["images", "chapters"]:
+            cur.execute(
+                f"DELETE FROM {table} WHERE format = ? AND directory = ? AND fi_name = ?",
+                (fmt, directory, name),
+            )
+
+        cur.execute(
+            "DELETE FROM files WHERE format = ? AND directory = ? AND name = ?",
+            (fmt, directory, name),
+        )
+
+    # Mirror writes from `DownloadTrackerSQLite`
+
+    def add_file_info(
+        self, fmt, directory, name, manga_id=None, ch_id=None, hash=None, volume=None
+    ):
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            # Same behaviour as per-manga tracker,
+            # file info is always created from scratch
+            self._delete_file_rows(cur, fmt, directory, name)
+            cur.execute(
+                "INSERT INTO files ("
+                "'format', "
+                "'directory', "
+                "'name', "
+                "'manga_id', "
+                "'ch_id', "
+                "'volume', "
+                "'hash', "
+                "'size', "
+                "'last_download_time', "
+                "'completed') VALUES (?,?,?,?,?,?,?,?,?,?)",
+                (fmt, directory, name, manga_id, ch_id, volume, hash, None, None, 0),
+            )
+
+            self.db.commit()
+            cur.close()
+
+    def add_images_info(self, fmt, directory, images):
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            cur.executemany(
+                "DELETE FROM images WHERE "
+                "format = ? AND directory = ? AND fi_name = ? AND name = ?",
+                [(fmt, directory, im[3], im[0]) for im in images],
+            )
+            cur.executemany(
+                "INSERT INTO images ("
+                "'format', "
+                "'directory', "
+                "'fi_name', "
+                "'name', "
+                "'hash', "
+                "'chapter_id') VALUES (?,?,?,?,?,?)",
+                [(fmt, directory, im[3], im[0], im[1], im[2]) for im in images],
+            )
+
+            self.db.commit()
+            cur.close()
+
+    def remove_images_info(self, fmt, directory, fi_name):
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            cur.execute(
+                "DELETE FROM images WHERE format = ? AND directory = ? AND fi_name = ?",
+                (fmt, directory, fi_name),
+            )
+
+            self.db.commit()
+            cur.close()
+
+    def add_chapters_info(self, fmt, directory, chapters):
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            cur.executemany(
+                "DELETE FROM chapters WHERE "
+                "format = ? AND directory = ? AND fi_name = ? AND name = ?",
+                [(fmt, directory, ch[2], ch[0]) for ch in chapters],
+            )
+            cur.executemany(
+                "INSERT INTO chapters ("
+                "'format', "
+                "'directory', "
+                "'fi_name', "
+                "'name', "
+                "'id') VALUES (?,?,?,?,?)",
+                [(fmt, directory, ch[2], ch[0], ch[1]) for ch in chapters],
+            )
+
+            self.db.commit()
+            cur.close()
+
+    def toggle_complete(self, fmt, directory, fi_name, is_complete, dt_finished=None):
+        fmt, directory = self._get_key(fmt, directory)
+
+        # Folders (raw formats) doesn't have meaningful size
+        file_path = Path(directory, fi_name)
+        size = os.path.getsize(file_path) if file_path.is_file() else None
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            cur.execute(
+                "UPDATE files SET completed = ?, last_download_time = ?, size = ? "
+                "WHERE format = ? AND directory = ? AND name = ?",
+                (
+                    1 if is_complete else 0,
+                    dt_finished,
+                    size,
+                    fmt,
+                    directory,
+                    fi_name,
+                ),
+            )
+
+            self.db.commit()
+            cur.close()
+
+    def remove_file_info(self, fmt, directory, name):
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+            self._delete_file_rows(cur, fmt, directory, name)
+
+            self.db.commit()
+            cur.close()
+
+    def remove_tracker(self, fmt, directory):
+        """Remove all data from a per-manga download tracker"""
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+            for table in ["images", "chapters", "files"]:
+                cur.execute(
+                    f"DELETE FROM {table} WHERE format = ? AND directory = ?",
+                    (fmt, directory),
+                )
+
+            self.db.commit()
+            cur.close()
+
+    def has_tracker(self, fmt, directory) -> bool:
+        fmt, directory = self._get_key(fmt, directory)
+
+        with self._lock:
+            cur = self.db.cursor()
+            cur.execute(
+                "SELECT 1 FROM files WHERE format = ? AND directory = ? LIMIT 1",
+                (fmt, directory),
+            )
+            found = cur.fetchone() is not None
+            cur.close()
+
+        return found
+
+    def sync_tracker(self, tracker):
+        """Import all data from per-manga download tracker
+
+        Used for trackers that are created before the index was enabled.
+        All data is written in single transaction
+        """
+        fmt, directory = self._get_key(tracker.format, tracker.path)
+
+        files = []
+        chapters = []
+        images = []
+        for fi in tracker.get_all_files_info():
+            file_path = Path(directory, fi.name)
+            size = os.path.getsize(file_path) if file_path.is_file() else None
+
+            dt = fi.last_download_time
+            files.append(
+                (
+                    fmt,
+                    directory,
+                    fi.name,
+                    fi.manga_id,
+                    fi.ch_id,
+                    fi.volume,
+                    fi.hash,
+                    size,
+                    dt.isoformat() if isinstance(dt, datetime) else dt,
+                    1 if fi.completed else 0,
+                )
+            )
+            chapters.extend(
+                (fmt, directory, fi.name, ci.name, ci.id) for ci in fi.chapters or []
+            )
+            images.extend(
+                (fmt, directory, fi.name, ii.name, ii.hash, ii.chapter_id)
+                for ii in fi.images or []
+            )
+
+        with self._lock:
+            cur = self.db.cursor()
+            for table in ["images", "chapters", "files"]:
+                cur.execute(
+                    f"DELETE FROM {table} WHERE format = ? AND directory = ?",
+                    (fmt, directory),
+                )
+
+            cur.executemany(
+                "INSERT INTO files ("
+                "'format', "
+                "'directory', "
+                "'name', "
+                "'manga_id', "
+                "'ch_id', "
+                "'volume', "
+                "'hash', "
+                "'size', "
+                "'last_download_time', "
+                "'completed') VALUES (?,?,?,?,?,?,?,?,?,?)",
+                files,
+            )
+            cur.executemany(
+                "INSERT INTO chapters ("
+                "'format', "
+                "'directory', "
+                "'fi_name', "
+                "'name', "
+                "'id') VALUES (?,?,?,?,?)",
+                chapters,
+            )
+            cur.executemany(
+                "INSERT INTO images ("
+                "'format', "
+                "'directory', "
+                "'fi_name', "
+                "'name', "
+                "'hash', "
+                "'chapter_id') VALUES (?,?,?,?,?,?)",
+                images,
+            )
+
+            self.db.commit()
+            cur.close()
+
+    # Queries
+
+    def _fetchall(self, query, params=()):
+        with self._lock:
+            cur = self.db.cursor()
+            cur.execute(query, params)
+            result = cur.fetchall()
+            cur.close()
+
+        return result
+
+    def get_manga_id_from_chapter(self, chapter_id):
+        """Get manga id from downloaded chapter id, return ``None`` if not found"""
+        result = self._fetchall(
+            "SELECT files.manga_id FROM files WHERE ch_id = ? AND manga_id IS NOT NULL "
+            "UNION ALL "
+            "SELECT files.manga_id FROM chapters JOIN files ON "
+            "files.format = chapters.format "
+            "AND files.directory = chapters.directory "
+            "AND files.name = chapters.fi_name "
+            "WHERE chapters.id = ? AND files.manga_id IS NOT NULL LIMIT 1",
+            (chapter_id, chapter_id),
+        )
+
+        return result[0][0] if result else None
+
+    def close(self):
+        with self._lock:
+            self.db.close()
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_download_index():
+    """Get global download index
+
+    Return ``None`` if the index is disabled
+    (env ``MANGADEXDL_GLOBAL_INDEX`` is not set or ``--no-track`` is used)
+    """
+    global _index
+
+    if not env.global_index or config.no_track:
+        return None
+
+    with _index_lock:
+        if _index is None:
+            init_config_dir()
+            _index = DownloadIndexSQLite(base_path / "download_index.db")
+
+    return _index
@@ -0,0 +1,194 @@
+# MIT License
+
+# Copyright (c) 2022-present Rahman Yusuf
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sqlite3
+import logging
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from ..config import base_path, init as init_config_dir
+from ..utils import delete_file
+
+log = logging.getLogger(__name__)
+
+_create_tables = """
+CREATE TABLE IF NOT EXISTS "jobs" (
+    "kind"	TEXT NOT NULL,
+    "id"	TEXT NOT NULL,
+    "status"	TEXT NOT NULL,
+    "updated_at"	REAL NOT NULL,
+    PRIMARY KEY("kind", "id")
+);
+"""
+
+
+def get_journal_key(*items):
+    """Create journal key (SHA256 hash) from batch input and options that change the result"""
+    hasher = hashlib.sha256()
+    for item in items:
+        hasher.update(repr(item).encode("utf-8"))
+        hasher.update(b"\0")
+
+    return hasher.hexdigest()
+
+
+class BatchJournal:
+    """Persistent checkpoints for a batch download, data is written to SQLite format
+
+    Every job (url, manga or chapter) is recorded with one of these status:
+
+    - running
+    - completed
+    - failed
+
+    If the batch is interrupted, next run with the same input will skip
+    completed jobs without fetching them from MangaDex and without verifying
+    downloaded files. Use ``force_verify`` to ignore completed jobs.
+
+    The journal is put in config directory, under ``journals`` folder.
+    """
+
+    def __init__(self, path, force_verify=False):
+        self.file = Path(path)
+        self.force_verify = force_verify
+        self._lock = threading.Lock()
+
+        self.db = sqlite3.connect(
+            self.file, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self.db.executescript(_create_tables)
+
+    def _set_status(self, kind, id, status):
+        with self._lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO jobs (kind, id, status, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (kind, str(id), status, time.time()),
+            )
+
+    def is_completed(self, kind, id):
+        """Check if the job is completed in previous run
+
+        Always return ``False`` if ``force_verify`` is ``True``
+        """
+        if self.force_verify:
+            return False
+
+        with self._lock:
+            cur = self.db.execute(
+                "SELECT status FROM jobs WHERE kind = ? AND id = ?", (kind, str(id))
+            )
+            result = cur.fetchone()
+
+        return result is not None and result[0] == "completed"
+
+    def start(self, kind, id):
+        self._set_status(kind, id, "running")
+
+    def complete(self, kind, id):
+        self._set_status(kind, id, "completed")
+
+    def fail(self, kind, id):
+        self._set_status(kind, id, "failed")
+
+    def has_unfinished(self):
+        """Check if there is running (interrupted) or failed jobs"""
+        with self._lock:
+            cur = self.db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status != 'completed'"
+            )
+            return cur.fetchone()[0] > 0
+
+    def close(self, delete=False):
+        with self._lock:
+            self.db.close()
+
+        if delete:
+            delete_file(self.file)
+
+
+_journal = None
+_journal_lock = threading.Lock()
+
+
+def open_journal(key, force_verify=False):
+    """Open journal for batch input ``key`` (see :func:`get_journal_key`)
+
+    Journal from previous (interrupted) run is reused if exists
+    """
+    global _journal
+
+    with _journal_lock:
+        if _journal is not None:
+            _journal.close()
+
+        init_config_dir()
+        path = base_path / "journals"
+        path.mkdir(parents=True, exist_ok=True)
+
+        file = path / f"{key}.db"
+        if file.exists():
+            if force_verify:
+                log.info("Found job journal from previous run, re-verifying all jobs")
+            else:
+                log.info(
+                    "Found job journal from previous run, "
+                    "completed jobs will be skipped"
+                )
+
+        _journal = BatchJournal(file, force_verify)
+
+    return _journal
+
+
+def get_journal():
+    """Get opened journal
+
+    Return ``None`` if there is no journal opened
+    """
+    return _journal
+
+
+def close_journal():
+    """Close opened journal
+
+    The journal is deleted if all jobs are completed,
+    so the next run will check for new chapters
+    """
+    global _journal
+
+    with _journal_lock:
+        if _journal is None:
+            return
+
+        finished = not _journal.has_unfinished()
+        _journal.close(delete=finished)
+
+        if not finished:
+            log.info(
+                f"Some jobs are not finished, job journal is kept in '{_journal.file}'"
+            )
+
+        _journal = None
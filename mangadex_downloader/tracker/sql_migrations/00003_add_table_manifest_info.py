@@ -0,0 +1,29 @@
+import logging
+from pathlib import Path
+from .base import SQLMigration
+
+log = logging.getLogger(__name__)
+
+
+class Migration(SQLMigration):
+    file = __file__
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # File manifests (see `verify_file()` in `format/base.py`)
+        # are stored in their own table, they're not SHA256 hashes
+        self.migrate_tables = [f"manifest_info_{self.get_format()}"]
+
+    def check_if_migrate_is_possible(self) -> bool:
+        return bool(self.get_missing_tables())
+
+    def migrate(self):
+        sql_file = Path(__file__).parent.parent.resolve() / "sql_files"
+        cmd_script = (sql_file / "create_manifest_info.sql").read_text()
+
+        cursor = self.db.cursor()
+        cursor.execute(cmd_script.format_map({"format": self.get_format()}))
+
+        self.db.commit()
+        cursor.close()
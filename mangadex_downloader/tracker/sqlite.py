@@ -28,6 +28,7 @@ from typing import Union, List
 from datetime import datetime
 
 from .info_data.sqlite import FileInfo
+from .global_index import get_download_index
 from .sql_migrations import migrate as sql_migrate, check_if_there_is_migrations
 from ..config import config
 
@@ -65,6 +66,9 @@ class DownloadTrackerSQLite:
 
         self.db = None
 
+        # Library-wide index (if enabled), all writes are mirrored to it
+        self._index = get_download_index()
+
         kwargs = {"check_same_thread": False, "database": self.file}
         self._open_connection(**kwargs)
 
@@ -75,6 +79,7 @@ class DownloadTrackerSQLite:
         self._fi_name = f"file_info_{fmt_table}"
         self._img_name = f"img_info_{fmt_table}"
         self._ch_name = f"ch_info_{fmt_table}"
+        self._manifest_name = f"manifest_info_{fmt_table}"
 
         # Automatically entering write mode if there is migrations available
         if not config.no_track and check_if_there_is_migrations(self.db):
@@ -136,6 +141,9 @@ class DownloadTrackerSQLite:
 
             cur.close()
 
+        if self._index is not None:
+            self._index.remove_tracker(self.format, self.path)
+
         self._load()
 
     @property
@@ -253,10 +261,16 @@ class DownloadTrackerSQLite:
             cur = self.db.cursor()
 
             cur.execute(f"DELETE FROM '{self._fi_name}' WHERE name = ?", (name,))
+            cur.execute(
+                f"DELETE FROM '{self._manifest_name}' WHERE fi_name = ?", (name,)
+            )
 
             self.db.commit()
             cur.close()
 
+        if self._index is not None:
+            self._index.remove_file_info(self.format, self.path, name)
+
     def remove_duplicate_chapter_info(self, chapters):
         if config.no_track:
             return
@@ -287,6 +301,21 @@ class DownloadTrackerSQLite:
             self.db.commit()
             cur.close()
 
+    def remove_images_info(self, fi_name):
+        if config.no_track:
+            return
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            cur.execute(f"DELETE FROM '{self._img_name}' WHERE fi_name = ?", (fi_name,))
+
+            self.db.commit()
+            cur.close()
+
+        if self._index is not None:
+            self._index.remove_images_info(self.format, self.path, fi_name)
+
     def add_file_info(self, name, manga_id=None, ch_id=None, hash=None, volume=None):
         if config.no_track:
             return
@@ -310,6 +339,11 @@ class DownloadTrackerSQLite:
             self.db.commit()
             cur.close()
 
+        if self._index is not None:
+            self._index.add_file_info(
+                self.format, self.path, name, manga_id, ch_id, hash, volume
+            )
+
     def add_images_info(self, images):
         if config.no_track:
             return
@@ -332,6 +366,9 @@ class DownloadTrackerSQLite:
             self.db.commit()
         cur.close()
 
+        if self._index is not None:
+            self._index.add_images_info(self.format, self.path, images)
+
     def add_chapters_info(self, chapters):
         if config.no_track:
             return
@@ -353,6 +390,56 @@ class DownloadTrackerSQLite:
             self.db.commit()
             cur.close()
 
+        if self._index is not None:
+            self._index.add_chapters_info(self.format, self.path, chapters)
+
+    def add_manifest_info(self, fi_name, manifest):
+        """Replace file manifest ``{entry_name: value}`` of a file
+
+        File manifests are not mirrored to global download index,
+        the values are not SHA256 hashes
+        """
+        if config.no_track:
+            return
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            cur.execute(
+                f"DELETE FROM '{self._manifest_name}' WHERE fi_name = ?", (fi_name,)
+            )
+            cur.executemany(
+                f"INSERT INTO '{self._manifest_name}' ("
+                "'name', "
+                "'value', "
+                "'fi_name') VALUES (?,?,?) ",
+                [(name, value, fi_name) for name, value in manifest.items()],
+            )
+
+            self.db.commit()
+            cur.close()
+
+    def get_manifest_info(self, fi_name) -> dict:
+        """Get file manifest of a file, return empty dict if it's not recorded"""
+        if config.no_track:
+            return {}
+
+        with self._lock:
+            cur = self.db.cursor()
+
+            try:
+                cur.execute(
+                    f"SELECT name, value FROM '{self._manifest_name}' WHERE fi_name = ?",
+                    (fi_name,),
+                )
+            except sqlite3.OperationalError:
+                # No such table
+                return {}
+            else:
+                return dict(cur.fetchall())
+            finally:
+                cur.close()
+
     def toggle_complete(self, fi_name, is_complete):
         if config.no_track:
             return
@@ -377,6 +464,11 @@ class DownloadTrackerSQLite:
             self.db.commit()
             cur.close()
 
+        if self._index is not None:
+            self._index.toggle_complete(
+                self.format, self.path, fi_name, is_complete, dt_finished
+            )
+
     def _load(self):
         if config.no_track:
             return
@@ -20,8 +20,18 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import threading
+import weakref
+
 from .fetcher import get_user
 
+# Chapters uploaded by the same user are sharing one User object,
+# see `User.from_data()` and `User.from_id()`
+# Objects are dropped when no chapters are using them anymore,
+# so this doesn't grow forever in long running process (--server)
+_users = weakref.WeakValueDictionary()
+_users_lock = threading.Lock()
+
 
 class User:
     def __init__(self, user_id=None, data=None):
@@ -35,3 +45,28 @@ class User:
 
         self.name = attr["username"]
         self.roles = attr["roles"]
+
+    @classmethod
+    def from_data(cls, data):
+        """Get interned :class:`User` from API data"""
+        with _users_lock:
+            user = _users.get(data["id"])
+            if user is None:
+                user = cls(data=data)
+                _users[user.id] = user
+
+        return user
+
+    @classmethod
+    def from_id(cls, user_id):
+        """Get interned :class:`User`, the user is fetched if it's not exist yet"""
+        with _users_lock:
+            user = _users.get(user_id)
+
+        if user is None:
+            user = cls(user_id)
+
+            with _users_lock:
+                user = _users.setdefault(user.id, user)
+
+        return user
@@ -0,0 +1,25 @@
+"""Optional dependencies must not be imported on startup
+
+They're slow to import (see ``python -X importtime -m mangadex_downloader``),
+format modules and optional dependencies are imported when they're used
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+_lazy_modules = ["PIL", "py7zr", "bs4", "requests_doh", "jwt"]
+
+
+@pytest.mark.parametrize("module", ["mangadex_downloader", "mangadex_downloader.cli"])
+def test_optional_dependencies_are_not_imported(module):
+    code = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {_lazy_modules!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == ""
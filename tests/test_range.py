@@ -0,0 +1,201 @@
+"""Tests for range pattern (``mangadex_downloader/range.py``)
+
+Compiled patterns are checked against a naive implementation
+that checks every pattern one by one
+"""
+
+import random
+from collections import namedtuple
+
+import pytest
+
+from mangadex_downloader import range as range_mod
+from mangadex_downloader.range import InvalidPattern, RangeChecker
+
+Chapter = namedtuple("Chapter", "chapter oneshot", defaults=(False,))
+
+
+def _naive_match_item(item, value):
+    """Check single chapter or page pattern (without "!")"""
+    if "-" not in item:
+        return value is not None and item.lower() == value.lower()
+
+    start, end = item.split("-")
+    try:
+        num = float(value)
+    except (TypeError, ValueError):
+        return False
+
+    start = float(start) if start else float("-inf")
+    end = float(end) if end else float("inf")
+    return start <= num <= end
+
+
+def _naive_check_pages(pages, page):
+    if not pages:
+        return True
+
+    ignored = [p[1:] for p in pages if p.startswith("!")]
+    included = [p for p in pages if not p.startswith("!")]
+
+    if any(float(p) == page for p in ignored):
+        return False
+
+    if not included:
+        return True
+
+    return any(_naive_match_item(p, str(page)) for p in included)
+
+
+def _naive_get_pages(entries, chap):
+    """Return list of pages patterns from all patterns that matching the chapter
+
+    Return ``None`` if the chapter is not matching any patterns
+    """
+    keyword = "oneshot" if chap.oneshot else (chap.chapter or "").lower()
+
+    ignored = [c[1:].lower() for c, _ in entries if c.startswith("!")]
+    if keyword in ignored:
+        return None
+
+    included = [(c, p) for c, p in entries if not c.startswith("!")]
+    if not included:
+        return [[]]
+
+    result = []
+    for chapter, pages in included:
+        if "-" not in chapter:
+            matched = chapter.lower() == keyword or (
+                chap.oneshot
+                and chap.chapter is not None
+                and chapter.lower() == chap.chapter.lower()
+            )
+        else:
+            matched = _naive_match_item(chapter, chap.chapter)
+
+        if matched:
+            result.append(pages)
+
+    return result or None
+
+
+def _random_item(rng, allow_ignored=True):
+    kind = rng.random()
+    start = rng.randint(0, 30)
+    end = rng.randint(start, 40)
+
+    if kind < 0.3:
+        return f"{start}-{end}"
+    elif kind < 0.4:
+        return f"{start}-"
+    elif kind < 0.5:
+        return f"-{end}"
+    elif kind < 0.75 or not allow_ignored:
+        return str(start)
+    else:
+        return f"!{start}"
+
+
+def _random_entries(rng):
+    entries = []
+    for _ in range(rng.randint(1, 6)):
+        chapter = _random_item(rng)
+        if rng.random() < 0.05:
+            chapter = rng.choice(["oneshot", "extra", "!extra"])
+
+        pages = []
+        if not chapter.startswith("!") and rng.random() < 0.3:
+            pages = [_random_item(rng) for _ in range(rng.randint(1, 3))]
+
+        entries.append((chapter, pages))
+
+    return entries
+
+
+def _format_entries(entries):
+    return ",".join(
+        f"{chapter}[{','.join(pages)}]" if pages else chapter
+        for chapter, pages in entries
+    )
+
+
+_chapters = (
+    [Chapter(str(i)) for i in range(-2, 45)]
+    + [Chapter(f"{i}.5") for i in range(0, 40, 7)]
+    + [Chapter("extra"), Chapter("EXTRA"), Chapter(None)]
+    + [Chapter(None, True), Chapter("3", True)]
+)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_naive_implementation(seed):
+    rng = random.Random(seed)
+
+    for _ in range(100):
+        entries = _random_entries(rng)
+        checker = RangeChecker(_format_entries(entries))
+
+        for chap in _chapters:
+            pages_ptrns = _naive_get_pages(entries, chap)
+            assert checker.check_chapter(chap) == (pages_ptrns is not None), (
+                entries,
+                chap,
+            )
+
+            for page in range(1, 45):
+                expected = pages_ptrns is not None and any(
+                    _naive_check_pages(pages, page) for pages in pages_ptrns
+                )
+                assert checker.check_page(chap, page) == expected, (entries, chap, page)
+
+
+@pytest.mark.parametrize(
+    "pattern, chapters",
+    [
+        (
+            "1-9,!7,!5,20-30,!25",
+            [1, 2, 3, 4, 6, 8, 9] + [i for i in range(20, 31) if i != 25],
+        ),
+        ("!5,!7", [i for i in range(0, 40) if i not in (5, 7)]),
+        ("10-", list(range(10, 40))),
+        ("-5", list(range(0, 6))),
+    ],
+)
+def test_chapters(pattern, chapters):
+    checker = range_mod.compile(pattern)
+
+    assert [i for i in range(0, 40) if checker.check_chapter(Chapter(str(i)))] == chapters
+
+
+def test_pages():
+    checker = range_mod.compile("1[2-20],2[3-15],5[3-9,!5,12]")
+
+    assert [p for p in range(1, 25) if checker.check_page(Chapter("5"), p)] == [
+        3,
+        4,
+        6,
+        7,
+        8,
+        9,
+        12,
+    ]
+    assert [p for p in range(1, 25) if checker.check_page(Chapter("1"), p)] == list(
+        range(2, 21)
+    )
+    assert not checker.check_chapter(Chapter("3"))
+
+
+def test_named_chapters():
+    assert range_mod.compile("oneshot").check_chapter(Chapter("1", True))
+    assert range_mod.compile("extra").check_chapter(Chapter("EXTRA"))
+    assert not range_mod.compile("1-5").check_chapter(Chapter("extra"))
+    assert range_mod.compile("-5").check_chapter(Chapter("2.5"))
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["!3-30", "[1]", "1[[2]]", "1[2", "a-b", "1-2-3", "5-1", "1[x]", "!5[2]", "1]"],
+)
+def test_invalid_patterns(pattern):
+    with pytest.raises(InvalidPattern):
+        RangeChecker(pattern)